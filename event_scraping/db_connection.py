@@ -2,19 +2,26 @@
 Database connection module for WordPress MySQL database.
 Reads configuration from Scrapy settings.
 """
+import re
+import sys
+
 import mysql.connector
 from mysql.connector import Error
 
+# The "Find out more" link insert_event appends to every post body, used to backfill
+# _event_url for legacy posts. Descriptions can contain other links, so only this anchor counts
+_EVENT_LINK_RE = re.compile(r'<a href="(https?://[^"<>]+)">Find out more</a>', re.IGNORECASE)
 
-def get_connection(settings=None):
+
+def get_db_config(settings=None):
     """
-    Create and return a MySQL database connection.
+    Build the mysql.connector keyword arguments from Scrapy settings.
     
     Args:
         settings: Scrapy settings object. If None, tries to get from scrapy.utils.project
         
     Returns:
-        mysql.connector.connection.MySQLConnection or None
+        dict: host, database, user, password and port
     """
     # Try to get settings if not provided
     if settings is None:
@@ -57,6 +64,20 @@ def get_connection(settings=None):
     #     'password': settings.get('DB_PASSWORD', 'root'),
     #     'port': settings.get('DB_PORT', 10017)
     # }
+    return db_config
+
+
+def get_connection(settings=None):
+    """
+    Create and return a MySQL database connection.
+    
+    Args:
+        settings: Scrapy settings object. If None, tries to get from scrapy.utils.project
+        
+    Returns:
+        mysql.connector.connection.MySQLConnection or None
+    """
+    db_config = get_db_config(settings)
     
     try:
         connection = mysql.connector.connect(**db_config)
@@ -97,13 +118,235 @@ def test_connection(settings=None):
     return False
 
 
+def ensure_index(connection, table, index_name, columns):
+    """Create an index unless one with that name already exists on the table.
+    
+    Args:
+        connection: Open MySQL connection
+        table (str): Table name
+        index_name (str): Index name to look for / create
+        columns (str): Column list for CREATE INDEX, e.g. "meta_key, meta_value(191)"
+        
+    Returns:
+        bool: True if the index was created, False if it already existed
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            """
+            SELECT 1 FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+            LIMIT 1
+            """,
+            (table, index_name)
+        )
+        if cursor.fetchone():
+            return False
+        cursor.execute(f"CREATE INDEX {index_name} ON {table} ({columns})")
+        print(f"Created index {index_name} on {table}")
+        return True
+    finally:
+        cursor.close()
+
+
+def ensure_event_url_index(connection, table_prefix='wp_'):
+    """Create the (meta_key, meta_value) index used by the _event_url duplicate lookup.
+    
+    Without it the lookup scans the whole postmeta table. meta_value is LONGTEXT, so the
+    index covers a 191-character prefix (the utf8mb4 limit for older InnoDB row formats).
+    
+    Args:
+        connection: Open MySQL connection
+        table_prefix: WordPress table prefix ('wp_' or 'zuzl_')
+        
+    Returns:
+        bool: True if the index was created, False if it already existed
+    """
+    return ensure_index(connection, f"{table_prefix}postmeta", 'idx_event_url', 'meta_key, meta_value(191)')
+
+
+def ensure_post_title_index(connection, table_prefix='wp_'):
+    """Create the (post_type, post_status, post_title) index used by the title + date duplicate lookup.
+    
+    Args:
+        connection: Open MySQL connection
+        table_prefix: WordPress table prefix ('wp_' or 'zuzl_')
+        
+    Returns:
+        bool: True if the index was created, False if it already existed
+    """
+    return ensure_index(
+        connection, f"{table_prefix}posts", 'idx_type_status_title', 'post_type, post_status, post_title(191)'
+    )
+
+
+def backfill_event_urls(connection, table_prefix='wp_'):
+    """One-time backfill of _event_url postmeta for events that only have the URL in post_content.
+    
+    Older imports did not write _event_url, so the duplicate check used to fall back to a
+    post_content LIKE '%url%' scan. Copying the URL into postmeta lets that scan go away.
+    The URL is taken from the post's "Find out more" link (the last one, which is the one
+    insert_event writes); posts without that link are left alone.
+    
+    Args:
+        connection: Open MySQL connection
+        table_prefix: WordPress table prefix ('wp_' or 'zuzl_')
+        
+    Returns:
+        int: Number of _event_url rows inserted
+    """
+    posts = f"{table_prefix}posts"
+    postmeta = f"{table_prefix}postmeta"
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            f"""
+            SELECT p.ID, p.post_content FROM {posts} p
+            LEFT JOIN {postmeta} pm ON pm.post_id = p.ID AND pm.meta_key = '_event_url'
+            WHERE p.post_type = 'oum-location'
+            AND pm.meta_id IS NULL
+            """
+        )
+        rows = []
+        skipped = 0
+        for post_id, content in cursor.fetchall():
+            # The event link is the last one insert_event writes; a post without it is
+            # skipped rather than guessing from other links in the description
+            links = _EVENT_LINK_RE.findall(content or '')
+            if links:
+                rows.append((post_id, '_event_url', links[-1]))
+            else:
+                skipped += 1
+        if rows:
+            cursor.executemany(
+                f"INSERT INTO {postmeta} (post_id, meta_key, meta_value) VALUES (%s, %s, %s)",
+                rows
+            )
+            connection.commit()
+        print(f"Backfilled _event_url for {len(rows)} posts in {posts}")
+        if skipped:
+            print(f"⚠️  Skipped {skipped} posts in {posts} without a 'Find out more' event link")
+        return len(rows)
+    finally:
+        cursor.close()
+
+
+def ensure_event_url_dedupe_table(connection, table_prefix='wp_'):
+    """Create the event_url_dedupe side table and fill it from published event posts.
+    
+    The table has one row per event URL, keyed by the SHA-1 of the full URL (so long
+    URLs sharing a prefix cannot collide), so claiming a URL with INSERT IGNORE is
+    both the duplicate check and the reservation, in one statement. postmeta itself
+    cannot carry a unique index on _event_url rows only. Only published oum-location
+    posts are backfilled, matching what the duplicate check treats as existing.
+    
+    A table in the earlier layout (191-character URL prefix as key, filled from every
+    post) is dropped and rebuilt; it only holds data derived from postmeta.
+    
+    Args:
+        connection: Open MySQL connection
+        table_prefix: WordPress table prefix ('wp_' or 'zuzl_')
+        
+    Returns:
+        bool: True if the table was created (and backfilled), False if it already existed
+    """
+    dedupe = f"{table_prefix}event_url_dedupe"
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            """
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = DATABASE() AND table_name = %s
+            """,
+            (dedupe,)
+        )
+        columns = {row[0].lower() for row in cursor.fetchall()}
+        if 'url_hash' in columns:
+            return False
+        if columns:
+            cursor.execute(f"DROP TABLE {dedupe}")
+        cursor.execute(
+            f"""
+            CREATE TABLE {dedupe} (
+                url_hash BINARY(20) NOT NULL PRIMARY KEY,
+                post_id BIGINT UNSIGNED NULL
+            )
+            """
+        )
+        cursor.execute(
+            f"""
+            INSERT IGNORE INTO {dedupe} (url_hash, post_id)
+            SELECT UNHEX(SHA1(pm.meta_value)), pm.post_id FROM {table_prefix}postmeta pm
+            JOIN {table_prefix}posts p ON pm.post_id = p.ID
+            WHERE pm.meta_key = '_event_url' AND pm.meta_value <> ''
+            AND p.post_type = 'oum-location'
+            AND p.post_status = 'publish'
+            """
+        )
+        connection.commit()
+        print(f"Created {dedupe} with {cursor.rowcount} existing event URLs")
+        return True
+    finally:
+        cursor.close()
+
+
+def prune_event_url_dedupe(connection, table_prefix='wp_'):
+    """Release URL claims whose post is no longer a published event.
+    
+    A post that was trashed, drafted or deleted after it was inserted would otherwise
+    keep its URL claimed for good, while the duplicate check (published posts only)
+    lets the event through again. Claims without a post ID belong to an insert still
+    in progress and are left alone.
+    
+    Args:
+        connection: Open MySQL connection
+        table_prefix: WordPress table prefix ('wp_' or 'zuzl_')
+        
+    Returns:
+        int: Number of claims released
+    """
+    dedupe = f"{table_prefix}event_url_dedupe"
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            f"""
+            DELETE d FROM {dedupe} d
+            LEFT JOIN {table_prefix}posts p ON p.ID = d.post_id
+            AND p.post_type = 'oum-location'
+            AND p.post_status = 'publish'
+            WHERE d.post_id IS NOT NULL AND p.ID IS NULL
+            """
+        )
+        released = cursor.rowcount
+        connection.commit()
+        return released
+    finally:
+        cursor.close()
+
+
 if __name__ == "__main__":
     # Try to get settings for testing
     try:
         from scrapy.utils.project import get_project_settings
         settings = get_project_settings()
-        test_connection(settings)
     except Exception:
-        # If settings not available, test with defaults
-        test_connection()
+        # If settings not available, use defaults
+        settings = None
+    
+    if '--migrate' in sys.argv:
+        # python db_connection.py --migrate [table_prefix]
+        # Adds the duplicate-check indexes, backfills legacy posts and builds the URL dedupe table
+        args = [arg for arg in sys.argv[1:] if arg != '--migrate']
+        prefix = args[0] if args else 'wp_'
+        connection = get_connection(settings)
+        if connection:
+            try:
+                ensure_event_url_index(connection, prefix)
+                ensure_post_title_index(connection, prefix)
+                backfill_event_urls(connection, prefix)
+                ensure_event_url_dedupe_table(connection, prefix)
+            finally:
+                connection.close()
+    else:
+        test_connection(settings)
 
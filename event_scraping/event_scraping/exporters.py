@@ -0,0 +1,46 @@
+# Custom feed exporters
+#
+# Registered through the FEED_EXPORTERS setting
+# See: https://docs.scrapy.org/en/latest/topics/feed-exports.html#feed-exporters
+
+from scrapy.exporters import JsonLinesItemExporter
+from scrapy.utils.serialize import ScrapyJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonLinesItemExporter(JsonLinesItemExporter):
+    """JSON Lines exporter that serializes items with orjson when it is installed.
+
+    orjson writes UTF-8 bytes directly, so it is only used for UTF-8 feeds
+    without extra json options (indent, sort_keys, ...). Anything else, or a
+    missing orjson, falls back to the stock JsonLinesItemExporter behaviour.
+    Values orjson cannot handle itself (datetimes, Decimals, nested items)
+    go through ScrapyJSONEncoder so the output matches the stock exporter.
+    """
+
+    def __init__(self, file, **kwargs):
+        super().__init__(file, **kwargs)
+        encoding = (self.encoding or '').lower().replace('_', '-')
+        self._use_orjson = (
+            orjson is not None
+            and encoding in ('utf-8', 'utf8')
+            and set(self._kwargs) == {'ensure_ascii'}
+            and not self._kwargs['ensure_ascii']
+        )
+        if self._use_orjson:
+            self._orjson_default = ScrapyJSONEncoder().default
+            self._orjson_options = (
+                orjson.OPT_APPEND_NEWLINE
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_NON_STR_KEYS
+            )
+
+    def export_item(self, item):
+        if not self._use_orjson:
+            return super().export_item(item)
+        itemdict = dict(self.get_serialized_fields(item))
+        self.file.write(orjson.dumps(itemdict, default=self._orjson_default, option=self._orjson_options))
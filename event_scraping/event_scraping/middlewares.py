@@ -3,11 +3,16 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
+import random
+
 from scrapy import signals
+from scrapy.exceptions import NotConfigured
 
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
 
+from event_scraping.http_profile import BROWSER_USER_AGENTS
+
 
 class EventScrapingSpiderMiddleware:
     # Not all methods need to be defined. If a method is not defined,
@@ -98,3 +103,26 @@ class EventScrapingDownloaderMiddleware:
 
     def spider_opened(self, spider):
         spider.logger.info("Spider opened: %s" % spider.name)
+
+
+class RotateUserAgentMiddleware:
+    """Send each request with a user agent picked at random from a list.
+
+    Enabled with the ROTATE_USER_AGENT setting. The list comes from
+    USER_AGENT_LIST, or http_profile.BROWSER_USER_AGENTS when that is empty.
+    Requests that set their own User-Agent header keep it. Runs before Scrapy's
+    UserAgentMiddleware, which then leaves the header alone.
+    """
+
+    def __init__(self, user_agents):
+        self.user_agents = user_agents
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool("ROTATE_USER_AGENT"):
+            raise NotConfigured
+        return cls(crawler.settings.getlist("USER_AGENT_LIST") or BROWSER_USER_AGENTS)
+
+    def process_request(self, request, spider):
+        request.headers.setdefault(b"User-Agent", random.choice(self.user_agents))
+        return None
@@ -6,8 +6,41 @@
 
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
+from scrapy.utils.defer import maybe_deferred_to_future
 
 
 class EventScrapingPipeline:
     def process_item(self, item, spider):
         return item
+
+
+class GeocodePipeline:
+    """Fill in missing coordinates by geocoding the item address.
+
+    Only runs for spiders that set `geocode_in_pipeline = True`; they leave
+    geocoding out of their parse callbacks and let this pipeline do it.
+    The lookup goes through the spider's geocode_address_async, so it runs
+    in a worker thread behind the GEOCODING_CONCURRENCY semaphore and shares
+    the spider's caches and database duplicate check.
+    """
+
+    async def process_item(self, item, spider):
+        if not getattr(spider, 'geocode_in_pipeline', False):
+            return item
+        adapter = ItemAdapter(item)
+        if adapter.get('coordinates') or not adapter.get('address'):
+            return item
+        
+        # Pass event_data to enable database check before geocoding
+        event_data = {
+            'name': adapter.get('name'),
+            'date': adapter.get('date'),
+            'url': adapter.get('url'),
+        }
+        coords = await maybe_deferred_to_future(
+            spider.geocode_address_async(adapter['address'], event_data=event_data)
+        )
+        adapter['coordinates'] = coords
+        if isinstance(adapter.get('raw'), dict):
+            adapter['raw']['coordinates'] = coords
+        return item
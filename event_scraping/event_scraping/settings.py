@@ -88,6 +88,12 @@ DOWNLOAD_DELAY = 1
 # Set settings whose default value is deprecated to a future-proof value
 FEED_EXPORT_ENCODING = "utf-8"
 
+# Serialize JSON Lines feeds with orjson (falls back to the stock exporter if it is not installed)
+FEED_EXPORTERS = {
+    "jsonlines": "event_scraping.exporters.OrjsonLinesItemExporter",
+    "jl": "event_scraping.exporters.OrjsonLinesItemExporter",
+}
+
 
 # Enable logging
 LOG_ENABLED = True
@@ -114,6 +120,16 @@ LOCATIONIQ_API_KEY = 'pk.9749c919312e2bc60949144d0edb6806'
 #
 # If a service fails or is blocked, it will automatically try the next one.
 
+# Maximum number of geocoding lookups running at once (spiders using geocode_address_async)
+GEOCODING_CONCURRENCY = 2
+
+# SQLite file caching geocoded addresses across runs (set to None to disable)
+GEOCODING_CACHE_PATH = '.spider_state/geocode.db'
+
+# Sharpham Trust: when Selenium fails and no "More Info" links are found, scrape
+# events straight off the listing page instead (less accurate, off by default)
+SHARPHAM_PAGE_FALLBACK = False
+
 # Database configuration for WordPress MySQL database
 DB_HOST = 'sql7.nur4.host-h.net'
 DB_NAME = 'cveropfnwf_wp7fbf'  # WordPress database name
@@ -122,4 +138,4 @@ DB_PASSWORD = '95RnJXcDDkmV16s7VUav'  # Database password
 DB_PORT = 3306  # Database port
 
 # Backup retention settings
-BACKUP_RETENTION_DAYS = 7  # Number of days to keep backup files (older files will be deleted)
\ No newline at end of file
+BACKUP_RETENTION_DAYS = 7  # Number of days to keep backup files (older files will be deleted)
@@ -13,9 +13,15 @@ It also exposes convenience wrappers around common utilities in
 """
 import scrapy
 import re
+import sqlite3
 import time
 import traceback
+from collections import Counter
+from datetime import datetime
 from functools import wraps
+from scrapy import signals
+from twisted.internet import defer, threads
+from twisted.python.failure import Failure
 from ..utils.common import (
     clean_text, 
     get_absolute_url, 
@@ -23,10 +29,13 @@ from ..utils.common import (
     geocode_address as geocode_address_util,
     geocode_locationiq,
     geocode_nominatim,
+    geocode_cache_key,
+    is_geocodable_address as is_geocodable_address_util,
     remove_location_text as remove_location_text_util,
     convert_date_format as convert_date_format_util,
     get_event_category as get_event_category_util,
     check_event_exists_in_db,
+    open_geocode_cache,
     validate_uk_coordinates
 )
 
@@ -59,6 +68,8 @@ class BaseSpider(scrapy.Spider):
         category (str): logical category for the spider (set in subclasses)
         site_name (str): short name of the source site (set in subclasses)
         geocoding_cache (dict): Cache for geocoding results
+        persistent_geocodes (GeocodeCache or dict): On-disk geocoding cache,
+            keyed by normalized address
     """
 
     category = None
@@ -71,6 +82,69 @@ class BaseSpider(scrapy.Spider):
             self.geocoding_cache = {}
         # Flag to enable/disable database checking (default: True to save geocoding API calls)
         self.check_db_before_geocoding = kwargs.get('check_db_before_geocoding', True)
+        # On-disk geocoding cache shared by all spiders (opened in from_crawler)
+        self.persistent_geocodes = {}
+        # Normalized address -> Deferreds waiting on a lookup that is already running
+        self._geocode_inflight = {}
+        # strptime formats that matched, used to try the common ones first
+        self._date_format_hits = Counter()
+        self._date_format_order = {}
+
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        spider.open_geocode_store(crawler.settings.get('GEOCODING_CACHE_PATH'))
+        crawler.signals.connect(spider.close_geocode_store, signal=signals.spider_closed)
+        return spider
+
+    def open_geocode_store(self, path):
+        """Open the SQLite geocoding cache (see utils.common.GeocodeCache).
+
+        Every row is loaded into memory up front so lookups on the hot path
+        are plain dict hits; SQLite is only touched to add new results.
+
+        Args:
+            path (str): Database file path; caching is disabled if empty
+        """
+        if not path:
+            return
+        try:
+            self.persistent_geocodes = open_geocode_cache(path)
+            self.logger.info(f"Loaded {len(self.persistent_geocodes)} cached geocodes from {path}")
+        except sqlite3.Error as e:
+            self.log_error(f"Could not open geocoding cache: {e}", level='warning', context={'path': path})
+            self.persistent_geocodes = {}
+
+    def close_geocode_store(self, spider=None, reason=None):
+        """Close the SQLite geocoding cache (connected to spider_closed)."""
+        close = getattr(self.persistent_geocodes, 'close', None)
+        if close is not None:
+            close()
+
+    def is_geocodable_address(self, address):
+        """Cheap check that an address is worth a geocoding request.
+
+        Rejects empty strings, strings without a real word and placeholders
+        like "UK", "Online" or "TBA" that never resolve to a venue. Uses the
+        same predicate as the common geocoding functions.
+        """
+        return is_geocodable_address_util(address)
+
+    def normalize_address_key(self, address):
+        """Normalize an address for geocoding cache lookups.
+
+        Strips "Location:" prefixes, lowercases and collapses whitespace so
+        trivially different spellings of the same address share one entry.
+        Uses the same key as the common geocoding functions.
+        """
+        return geocode_cache_key(address)
+
+    def store_geocode(self, norm_addr, coords):
+        """Remember a successful geocode in memory and in the SQLite cache."""
+        try:
+            self.persistent_geocodes[norm_addr] = coords
+        except sqlite3.Error as e:
+            self.log_error(f"Could not write geocoding cache: {e}", level='warning', context={'address': norm_addr[:100]})
 
     def clean_text(self, text):
         """Normalize and clean text using shared utility."""
@@ -267,6 +341,34 @@ class BaseSpider(scrapy.Spider):
             self.log_error(f"Date conversion failed for '{date_str}': {e}", context={'date_str': date_str})
             return date_str if date_str else None
 
+    def strptime_any(self, date_str, formats):
+        """Parse date_str with the first matching strptime format.
+
+        Formats are tried most-successful first: each time a format matches it
+        moves ahead of its predecessor once it has more hits, so after a few
+        events the site's usual format is the first one tried.
+
+        Args:
+            date_str (str): Date string to parse
+            formats (tuple): strptime formats (a tuple, used as the ordering key)
+
+        Returns:
+            datetime or None if no format matches
+        """
+        order = self._date_format_order.get(formats)
+        if order is None:
+            order = self._date_format_order[formats] = list(formats)
+        for index, fmt in enumerate(order):
+            try:
+                parsed = datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+            self._date_format_hits[fmt] += 1
+            if index and self._date_format_hits[fmt] > self._date_format_hits[order[index - 1]]:
+                order[index - 1], order[index] = fmt, order[index - 1]
+            return parsed
+        return None
+
     def event_exists_in_db(self, event):
         """Check if an event already exists in the database.
         
@@ -354,7 +456,7 @@ class BaseSpider(scrapy.Spider):
         Returns:
             dict: {'lat': float, 'lon': float} or None if all services fail
         """
-        if not address:
+        if not self.is_geocodable_address(address):
             return None
         
         # Check database first if enabled and event_data provided
@@ -365,6 +467,13 @@ class BaseSpider(scrapy.Spider):
                 self.logger.debug(f"Skipping geocoding - event already exists in DB (post ID: {existing_post_id})")
                 return None  # Skip geocoding for existing events
         
+        # Addresses geocoded on a previous run cost nothing
+        norm_addr = self.normalize_address_key(address)
+        cached = getattr(self, 'persistent_geocodes', {}).get(norm_addr)
+        if cached:
+            self.logger.debug(f"Geocoding cache hit for '{address[:50]}...'")
+            return cached
+        
         # Initialize cache if needed
         if not hasattr(self, 'geocoding_cache'):
             self.geocoding_cache = {}
@@ -395,6 +504,8 @@ class BaseSpider(scrapy.Spider):
                     return None  # Don't return invalid coordinates
                 
                 self.logger.debug(f"Geocoded '{address[:50]}...' -> {coords['lat']}, {coords['lon']}")
+                if hasattr(self, 'persistent_geocodes'):
+                    self.store_geocode(norm_addr, coords)
             
             return coords
         except Exception as e:
@@ -402,6 +513,68 @@ class BaseSpider(scrapy.Spider):
                          level='warning', context={'address': address[:100]})
             return None
 
+    def geocode_address_async(self, address, event_data=None):
+        """Run geocode_address in a worker thread so the reactor keeps parsing.
+
+        Concurrent lookups are bounded by a shared DeferredSemaphore sized from
+        the GEOCODING_CONCURRENCY setting, so a slow or rate-limited geocoder
+        only holds up the items waiting on it. Callers asking for an address
+        that is already being looked up wait on that lookup instead of
+        starting another one.
+
+        The database duplicate check (when enabled) still runs per event,
+        since two events at the same venue can differ in whether they exist.
+
+        Returns:
+            Deferred: fires with {'lat': float, 'lon': float} or None
+        """
+        if not self.is_geocodable_address(address):
+            return defer.succeed(None)
+        
+        if self.check_db_before_geocoding and event_data:
+            d = threads.deferToThread(self.event_exists_in_db, event_data)
+            d.addCallback(self._geocode_unless_exists, address)
+            return d
+        return self._geocode_coalesced(address)
+
+    def _geocode_unless_exists(self, existing_post_id, address):
+        if existing_post_id:
+            self.logger.debug(f"Skipping geocoding - event already exists in DB (post ID: {existing_post_id})")
+            return None
+        return self._geocode_coalesced(address)
+
+    def _geocode_coalesced(self, address):
+        """Start (or join) a bounded geocoding lookup for address."""
+        norm_addr = self.normalize_address_key(address)
+        cached = self.persistent_geocodes.get(norm_addr)
+        if cached:
+            return defer.succeed(cached)
+        
+        waiters = self._geocode_inflight.get(norm_addr)
+        if waiters is not None:
+            d = defer.Deferred()
+            waiters.append(d)
+            return d
+        self._geocode_inflight[norm_addr] = []
+        
+        if not hasattr(self, '_geocoding_semaphore'):
+            limit = 2
+            if hasattr(self, 'settings') and self.settings:
+                limit = self.settings.getint('GEOCODING_CONCURRENCY', limit)
+            self._geocoding_semaphore = defer.DeferredSemaphore(max(1, limit))
+        d = self._geocoding_semaphore.run(threads.deferToThread, self.geocode_address, address)
+        
+        def fan_out(result):
+            for waiter in self._geocode_inflight.pop(norm_addr, []):
+                if isinstance(result, Failure):
+                    waiter.errback(result)
+                else:
+                    waiter.callback(result)
+            return result
+        
+        d.addBoth(fan_out)
+        return d
+
     @log_errors
     def extract_coordinates(self, response):
         """Attempt to find coordinates (lat, lon) in the page using multiple heuristics."""
@@ -1,6 +1,13 @@
 import scrapy
 from ..base_spider import BaseSpider
 from ...items import EventScrapingItem
+from ...utils.common import _LOCATIONIQ_LIMITER, _NOMINATIM_LIMITER, _RateLimiter
+
+# OpenCage free tier: 1 request/second. LocationIQ and Nominatim share the
+# process-wide limiters in utils.common, so their limits hold across spiders.
+# A limiter only waits when the previous call was less than one interval ago,
+# so the first lookup (or one after an idle gap) is sent immediately
+_OPENCAGE_LIMITER = _RateLimiter(calls=1, period=1.1)
 
 
 class RunGuidesSpider(BaseSpider):
@@ -1128,7 +1135,6 @@ class RunGuidesSpider(BaseSpider):
     def _geocode_nominatim(self, address):
         """Geocode using Nominatim (OpenStreetMap) API."""
         import requests
-        import time
         
         url = "https://nominatim.openstreetmap.org/search"
         params = {
@@ -1144,8 +1150,8 @@ class RunGuidesSpider(BaseSpider):
             'User-Agent': 'RunGuidesSpider/1.0 (contact@example.com)'
         }
         
-        # Rate limiting: 1 second delay between requests (Nominatim policy)
-        time.sleep(1.1)
+        # Rate limiting: 1 second between requests (Nominatim policy)
+        _NOMINATIM_LIMITER.acquire()
         
         response = requests.get(url, params=params, headers=headers, timeout=10)
         
@@ -1172,7 +1178,6 @@ class RunGuidesSpider(BaseSpider):
     def _geocode_locationiq(self, address):
         """Geocode using LocationIQ API."""
         import requests
-        import time
         
         # Get API key from settings (should already be checked, but double-check)
         api_key = self.settings.get('LOCATIONIQ_API_KEY')
@@ -1190,7 +1195,7 @@ class RunGuidesSpider(BaseSpider):
         }
         
         # Rate limiting: LocationIQ free tier allows 2 requests/second
-        time.sleep(0.6)
+        _LOCATIONIQ_LIMITER.acquire()
         
         response = requests.get(url, params=params, timeout=10)
         
@@ -1224,7 +1229,6 @@ class RunGuidesSpider(BaseSpider):
     def _geocode_opencage(self, address):
         """Geocode using OpenCage Geocoding API."""
         import requests
-        import time
         
         # Get API key from settings (should already be checked, but double-check)
         api_key = self.settings.get('OPENCAGE_API_KEY')
@@ -1241,7 +1245,7 @@ class RunGuidesSpider(BaseSpider):
         }
         
         # Rate limiting: OpenCage free tier allows 1 request/second
-        time.sleep(1.1)
+        _OPENCAGE_LIMITER.acquire()
         
         response = requests.get(url, params=params, timeout=10)
         
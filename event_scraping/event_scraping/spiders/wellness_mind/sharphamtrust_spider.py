@@ -1,10 +1,54 @@
 import scrapy
 import re
 import time
+import traceback
+from datetime import datetime
+from functools import lru_cache
+from scrapy.utils.defer import maybe_deferred_to_future
 from ..base_spider import BaseSpider
 from ...items import EventScrapingItem
+from ...utils.common import SeenEventFilter
 from scrapy.http import HtmlResponse
 
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.service import Service
+except ImportError:
+    webdriver = None
+
+try:
+    from webdriver_manager.chrome import ChromeDriverManager
+except ImportError:
+    ChromeDriverManager = None
+
+try:
+    from dateutil import parser as _dateutil_parser
+except ImportError:
+    _dateutil_parser = None
+
+# Nearest <small> beside an icon: following sibling first, else preceding sibling
+SIBLING_SMALL_XPATH = '(./following-sibling::small[1] | ./preceding-sibling::small[1])[last()]'
+
+
+_UK_RE = re.compile(r'\bUK\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _ensure_uk(address):
+    # Check if "UK" is already present (case-insensitive)
+    if _UK_RE.search(address):
+        return address
+    
+    # Skip adding UK for online events
+    if address.lower() in ('online', 'online retreats'):
+        return address
+    
+    # Add "UK" to the end of the address
+    return f"{address}, UK"
+
 
 class SharphamTrustSpider(BaseSpider):
     """Spider for https://www.sharphamtrust.org/whatson
@@ -22,27 +66,92 @@ class SharphamTrustSpider(BaseSpider):
         "https://www.sharphamtrust.org/whatson"
     ]
     
+    custom_settings = {
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 4,  # Fetch detail pages in parallel
+        'DOWNLOAD_DELAY': 0.5,
+        'RANDOMIZE_DOWNLOAD_DELAY': True,
+        'AUTOTHROTTLE_ENABLED': True,  # Back off automatically if the server slows down
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 3.0,
+    }
+    
+    # Maximum number of characters scanned for venue names when no address is found
+    VENUE_SCAN_CHARS = 2000
+    
+    # Known venues as (lowercased, display) pairs so matching only lowercases the page text
+    VENUE_KEYWORDS = ('Online', 'The Barn', 'Sharpham House', 'The Coach House', 'Woodland', 'The Hermitage')
+    VENUE_KEYWORDS_LOWER = tuple((keyword.lower(), keyword) for keyword in VENUE_KEYWORDS)
+    
+    # Date formats tried in order by convert_date_format
+    DATE_FORMATS = (
+        '%Y %d %b',      # "2025 13 Dec"
+        '%Y %d %B',      # "2025 13 December"
+        '%d %b %Y',      # "13 Dec 2025"
+        '%d %B %Y',      # "13 December 2025"
+        '%b %d, %Y',     # "Dec 13, 2025"
+        '%B %d, %Y',     # "December 13, 2025"
+        '%d/%m/%Y',      # "13/12/2025"
+        '%d-%m-%Y',      # "13-12-2025"
+        '%Y-%m-%d',      # "2025-12-13"
+        '%Y/%m/%d',      # "2025/12/13"
+    )
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.seen_events = set()
+        # Per run only: it decides which detail pages are followed, so carrying it over
+        # would skip every known event (and never retry one whose insert failed).
+        # Geocodes persist across runs through BaseSpider's SQLite GeocodeCache
+        self.seen_events = SeenEventFilter()
         self.geocoding_cache = {}
         self.total_items_scraped = 0
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _build_options(cls):
+        """Build the Chrome options once; they are identical for every driver we start."""
+        options = webdriver.ChromeOptions()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=1920,1080')
+        # Only anchor hrefs are needed, so skip images and idle browser subsystems
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disable-background-networking')
+        options.add_argument('--disable-sync')
+        options.add_argument('--disable-default-apps')
+        options.add_argument('--disable-translate')
+        options.add_argument('--mute-audio')
+        options.add_argument('--no-first-run')
+        options.add_argument('--no-default-browser-check')
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        return options
     
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _chromedriver_path():
+        """Resolve the webdriver-manager ChromeDriver path once per process.
+
+        Returns None when webdriver-manager is missing or cannot resolve a driver,
+        in which case Selenium Manager / the system ChromeDriver is used instead.
+        """
+        if ChromeDriverManager is None:
+            return None
+        try:
+            return ChromeDriverManager().install()
+        except Exception:
+            return None
+
     def ensure_uk_in_address(self, address):
         """Ensure 'UK' is present in the address if it's not already there."""
         if not address:
             return address
-        
-        # Check if "UK" is already present (case-insensitive)
-        if re.search(r'\bUK\b', address, re.IGNORECASE):
-            return address
-        
-        # Skip adding UK for online events
-        if address.lower() in ['online', 'online retreats']:
-            return address
-        
-        # Add "UK" to the end of the address
-        return f"{address}, UK"
+        # The same few venues repeat across events, so the result is memoized per address
+        return _ensure_uk(address)
 
     def parse(self, response):
         """Parse the listing page and extract 'More Info' links to follow to detail pages."""
@@ -54,35 +163,28 @@ class SharphamTrustSpider(BaseSpider):
         self.logger.info("LOADING PAGE WITH SELENIUM TO FIND 'MORE INFO' LINKS")
         self.logger.info("=" * 80)
         
+        if webdriver is None:
+            self.logger.warning("Selenium not available, trying regular Scrapy parsing...")
+            # Fallback: try to find links with regular Scrapy
+            more_info_links = response.css('a:contains("More Info")::attr(href)').getall()
+            for link in more_info_links:
+                if link:
+                    absolute_url = response.urljoin(link)
+                    if absolute_url not in self.seen_events:
+                        self.seen_events.add(absolute_url)
+                        yield response.follow(link, self.parse_event_detail, errback=self.handle_error)
+            return
+        
         try:
-            from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.common.exceptions import TimeoutException, NoSuchElementException
-            
-            self.logger.info("✓ Selenium imported successfully")
-            
-            # Configure Chrome options
-            options = webdriver.ChromeOptions()
-            options.add_argument('--headless=new')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            options = self._build_options()
             
             # Initialize driver
-            try:
-                from selenium.webdriver.chrome.service import Service
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
+            chromedriver_path = self._chromedriver_path()
+            if chromedriver_path:
+                service = Service(chromedriver_path)
                 driver = webdriver.Chrome(service=service, options=options)
                 self.logger.info("✓ Using webdriver-manager for ChromeDriver")
-            except ImportError:
+            else:
                 driver = webdriver.Chrome(options=options)
                 self.logger.info("✓ Using system ChromeDriver")
             
@@ -108,8 +210,8 @@ class SharphamTrustSpider(BaseSpider):
                 driver.execute_script("window.scrollTo(0, 0);")
                 time.sleep(2)
                 
-                # Find all "More Info" links
-                more_info_links = []
+                # Find all "More Info" links (the listing page itself is seeded so it is never followed)
+                more_info_links = {response.url}
                 
                 # Try multiple selectors for "More Info" links
                 link_selectors = [
@@ -125,8 +227,8 @@ class SharphamTrustSpider(BaseSpider):
                     self.logger.info(f"Found {len(links)} 'More Info' links using XPath")
                     for link in links:
                         href = link.get_attribute('href')
-                        if href and href not in more_info_links:
-                            more_info_links.append(href)
+                        if href:
+                            more_info_links.add(href)
                             self.logger.info(f"Found More Info link: {href}")
                 except Exception as e:
                     self.logger.warning(f"Error finding More Info links with XPath: {e}")
@@ -136,11 +238,12 @@ class SharphamTrustSpider(BaseSpider):
                     all_links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/whatson/"], a[href*="/event/"], a[href*="/retreat/"]')
                     for link in all_links:
                         href = link.get_attribute('href')
-                        if href and href not in more_info_links and href != response.url:
-                            more_info_links.append(href)
+                        if href:
+                            more_info_links.add(href)
                 except Exception as e:
                     self.logger.warning(f"Error finding event links: {e}")
                 
+                more_info_links.discard(response.url)
                 self.logger.info(f"Total unique event detail page links found: {len(more_info_links)}")
                 
                 # Follow each link to extract event details
@@ -159,19 +262,8 @@ class SharphamTrustSpider(BaseSpider):
                 driver.quit()
                 self.logger.info("✓ Selenium driver closed")
                 
-        except ImportError:
-            self.logger.warning("Selenium not available, trying regular Scrapy parsing...")
-            # Fallback: try to find links with regular Scrapy
-            more_info_links = response.css('a:contains("More Info")::attr(href)').getall()
-            for link in more_info_links:
-                if link:
-                    absolute_url = response.urljoin(link)
-                    if absolute_url not in self.seen_events:
-                        self.seen_events.add(absolute_url)
-                        yield response.follow(link, self.parse_event_detail, errback=self.handle_error)
         except Exception as e:
             self.logger.error(f"Error with Selenium: {e}")
-            import traceback
             self.logger.error(traceback.format_exc())
             # Fallback: try to find links with regular Scrapy
             more_info_links = response.css('a:contains("More Info")::attr(href)').getall()
@@ -181,8 +273,24 @@ class SharphamTrustSpider(BaseSpider):
                     if absolute_url not in self.seen_events:
                         self.seen_events.add(absolute_url)
                         yield response.follow(link, self.parse_event_detail, errback=self.handle_error)
+            
+            if not any(more_info_links) and self.settings.getbool('SHARPHAM_PAGE_FALLBACK'):
+                # Last resort (opt-in): scrape the events straight off the listing page.
+                # The page is requested again so the extraction runs in an async callback
+                # that can geocode off the reactor thread
+                yield response.request.replace(
+                    callback=self.parse_listing_fallback,
+                    errback=self.handle_error,
+                    dont_filter=True,
+                )
     
-    def parse_event_detail(self, response):
+    async def parse_listing_fallback(self, response):
+        """Scrape events straight off the listing page when no detail links were found."""
+        from ...utils.sharphamtrust_fallback import extract_events_from_page
+        async for item in extract_events_from_page(self, response):
+            yield item
+    
+    async def parse_event_detail(self, response):
         """Parse individual event detail pages to extract title, date, location, and description."""
         self.logger.info(f"Parsing event detail page: {response.url}")
         
@@ -227,15 +335,10 @@ class SharphamTrustSpider(BaseSpider):
         # Use XPath to find the calendar icon (i tag with fa-calendar-days class)
         calendar_icon = response.xpath('//i[contains(@class, "fa-calendar-days")]')
         if calendar_icon:
-            # Find the <small> tag that is a sibling of the calendar icon
-            # Try following sibling first
-            small_tag = calendar_icon.xpath('./following-sibling::small[1]')
-            if not small_tag:
-                # Try preceding sibling
-                small_tag = calendar_icon.xpath('./preceding-sibling::small[1]')
-            if not small_tag:
-                # Try any sibling small tag
-                small_tag = calendar_icon.xpath('./../small[1]')
+            # Find the <small> tag that is a sibling of the calendar icon in one XPath pass.
+            # The union is in document order, so [last()] prefers the following sibling
+            # and falls back to the nearest preceding one (../small[1] is always one of these)
+            small_tag = calendar_icon.xpath(SIBLING_SMALL_XPATH)
             
             if small_tag:
                 date_text = ' '.join(small_tag.css('::text').getall()).strip()
@@ -281,15 +384,10 @@ class SharphamTrustSpider(BaseSpider):
         # Use XPath to find the location icon (i tag with fa-location-dot class)
         location_icon = response.xpath('//i[contains(@class, "fa-location-dot")]')
         if location_icon:
-            # Find the <small> tag that is a sibling of the location icon
-            # Try following sibling first
-            small_tag = location_icon.xpath('./following-sibling::small[1]')
-            if not small_tag:
-                # Try preceding sibling
-                small_tag = location_icon.xpath('./preceding-sibling::small[1]')
-            if not small_tag:
-                # Try any sibling small tag
-                small_tag = location_icon.xpath('./../small[1]')
+            # Find the <small> tag that is a sibling of the location icon in one XPath pass.
+            # The union is in document order, so [last()] prefers the following sibling
+            # and falls back to the nearest preceding one (../small[1] is always one of these)
+            small_tag = location_icon.xpath(SIBLING_SMALL_XPATH)
             
             if small_tag:
                 location_text = ' '.join(small_tag.css('::text').getall()).strip()
@@ -318,10 +416,21 @@ class SharphamTrustSpider(BaseSpider):
         
         # If no address found, try to identify venue from title or description
         if not address:
-            all_text = (title or '') + ' ' + ' '.join(response.css('body::text').getall())
-            venue_keywords = ['Online', 'The Barn', 'Sharpham House', 'The Coach House', 'Woodland', 'The Hermitage']
-            for keyword in venue_keywords:
-                if keyword.lower() in all_text.lower():
+            # Only scan headings and the event description, capped in length
+            # Text nodes are taken one at a time until VENUE_SCAN_CHARS is reached, so long
+            # descriptions are not extracted and joined only to be cut off
+            scanned_nodes = []
+            scanned_chars = 0
+            for node in response.css('h1::text, h2::text, .event-description *::text'):
+                text = node.get()
+                scanned_nodes.append(text)
+                scanned_chars += len(text) + 1
+                if scanned_chars >= self.VENUE_SCAN_CHARS:
+                    break
+            all_text = (title or '') + ' ' + ' '.join(scanned_nodes)
+            all_text_lower = all_text.lower()
+            for keyword_lower, keyword in self.VENUE_KEYWORDS_LOWER:
+                if keyword_lower in all_text_lower:
                     address = keyword
                     break
         
@@ -352,7 +461,7 @@ class SharphamTrustSpider(BaseSpider):
         # Create short description
         short_description = None
         if description:
-            short_description = description[:200] + '...' if len(description) > 200 else description
+            short_description = f"{description[:200]}..." if len(description) > 200 else description
         
         # Build event_data for database check before geocoding
         event_data = {
@@ -361,13 +470,13 @@ class SharphamTrustSpider(BaseSpider):
             'url': response.url
         }
         
-        # Geocode address
+        # Geocode address off the reactor thread so other detail pages keep parsing
         # Pass event_data to enable database check before geocoding
         coords = None
         if address and address not in ['Online', 'Online Retreats']:
-            coords = self.geocode_address(address, event_data=event_data)
+            coords = await maybe_deferred_to_future(self.geocode_address_async(address, event_data=event_data))
         elif address == "Sharpham House, Ashprington, Totnes, Devon, UK TQ9 7UT":
-            coords = self.geocode_address(address, event_data=event_data)
+            coords = await maybe_deferred_to_future(self.geocode_address_async(address, event_data=event_data))
         
         # Only create item if we have at least a title
         if title:
@@ -390,7 +499,7 @@ class SharphamTrustSpider(BaseSpider):
             }
             
             # Check for duplicates
-            item_key = f"{item['name']}_{item['date']}"
+            item_key = (item['name'], item['date'])
             if item_key not in self.seen_events:
                 self.seen_events.add(item_key)
                 self.total_items_scraped += 1
@@ -401,328 +510,31 @@ class SharphamTrustSpider(BaseSpider):
         else:
             self.logger.warning(f"Could not extract title from event detail page: {response.url}")
     
-    def extract_events_with_selenium(self, driver, base_url):
-        """Extract events using Selenium WebDriver."""
-        from selenium.webdriver.common.by import By
-        from selenium.common.exceptions import NoSuchElementException
-        
-        self.logger.info("Extracting events using Selenium...")
-        
-        # Get page source and look for all text containing date patterns
-        page_text = driver.find_element(By.TAG_NAME, 'body').text
-        self.logger.info(f"Page text length: {len(page_text)} characters")
-        
-        # Find all headings that might be event titles
-        headings = driver.find_elements(By.CSS_SELECTOR, 'h2, h3, h4, h5, h6')
-        self.logger.info(f"Found {len(headings)} headings on the page")
-        
-        # Process each heading as a potential event
-        for idx, heading in enumerate(headings):
-            try:
-                title = heading.text.strip()
-                if not title or len(title) < 10:
-                    continue
-                
-                # Skip navigation headings
-                skip_keywords = ['Filter', 'Browse', 'Calendar', 'Events', 'Courses', 'Retreats', 'Month', 'Reset', 'Update', 'Whats on', 'Sign up', 'Donate', 'Menu', 'Home', 'The Sharpham Trust']
-                if any(keyword.lower() in title.lower() for keyword in skip_keywords):
-                    continue
-                
-                self.logger.debug(f"Processing heading {idx + 1}: '{title[:60]}...'")
-                
-                # Get the parent container
-                try:
-                    parent = heading.find_element(By.XPATH, './parent::*')
-                except:
-                    parent = None
-                
-                # Get all text from parent and following siblings
-                all_text = title
-                if parent:
-                    all_text += ' ' + parent.text
-                
-                # Also check following siblings
-                try:
-                    following = heading.find_elements(By.XPATH, './following-sibling::*[position()<=5]')
-                    for elem in following:
-                        all_text += ' ' + elem.text
-                except:
-                    pass
-                
-                # Look for date pattern: "2025 13 Dec" or similar
-                date_match = None
-                date_patterns = [
-                    r'(\d{4})\s+(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)',
-                    r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})',
-                ]
-                
-                for pattern in date_patterns:
-                    match = re.search(pattern, all_text, re.IGNORECASE)
-                    if match:
-                        date_match = match.group(0).strip()
-                        break
-                
-                if not date_match:
-                    self.logger.debug(f"No date found for heading: {title[:50]}...")
-                    continue
-                
-                # Extract venue
-                address = None
-                venue_keywords = ['Online', 'The Barn', 'Sharpham House', 'The Coach House', 'Woodland', 'The Hermitage']
-                for keyword in venue_keywords:
-                    if keyword.lower() in all_text.lower():
-                        address = keyword
-                        break
-                
-                if not address:
-                    address = "Sharpham House, Ashprington, Totnes, Devon, UK TQ9 7UT"
-                
-                # Extract description
-                description = None
-                if parent:
-                    try:
-                        desc_elems = parent.find_elements(By.CSS_SELECTOR, 'p')
-                        if desc_elems:
-                            desc_texts = [elem.text.strip() for elem in desc_elems if elem.text.strip()]
-                            if desc_texts:
-                                description = ' '.join(desc_texts)
-                    except:
-                        pass
-                
-                # Extract URL
-                url = base_url
-                try:
-                    if parent:
-                        links = parent.find_elements(By.CSS_SELECTOR, 'a')
-                        for link in links:
-                            href = link.get_attribute('href')
-                            if href and ('whatson' in href.lower() or 'event' in href.lower() or 'retreat' in href.lower()):
-                                url = href
-                                break
-                except:
-                    pass
-                
-                # Create and yield item
-                item = EventScrapingItem()
-                item['category'] = self.category
-                item['site'] = self.site_name
-                item['url'] = url
-                item['name'] = self.clean_text(title)
-                
-                item['date'] = self.convert_date_format(date_match)
-                item['raw_date'] = date_match
-                
-                short_description = description[:200] + '...' if description and len(description) > 200 else description
-                item['short_description'] = self.clean_text(short_description) if short_description else None
-                
-                # Build event_data for database check before geocoding
-                geocode_event_data = {
-                    'name': item['name'],
-                    'date': item['date'],
-                    'url': item['url']
-                }
-                
-                coords = None
-                # Pass event_data to enable database check before geocoding
-                if address and address not in ['Online', 'Online Retreats']:
-                    coords = self.geocode_address(address, event_data=geocode_event_data)
-                elif address == "Sharpham House, Ashprington, Totnes, Devon, UK TQ9 7UT":
-                    coords = self.geocode_address(address, event_data=geocode_event_data)
-                
-                item['coordinates'] = coords
-                # Ensure UK is present in address
-                address = self.ensure_uk_in_address(address)
-                item['address'] = address
-                item['category'] = "Wellness & Mind"
-                item['subcategory'] = "Mindfulness"
-                item['raw'] = {
-                    'title': title,
-                    'date': date_match,
-                    'description': description,
-                    'address': address,
-                    'coordinates': coords,
-                }
-                
-                # Check for duplicates
-                item_key = f"{item['name']}_{item['date']}"
-                if item_key not in self.seen_events:
-                    self.seen_events.add(item_key)
-                    self.total_items_scraped += 1
-                    self.logger.info(f"✓ Extracted event #{self.total_items_scraped}: {item['name'][:50]}... (Date: {date_match})")
-                    yield item
-                else:
-                    self.logger.debug(f"Skipping duplicate: {item['name'][:50]}...")
-                    
-            except Exception as e:
-                self.logger.debug(f"Error extracting from heading {idx + 1}: {e}")
-                import traceback
-                self.logger.debug(traceback.format_exc())
-                continue
-        
-        self.logger.info(f"Finished extracting events. Total unique events: {self.total_items_scraped}")
-    
-    def extract_events_from_page(self, response):
-        """Extract events directly from the listing page (fallback method)."""
-        self.logger.info("Extracting events directly from listing page (fallback)...")
-        
-        events_found = 0
-        
-        # Find all headings
-        headings = response.css('h2, h3, h4, h5, h6')
-        self.logger.info(f"Found {len(headings)} headings on the page")
-        
-        for idx, heading in enumerate(headings):
-            try:
-                title = heading.css('::text').get()
-                if not title:
-                    title = ''.join(heading.css('::text').getall())
-                
-                if not title or len(title.strip()) < 10:
-                    continue
-                
-                title = title.strip()
-                
-                # Skip navigation headings
-                skip_keywords = ['Filter', 'Browse', 'Calendar', 'Events', 'Courses', 'Retreats', 'Month', 'Reset', 'Update', 'Whats on', 'Sign up', 'Donate', 'Menu']
-                if any(keyword.lower() in title.lower() for keyword in skip_keywords):
-                    continue
-                
-                # Get parent and following text
-                parent = heading.xpath('./parent::*[1]')
-                all_text = title
-                if parent:
-                    all_text += ' ' + ' '.join(parent.css('::text').getall())
-                
-                # Look for date
-                date_match = None
-                date_patterns = [
-                    r'(\d{4})\s+(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)',
-                    r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})',
-                ]
-                
-                for pattern in date_patterns:
-                    match = re.search(pattern, all_text, re.IGNORECASE)
-                    if match:
-                        date_match = match.group(0).strip()
-                        break
-                
-                if not date_match:
-                    continue
-                
-                # Extract venue
-                address = None
-                venue_keywords = ['Online', 'The Barn', 'Sharpham House', 'The Coach House', 'Woodland', 'The Hermitage']
-                for keyword in venue_keywords:
-                    if keyword.lower() in all_text.lower():
-                        address = keyword
-                        break
-                
-                if not address:
-                    address = "Sharpham House, Ashprington, Totnes, Devon, UK TQ9 7UT"
-                
-                # Extract description
-                description = None
-                if parent:
-                    desc_parts = parent.css('p::text').getall()
-                    if desc_parts:
-                        description = ' '.join([d.strip() for d in desc_parts if d.strip()])
-                
-                # Extract URL
-                url = response.url
-                if parent:
-                    link = parent.css('a::attr(href)').get()
-                    if link:
-                        url = response.urljoin(link)
-                
-                # Create item
-                if title and date_match:
-                    item = EventScrapingItem()
-                    item['category'] = self.category
-                    item['site'] = self.site_name
-                    item['url'] = url
-                    item['name'] = self.clean_text(title)
-                    item['date'] = self.convert_date_format(date_match)
-                    item['raw_date'] = date_match
-                    
-                    short_description = description[:200] + '...' if description and len(description) > 200 else description
-                    item['short_description'] = self.clean_text(short_description) if short_description else None
-                    
-                    # Build event_data for database check before geocoding
-                    geocode_event_data = {
-                        'name': item['name'],
-                        'date': item['date'],
-                        'url': item['url']
-                    }
-                    
-                    coords = None
-                    # Pass event_data to enable database check before geocoding
-                    if address and address not in ['Online']:
-                        coords = self.geocode_address(address, event_data=geocode_event_data)
-                    
-                    item['coordinates'] = coords
-                    # Ensure UK is present in address
-                    address = self.ensure_uk_in_address(address)
-                    item['address'] = address
-                    item['category'] = "Wellness & Mind"
-                    item['subcategory'] = "Mindfulness"
-                    item['raw'] = {
-                        'title': title,
-                        'date': date_match,
-                        'description': description,
-                        'address': address,
-                        'coordinates': coords,
-                    }
-                    
-                    item_key = f"{item['name']}_{item['date']}"
-                    if item_key not in self.seen_events:
-                        self.seen_events.add(item_key)
-                        self.total_items_scraped += 1
-                        events_found += 1
-                        self.logger.info(f"Extracted event #{events_found}: {item['name'][:50]}...")
-                        yield item
-                        
-            except Exception as e:
-                self.logger.debug(f"Error extracting event from heading {idx + 1}: {e}")
-                continue
-        
-        return events_found
-
     def convert_date_format(self, date_str):
         """Convert date to MM/DD/YYYY format."""
         if not date_str:
             return None
         try:
-            from datetime import datetime
             date_str = date_str.strip()
             
-            # Handle various date formats
-            formats = [
-                '%Y %d %b',      # "2025 13 Dec"
-                '%Y %d %B',      # "2025 13 December"
-                '%d %b %Y',      # "13 Dec 2025"
-                '%d %B %Y',      # "13 December 2025"
-                '%b %d, %Y',     # "Dec 13, 2025"
-                '%B %d, %Y',     # "December 13, 2025"
-                '%d/%m/%Y',      # "13/12/2025"
-                '%d-%m-%Y',      # "13-12-2025"
-                '%Y-%m-%d',      # "2025-12-13"
-                '%Y/%m/%d',      # "2025/12/13"
-            ]
-            
-            for fmt in formats:
+            # Fast path for ISO-8601 strings such as "2025-12-13" or "2025-12-13T10:00:00Z"
+            if len(date_str) >= 10 and date_str[4] == '-':
                 try:
-                    dt = datetime.strptime(date_str, fmt)
-                    return dt.strftime('%m/%d/%Y')
+                    return datetime.fromisoformat(date_str.replace('Z', '+00:00')).strftime('%m/%d/%Y')
                 except ValueError:
-                    continue
+                    pass
             
-            # Try to parse with dateutil if available
-            try:
-                from dateutil import parser
-                dt = parser.parse(date_str)
+            dt = self.strptime_any(date_str, self.DATE_FORMATS)
+            if dt:
                 return dt.strftime('%m/%d/%Y')
-            except:
-                pass
+            
+            # Try to parse with dateutil if available
+            if _dateutil_parser is not None:
+                try:
+                    dt = _dateutil_parser.parse(date_str)
+                    return dt.strftime('%m/%d/%Y')
+                except (ValueError, OverflowError):
+                    pass
             
             return date_str
         except Exception as e:
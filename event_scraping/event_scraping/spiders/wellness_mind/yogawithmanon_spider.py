@@ -1,8 +1,30 @@
 import scrapy
 import re
 import time
+from datetime import datetime
+from parsel.csstranslator import HTMLTranslator
 from ..base_spider import BaseSpider
 from ...items import EventScrapingItem
+from ...utils.common import SeenEventFilter
+
+
+_css_translator = HTMLTranslator()
+
+
+def _to_xpath(css):
+    """Translate a CSS selector (including ::text / ::attr) to XPath once, at import time."""
+    return _css_translator.css_to_xpath(css)
+
+
+def _outermost_xpath(css):
+    """XPath for elements matching a single-step CSS selector that are not nested in another match.
+
+    Used for text containers read with string(.), so nested matches (e.g. an
+    .entry-content inside a .site-content) do not repeat the same text.
+    """
+    xpath = _to_xpath(css)
+    step = xpath[len('descendant-or-self::'):]
+    return f"{xpath}[not(ancestor::{step})]"
 
 
 class YogaWithManonSpider(BaseSpider):
@@ -19,9 +41,96 @@ class YogaWithManonSpider(BaseSpider):
         "https://yogawithmanon.co.uk/retreats/"
     ]
     
+    # Geocoding happens in GeocodePipeline so parse callbacks never wait on the geocoder
+    geocode_in_pipeline = True
+    custom_settings = {
+        'ITEM_PIPELINES': {
+            'event_scraping.pipelines.GeocodePipeline': 300,
+        },
+    }
+    
+    # "Location", "Location:" or "Location -" anywhere in an address. The old
+    # ^location variants are covered because \b also matches at the start
+    LOCATION_PREFIX_RE = re.compile(r'\blocation\s*:?\s*-?\s*', re.IGNORECASE)
+    
+    # Address containers in one compound selector (.address, .location, .venue and
+    # .event-location are all covered by the substring matches)
+    ADDRESS_XPATH = _to_xpath('[class*="address"]::text, [class*="location"]::text, [class*="venue"]::text')
+    
+    # Selectors for the listing and event pages. They are kept as CSS for readability
+    # and translated to XPath when the class is created, so responses are queried
+    # with response.xpath() and never go through cssselect
+    
+    # Event link candidates as one compound selector, i.e. a single XPath union that
+    # lxml evaluates in one pass (matches come back once each, in document order)
+    EVENT_LINKS_XPATH = _to_xpath(', '.join((
+        'a[href*="/retreats/"]::attr(href)',
+        'a[href*="/retreat/"]::attr(href)',
+        '[class*="retreat"] a::attr(href)',
+        '[class*="event"] a::attr(href)',
+        'article a::attr(href)',
+        '.event-card a::attr(href)',
+        '[class*="Event"] a::attr(href)',
+        'a[href*="yogawithmanon.co.uk/retreat"]::attr(href)',
+    )))
+    # Title, description and date selectors are tried in order
+    TITLE_XPATHS = tuple(_to_xpath(css) for css in (
+        'h1::text',
+        '.event-title::text',
+        '.title::text',
+        'h1 *::text',
+        '[class*="event-title"]::text',
+        '[class*="title"]::text',
+        'h2::text',
+    ))
+    # Description sources as (xpath, is_container). Containers are read with a single
+    # string(.) call (text joined by lxml) and split into lines, rather than pulling
+    # every descendant text node into Python
+    DESCRIPTION_SOURCES = (
+        (_outermost_xpath('.description'), True),
+        (_outermost_xpath('.event-description'), True),
+        (_outermost_xpath('.content'), True),
+        (_outermost_xpath('article'), True),
+        (_outermost_xpath('.event-details'), True),
+        (_to_xpath('p::text'), False),
+        (_outermost_xpath('[class*="description"]'), True),
+        (_outermost_xpath('[class*="content"]'), True),
+    )
+    DATE_XPATHS = tuple((css, _to_xpath(css)) for css in (
+        '.date::text',
+        'time::attr(datetime)',
+        '.event-date::text',
+        '[class*="date"]::text',
+        'time::text',
+    ))
+    
+    # Month name/abbreviation -> two-digit month number
+    MONTH_NAMES = {
+        'january': '01', 'february': '02', 'march': '03', 'april': '04',
+        'may': '05', 'june': '06', 'july': '07', 'august': '08',
+        'september': '09', 'october': '10', 'november': '11', 'december': '12',
+        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+        'jun': '06', 'jul': '07', 'aug': '08',
+        'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+    }
+    
+    # (compiled pattern, month map or None, year comes first) tried in order by convert_date_format
+    DATE_PATTERNS = (
+        (re.compile(r'(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]{3,9}),?\s+(\d{4})', re.IGNORECASE), MONTH_NAMES, False),
+        (re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})', re.IGNORECASE), MONTH_NAMES, False),
+        (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), None, False),
+        (re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})'), None, False),
+        (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'), None, True),
+    )
+    
+    DATE_FORMATS = (
+        '%d %B %Y', '%d %b %Y', '%d/%m/%Y', '%d-%m-%Y',
+        '%Y-%m-%d', '%B %d, %Y', '%b %d, %Y',
+    )
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.seen_events = set()  # Track seen events to avoid duplicates
+        self.seen_events = SeenEventFilter()  # Track seen events to avoid duplicates
         self.geocoding_cache = {}  # Cache geocoding results to avoid repeated API calls
         self.total_items_scraped = 0
 
@@ -33,39 +142,27 @@ class YogaWithManonSpider(BaseSpider):
         # Find event links on the page
         self.logger.info("Extracting event links from page...")
         
-        # Try multiple selectors for event links
-        event_link_selectors = [
-            'a[href*="/retreats/"]::attr(href)',
-            'a[href*="/retreat/"]::attr(href)',
-            '[class*="retreat"] a::attr(href)',
-            '[class*="event"] a::attr(href)',
-            'article a::attr(href)',
-            '.event-card a::attr(href)',
-            '[class*="Event"] a::attr(href)',
-            'a[href*="yogawithmanon.co.uk/retreat"]::attr(href)',
-        ]
-        
         event_links_found = 0
         seen_urls = set()
         
-        for selector in event_link_selectors:
-            links = response.css(selector).getall()
-            for link in links:
-                if link:
-                    absolute_url = response.urljoin(link)
-                    # Filter for actual event pages (not listing pages)
-                    if '/retreats/' in absolute_url or '/retreat/' in absolute_url:
-                        if absolute_url != response.url and \
-                           absolute_url not in seen_urls and \
-                           absolute_url not in self.seen_events:
-                            seen_urls.add(absolute_url)
-                            self.seen_events.add(absolute_url)
-                            event_links_found += 1
-                            self.logger.info(f"Found event link #{event_links_found}: {absolute_url}")
-                            try:
-                                yield response.follow(link, self.parse_event, errback=self.handle_error)
-                            except Exception as e:
-                                self.logger.error(f"Error following event link {link}: {e}")
+        # All candidate links in one pass; drop repeated hrefs before resolving them
+        links = dict.fromkeys(response.xpath(self.EVENT_LINKS_XPATH).getall())
+        for link in links:
+            if link:
+                absolute_url = response.urljoin(link)
+                # Filter for actual event pages (not listing pages)
+                if '/retreats/' in absolute_url or '/retreat/' in absolute_url:
+                    if absolute_url != response.url and \
+                       absolute_url not in seen_urls and \
+                       absolute_url not in self.seen_events:
+                        seen_urls.add(absolute_url)
+                        self.seen_events.add(absolute_url)
+                        event_links_found += 1
+                        self.logger.info(f"Found event link #{event_links_found}: {absolute_url}")
+                        try:
+                            yield response.follow(link, self.parse_event, errback=self.handle_error)
+                        except Exception as e:
+                            self.logger.error(f"Error following event link {link}: {e}")
         
         self.logger.info(f"Total event links found: {event_links_found}")
         
@@ -92,34 +189,26 @@ class YogaWithManonSpider(BaseSpider):
         item['url'] = response.url
 
         # Extract title
-        title = (
-            response.css('h1::text').get() or
-            response.css('.event-title::text').get() or
-            response.css('.title::text').get() or
-            response.css('h1 *::text').get() or
-            response.css('[class*="event-title"]::text').get() or
-            response.css('[class*="title"]::text').get() or
-            response.css('h2::text').get()
-        )
+        title = None
+        for xpath in self.TITLE_XPATHS:
+            title = response.xpath(xpath).get()
+            if title:
+                break
         
         if title:
             title = title.strip()
         
         # Extract description
         desc_parts = []
-        desc_selectors = [
-            '.description *::text',
-            '.event-description *::text',
-            '.content *::text',
-            'article *::text',
-            '.event-details *::text',
-            'p::text',
-            '[class*="description"] *::text',
-            '[class*="content"] *::text',
-        ]
-        
-        for selector in desc_selectors:
-            parts = response.css(selector).getall()
+        for xpath, is_container in self.DESCRIPTION_SOURCES:
+            if is_container:
+                parts = [
+                    line
+                    for text in response.xpath(xpath).xpath('string(.)').getall()
+                    for line in text.split('\n')
+                ]
+            else:
+                parts = response.xpath(xpath).getall()
             if parts:
                 desc_parts = [part.strip() for part in parts if part.strip()]
                 if desc_parts:
@@ -128,15 +217,9 @@ class YogaWithManonSpider(BaseSpider):
         # Extract date
         date = None
         raw_date = None
-        date_selectors = [
-            ('.date::text', response.css('.date::text').get()),
-            ('time::attr(datetime)', response.css('time::attr(datetime)').get()),
-            ('.event-date::text', response.css('.event-date::text').get()),
-            ('[class*="date"]::text', response.css('[class*="date"]::text').get()),
-            ('time::text', response.css('time::text').get()),
-        ]
-        
-        for selector_name, selector_result in date_selectors:
+        # Evaluate selectors lazily so we stop at the first one that matches
+        for selector_name, xpath in self.DATE_XPATHS:
+            selector_result = response.xpath(xpath).get()
             if selector_result:
                 date = selector_result.strip()
                 raw_date = date
@@ -147,34 +230,23 @@ class YogaWithManonSpider(BaseSpider):
         if address:
             address = self.remove_location_text(address)
         
-        # Extract coordinates
+        # Extract coordinates (GeocodePipeline geocodes the address if none are on the page)
         coords = self.extract_coordinates(response)
         
-        # Build event_data for database check before geocoding
-        event_data = {
-            'name': title,
-            'date': date,
-            'url': response.url
-        }
-        
-        # Pass event_data to enable database check before geocoding
-        if address:
-            geocoded_coords = self.geocode_address(address, event_data=event_data)
-            if geocoded_coords:
-                if not coords:
-                    coords = geocoded_coords
-        
         # Convert date format
         if date:
             date = self.convert_date_format(date)
         
-        # Short description
+        # Short description and the full text (joined once, here)
         short_description = None
+        full_description = None
         if desc_parts:
-            joined = '\n'.join(desc_parts).strip()
-            short_description = joined.split('\n')[0]
+            full_description = ' '.join(desc_parts)
+            # First line of the description; parts are already stripped and non-empty,
+            # so there is no need to join them all just to split the first one back out
+            short_description = desc_parts[0].partition('\n')[0]
             if len(short_description) > 200:
-                short_description = short_description[:200].rsplit(' ', 1)[0] + '...'
+                short_description = f"{short_description[:200].rsplit(' ', 1)[0]}..."
         
         # Set item fields
         item['name'] = self.clean_text(title) if title else None
@@ -189,13 +261,13 @@ class YogaWithManonSpider(BaseSpider):
             'title': title,
             'date': raw_date,
             'desc_preview': short_description,
-            'full_description': ' '.join(desc_parts) if desc_parts else None,
+            'full_description': full_description,
             'address': address,
             'coordinates': coords,
         }
         
         # Check for duplicates
-        item_key = f"{item['name']}_{item['date']}"
+        item_key = (item['name'], item['date'])
         if item_key in self.seen_events:
             self.logger.debug(f"Skipping duplicate item: {item['name']}")
             return
@@ -236,7 +308,7 @@ class YogaWithManonSpider(BaseSpider):
             desc = ' '.join(card.css('p::text, [class*="description"]::text').getall())
             
             # Extract address
-            address = ' '.join(card.css('[class*="location"], [class*="address"]::text').getall())
+            address = ' '.join(card.css('[class*="location"], [class*="address"]::text').getall()).strip()
             if address:
                 address = self.remove_location_text(address)
             
@@ -244,21 +316,11 @@ class YogaWithManonSpider(BaseSpider):
             if date:
                 date = self.convert_date_format(date)
             
-            # Build event_data for database check before geocoding
-            geocode_event_data = {
-                'name': title,
-                'date': date,
-                'url': response.url
-            }
-            
-            # Geocode address
-            # Pass event_data to enable database check before geocoding
+            # Coordinates are filled in by GeocodePipeline
             coords = None
-            if address:
-                coords = self.geocode_address(address, event_data=geocode_event_data)
             
             # Short description
-            short_description = desc[:200] + '...' if len(desc) > 200 else desc
+            short_description = f"{desc[:200]}..." if len(desc) > 200 else desc
             
             item['name'] = self.clean_text(title) if title else None
             item['date'] = date
@@ -278,7 +340,7 @@ class YogaWithManonSpider(BaseSpider):
             }
             
             # Check for duplicates
-            item_key = f"{item['name']}_{item['date']}"
+            item_key = (item['name'], item['date'])
             if item_key in self.seen_events:
                 return None
             
@@ -295,34 +357,18 @@ class YogaWithManonSpider(BaseSpider):
         if not address:
             return address
         
-        patterns_to_remove = [
-            r'^location\s*:?\s*-?\s*',
-            r'^location\s+',
-            r'\blocation\s*:?\s*-?\s*',
-        ]
-        
-        cleaned_address = address
-        for pattern in patterns_to_remove:
-            cleaned_address = re.sub(pattern, '', cleaned_address, flags=re.IGNORECASE)
-        
-        cleaned_address = re.sub(r'\s+', ' ', cleaned_address).strip()
+        cleaned_address = self.LOCATION_PREFIX_RE.sub('', address)
+        cleaned_address = ' '.join(cleaned_address.split())
         return cleaned_address if cleaned_address else address
 
     def extract_address(self, response):
-        """Extract full address from the page."""
-        address_selectors = [
-            '.address::text',
-            '.location::text', 
-            '.venue::text',
-            '.event-location::text',
-            '[class*="address"]::text',
-            '[class*="location"]::text',
-            '[class*="venue"]::text',
-        ]
-        
-        for selector in address_selectors:
-            address = response.css(selector).get()
-            if address and len(address.strip()) > 5:
+        """Extract full address from the page.
+
+        A single compound selector walks the document once; the first text
+        node (in document order) longer than 5 characters wins.
+        """
+        for address in response.xpath(self.ADDRESS_XPATH).getall():
+            if len(address.strip()) > 5:
                 return self.clean_text(address)
         
         return None
@@ -333,55 +379,33 @@ class YogaWithManonSpider(BaseSpider):
             return None
         
         try:
-            from datetime import datetime
-            
             date_str = date_str.strip()
-            month_names = {
-                'january': '01', 'february': '02', 'march': '03', 'april': '04',
-                'may': '05', 'june': '06', 'july': '07', 'august': '08',
-                'september': '09', 'october': '10', 'november': '11', 'december': '12',
-                'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-                'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-                'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-            }
             
-            patterns = [
-                (r'(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]{3,9}),?\s+(\d{4})', month_names),
-                (r'(\d{1,2})\s+(\w+)\s+(\d{4})', month_names),
-                (r'(\d{1,2})/(\d{1,2})/(\d{4})', None),
-                (r'(\d{1,2})-(\d{1,2})-(\d{4})', None),
-                (r'(\d{4})-(\d{1,2})-(\d{1,2})', None),
-            ]
+            # Fast path for ISO-8601 strings, e.g. from time::attr(datetime)
+            if len(date_str) >= 10 and date_str[4] == '-':
+                try:
+                    return datetime.fromisoformat(date_str.replace('Z', '+00:00')).strftime('%m/%d/%Y')
+                except ValueError:
+                    pass
             
-            for pattern, month_map in patterns:
-                match = re.search(pattern, date_str, re.IGNORECASE)
+            for pattern, month_map, year_first in self.DATE_PATTERNS:
+                match = pattern.search(date_str)
                 if match:
                     if month_map:
                         day, month_name, year = match.groups()
                         month_num = month_map.get(month_name.lower())
                         if month_num:
                             return f"{month_num}/{day.zfill(2)}/{year}"
+                    elif year_first:
+                        year, month, day = match.groups()
+                        return f"{month.zfill(2)}/{day.zfill(2)}/{year}"
                     else:
-                        parts = match.groups()
-                        if len(parts) == 3:
-                            if pattern.startswith(r'(\d{4})'):
-                                year, month, day = parts
-                                return f"{month.zfill(2)}/{day.zfill(2)}/{year}"
-                            else:
-                                day, month, year = parts
-                                return f"{month.zfill(2)}/{day.zfill(2)}/{year}"
-            
-            formats = [
-                '%d %B %Y', '%d %b %Y', '%d/%m/%Y', '%d-%m-%Y',
-                '%Y-%m-%d', '%B %d, %Y', '%b %d, %Y',
-            ]
+                        day, month, year = match.groups()
+                        return f"{month.zfill(2)}/{day.zfill(2)}/{year}"
             
-            for fmt in formats:
-                try:
-                    parsed_date = datetime.strptime(date_str, fmt)
-                    return parsed_date.strftime('%m/%d/%Y')
-                except ValueError:
-                    continue
+            parsed_date = self.strptime_any(date_str, self.DATE_FORMATS)
+            if parsed_date:
+                return parsed_date.strftime('%m/%d/%Y')
             
             return date_str
             
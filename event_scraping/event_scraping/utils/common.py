@@ -1,7 +1,52 @@
 """Common utilities for all spiders."""
+import asyncio
+import hashlib
+import json
+import random
 import re
+import sqlite3
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from mysql.connector import pooling as mysql_pooling
+except ImportError:
+    mysql_pooling = None
+
+# db_connection.py lives in the Scrapy project root (two levels above this package).
+# Put it on sys.path once at import time instead of on every duplicate check
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 
 def clean_text(text):
@@ -19,16 +64,129 @@ def extract_date(date_str):
 
 def get_absolute_url(base_url, relative_url):
     """Convert relative URL to absolute URL."""
-    from urllib.parse import urljoin
     return urljoin(base_url, relative_url)
 
 
-def geocode_locationiq(address, api_key):
+class _RateLimiter:
+    """Minimum spacing between calls to one geocoding provider.
+
+    Each acquire() reserves the next free slot and only sleeps for whatever
+    is left of the interval, so calls that are already spaced out (e.g. by a
+    slow HTTP round-trip) do not wait at all. Safe to share between threads.
+    """
+
+    def __init__(self, calls, period):
+        self._interval = period / calls
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.perf_counter()
+            wait = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+_thread_state = threading.local()
+
+
+def _thread_session():
+    """Return a requests.Session owned by the calling thread.
+
+    The geocoders use it whenever no session is passed in, so TCP/TLS
+    connections are kept alive across calls instead of being rebuilt per
+    request. Sessions are not documented as thread-safe, so every thread
+    (spider worker threads, geocode_addresses workers) gets its own.
+    """
+    session = getattr(_thread_state, 'session', None)
+    if session is None:
+        session = requests.Session()
+        # Retries are handled explicitly by the geocoders, not by urllib3
+        session.mount('https://', HTTPAdapter(pool_maxsize=16, max_retries=0))
+        _thread_state.session = session
+    return session
+
+
+# LocationIQ free tier: 2 requests/second
+_LOCATIONIQ_LIMITER = _RateLimiter(calls=2, period=1.0)
+# Nominatim usage policy: at most 1 request/second (small safety margin)
+_NOMINATIM_LIMITER = _RateLimiter(calls=1, period=1.1)
+
+# Throttling / transient gateway statuses worth retrying
+_RETRY_STATUSES = frozenset({429, 503, 504, 520})
+_MAX_BACKOFF_SECS = 8
+_MAX_RETRY_AFTER_SECS = 60
+# (connect, read) seconds. Connecting should be quick, but a congested Nominatim
+# free tier often takes well over 10 s to answer; a short read timeout only
+# turns slow answers into retry storms (and risks an IP ban)
+_GEOCODE_TIMEOUT = (5, 20)
+# Read timeouts retried (with backoff) before the timeout is re-raised
+_MAX_TIMEOUT_RETRIES = 2
+
+_LOCATIONIQ_URL = "https://us1.locationiq.com/v1/search.php"
+_NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+# Query parameters shared by every request; only the address (and API key) change per call
+_GEOCODE_BASE_PARAMS = {
+    'format': 'json',
+    'limit': 1,
+    'countrycodes': 'gb',  # UK only
+    'addressdetails': 1
+}
+
+
+def _decode_json(body):
+    """Decode a JSON response body (bytes), with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _get_with_backoff(http, limiter, url, max_retries=5, base_delay=0.5, **kwargs):
+    """GET url through the provider limiter, retrying throttled responses.
+    
+    429/503/504/520 responses are retried with exponential backoff plus
+    jitter, honouring a numeric Retry-After header (capped at a minute).
+    The last response is returned once retries run out, so callers keep
+    their existing status handling.
+    
+    A read timeout means the provider is overloaded: it is retried after the
+    same kind of backoff at most _MAX_TIMEOUT_RETRIES times and then
+    re-raised as requests.exceptions.ReadTimeout.
+    """
+    timeouts = 0
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        try:
+            response = http.get(url, **kwargs)
+        except requests.exceptions.ReadTimeout:
+            timeouts += 1
+            if timeouts > _MAX_TIMEOUT_RETRIES or attempt == max_retries:
+                raise
+            time.sleep(min(base_delay * 2 ** attempt, _MAX_BACKOFF_SECS) + random.random() * 0.25)
+            continue
+        if response.status_code not in _RETRY_STATUSES or attempt == max_retries:
+            return response
+        
+        delay = min(base_delay * 2 ** attempt, _MAX_BACKOFF_SECS) + random.random() * 0.25
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), _MAX_RETRY_AFTER_SECS))
+            except ValueError:
+                pass  # HTTP-date form; keep the computed backoff
+        time.sleep(delay)
+    return response
+
+
+def geocode_locationiq(address, api_key, session=None):
     """Geocode using LocationIQ API.
     
     Args:
         address (str): Address to geocode
         api_key (str): LocationIQ API key
+        session (requests.Session, optional): Session to use; defaults to this thread's shared session
         
     Returns:
         dict: {'lat': float, 'lon': float} or None
@@ -36,102 +194,183 @@ def geocode_locationiq(address, api_key):
     Raises:
         Exception: If geocoding fails
     """
-    import requests
-    
-    url = "https://us1.locationiq.com/v1/search.php"
-    params = {
-        'key': api_key,
-        'q': address,
-        'format': 'json',
-        'limit': 1,
-        'countrycodes': 'gb',  # UK only
-        'addressdetails': 1
-    }
+    params = {**_GEOCODE_BASE_PARAMS, 'key': api_key, 'q': address}
     
-    # Rate limiting: LocationIQ allows 2 requests/second (free tier)
-    # Reduced delay for faster processing - adjust if you hit rate limits
-    time.sleep(0.1)
+    # Rate limiting: LocationIQ allows 2 requests/second (free tier); throttled responses are retried
+    http = session if session is not None else _thread_session()
+    response = _get_with_backoff(http, _LOCATIONIQ_LIMITER, _LOCATIONIQ_URL, params=params, timeout=_GEOCODE_TIMEOUT)
     
-    response = requests.get(url, params=params, timeout=10)
+    _check_locationiq_status(response.status_code)
+    return _locationiq_coords(_decode_json(response.content))
+
+
+class GeocodeNoResult(Exception):
+    """A geocoding service answered and has no UK match for the address.
+
+    Unlike timeouts, throttling and server errors, this is a definitive miss
+    that is worth remembering (see _remember_miss).
+    """
+
+
+def _check_locationiq_status(status):
+    """Raise for LocationIQ error status codes."""
+    # LocationIQ answers 404 "Unable to geocode" when it has no match
+    if status == 404:
+        raise GeocodeNoResult("No results from LocationIQ")
     
     # Handle specific error codes
-    if response.status_code == 403 or response.status_code == 401:
-        raise Exception(f"LocationIQ authentication failed (status {response.status_code})")
-    
-    if response.status_code == 429:
-        raise Exception(f"LocationIQ rate limit exceeded (status {response.status_code})")
+    if status == 403 or status == 401:
+        raise Exception(f"LocationIQ authentication failed (status {status})")
     
-    if response.status_code != 200:
-        raise Exception(f"LocationIQ returned status {response.status_code}")
-    
-    data = response.json()
+    if status == 429:
+        raise Exception(f"LocationIQ rate limit exceeded (status {status})")
     
+    if status != 200:
+        raise Exception(f"LocationIQ returned status {status}")
+
+
+def _locationiq_coords(data):
+    """Extract UK coordinates from a decoded LocationIQ response, raising on errors."""
     # LocationIQ returns error as dict with 'error' key
     if isinstance(data, dict) and 'error' in data:
         raise Exception(f"LocationIQ error: {data.get('error', 'Unknown error')}")
     
     if not data or not isinstance(data, list) or len(data) == 0:
-        raise Exception("No results from LocationIQ")
+        raise GeocodeNoResult("No results from LocationIQ")
     
     lat = float(data[0]['lat'])
     lon = float(data[0]['lon'])
     
     # Validate coordinates are within UK bounds
     if not (49 <= lat <= 61 and -8 <= lon <= 2):
-        raise Exception(f"Coordinates {lat}, {lon} are outside UK bounds")
+        raise GeocodeNoResult(f"Coordinates {lat}, {lon} are outside UK bounds")
     
     return {'lat': lat, 'lon': lon}
 
 
-def geocode_nominatim(address, user_agent='EventScrapingBot/1.0'):
+def geocode_nominatim(address, user_agent='EventScrapingBot/1.0', session=None):
     """Geocode using Nominatim (OpenStreetMap) API.
     
     Args:
         address (str): Address to geocode
         user_agent (str): User agent string for the request
+        session (requests.Session, optional): Session to use; defaults to this thread's shared session
+        
+    The free Nominatim service is often slow under load, so requests use a
+    generous read timeout (_GEOCODE_TIMEOUT: 5 s connect, 20 s read).
         
     Returns:
         dict: {'lat': float, 'lon': float} or None
         
     Raises:
+        requests.exceptions.ReadTimeout: If Nominatim keeps timing out after backoff
         Exception: If geocoding fails
     """
-    import requests
-    
-    url = "https://nominatim.openstreetmap.org/search"
-    params = {
-        'q': address,
-        'format': 'json',
-        'limit': 1,
-        'countrycodes': 'gb',  # UK only
-        'addressdetails': 1
-    }
+    params = {**_GEOCODE_BASE_PARAMS, 'q': address}
     
     headers = {
         'User-Agent': user_agent
     }
     
-    # Rate limiting (Nominatim requirement: 1 request per second)
-    time.sleep(1.1)
+    # Rate limiting (Nominatim requirement: 1 request per second); throttled responses are retried
+    http = session if session is not None else _thread_session()
+    response = _get_with_backoff(http, _NOMINATIM_LIMITER, _NOMINATIM_URL, params=params, headers=headers, timeout=_GEOCODE_TIMEOUT)
     
-    response = requests.get(url, params=params, headers=headers, timeout=10)
-    
-    if response.status_code == 200:
-        data = response.json()
-        if data:
-            lat = float(data[0]['lat'])
-            lon = float(data[0]['lon'])
-            
-            # Validate UK bounds
-            if 49 <= lat <= 61 and -8 <= lon <= 2:
-                return {'lat': lat, 'lon': lon}
-    else:
+    if response.status_code != 200:
         raise Exception(f"Nominatim returned status {response.status_code}")
+    return _nominatim_coords(_decode_json(response.content))
+
+
+def _nominatim_coords(data):
+    """Extract UK coordinates from a decoded Nominatim response, or None."""
+    if data:
+        lat = float(data[0]['lat'])
+        lon = float(data[0]['lon'])
+        
+        # Validate UK bounds
+        if 49 <= lat <= 61 and -8 <= lon <= 2:
+            return {'lat': lat, 'lon': lon}
     
     return None
 
 
-def geocode_address(address, locationiq_api_key=None, user_agent='EventScrapingBot/1.0', cache=None):
+# Address values that never resolve to a venue ("TBA", "Online", "N/A", ...)
+NON_GEOCODABLE_ADDRESSES = frozenset({
+    'tba', 'tbc', 'tbd', 'online', 'virtual', 'remote', 'n/a', 'na', 'uk', 'united kingdom',
+})
+# An address needs at least one real word; 3 letters so short town names like "Ely" pass
+_WORD_RE = re.compile(r'[a-z]{3,}', re.IGNORECASE)
+
+
+def is_geocodable_address(address):
+    """Cheap CPU-side check that an address is worth a geocoding request.
+    
+    Rejects empty strings, strings without a real word (digits, dashes) and
+    placeholders like "UK", "Online" or "TBA" that never resolve to a venue.
+    Used both here on cache keys and by BaseSpider before it queues a lookup.
+    
+    Args:
+        address (str): Raw address or geocode_cache_key() of one
+        
+    Returns:
+        bool: True if the address could geocode to a venue
+    """
+    if not address:
+        return False
+    key = ' '.join(address.split()).lower()
+    if key in NON_GEOCODABLE_ADDRESSES:
+        return False
+    return _WORD_RE.search(key) is not None
+
+
+def geocode_cache_key(address):
+    """Canonical geocoding cache key: location prefixes stripped, whitespace collapsed, lowercased.
+    
+    "Location: 10 Downing St " and "10 downing st" share one entry; the original string
+    is still what gets sent to the geocoding services. BaseSpider keys its geocode
+    caches with this too, so every cache agrees on what counts as the same address.
+    """
+    return remove_location_text(address).lower()
+
+
+# Definitive misses (every provider tried answered "no result"), by geocode_cache_key(). Kept in
+# memory only and for NEGATIVE_TTL seconds: they never go into the caller's cache, which
+# may be persisted, and timeouts / throttling / server errors are not recorded at all,
+# so a provider outage cannot mark addresses as ungeocodable
+NEGATIVE_TTL = 3600
+_RECENT_MISSES = {}
+_RECENT_MISSES_LOCK = threading.Lock()
+
+
+def _remember_miss(key):
+    """Record a definitive geocoding miss for key."""
+    with _RECENT_MISSES_LOCK:
+        _RECENT_MISSES[key] = time.monotonic()
+
+
+def _recent_miss(key):
+    """True if key had a definitive miss less than NEGATIVE_TTL seconds ago."""
+    missed_at = _RECENT_MISSES.get(key)
+    return missed_at is not None and time.monotonic() - missed_at < NEGATIVE_TTL
+
+
+def _lookup_outcome(lookup, *args, **kwargs):
+    """Run one provider lookup and classify the result.
+    
+    Returns:
+        tuple: (coords or None, definitive) where definitive is False when the
+        lookup failed for a transient reason (timeout, throttling, server error)
+    """
+    try:
+        # None from a successful response (Nominatim's empty result) is a real miss
+        return lookup(*args, **kwargs), True
+    except GeocodeNoResult:
+        return None, True
+    except Exception:
+        return None, False
+
+
+def geocode_address(address, locationiq_api_key=None, user_agent='EventScrapingBot/1.0', cache=None, session=None):
     """Geocode an address using LocationIQ first, then fallback to Nominatim.
     
     Tries services in order:
@@ -142,7 +381,9 @@ def geocode_address(address, locationiq_api_key=None, user_agent='EventScrapingB
         address (str): Address to geocode
         locationiq_api_key (str, optional): LocationIQ API key. If None, skips LocationIQ.
         user_agent (str): User agent for Nominatim requests
-        cache (dict, optional): Cache dictionary to store results. If provided, checks cache first.
+        cache (dict, optional): Cache dictionary (or open_geocode_cache() store) for results.
+            If provided, checks cache first. Keys are canonicalized with geocode_cache_key(), so cosmetic variants of an address share an entry.
+        session (requests.Session, optional): Session for both services; defaults to this thread's shared session
         
     Returns:
         dict: {'lat': float, 'lon': float} or None if all services fail
@@ -150,36 +391,419 @@ def geocode_address(address, locationiq_api_key=None, user_agent='EventScrapingB
     if not address:
         return None
     
-    # Check cache first if provided
-    if cache is not None and address in cache:
-        return cache[address]
+    # Check cache first if provided. Only coordinates are cached there; recent
+    # definitive misses are kept separately (_recent_miss)
+    key = geocode_cache_key(address)
+    if cache is not None:
+        coords = cache.get(key)
+        if coords:
+            return coords
+    if _recent_miss(key):
+        return None
+    
+    # Placeholders and junk strings are a guaranteed miss: skip the network entirely
+    if not is_geocodable_address(key):
+        return None
+    
+    definitive = True
+    
+    # Try LocationIQ first (if API key is provided); on failure try Nominatim
+    if locationiq_api_key:
+        coords, definitive = _lookup_outcome(geocode_locationiq, address, locationiq_api_key, session=session)
+        if coords:
+            # Store in cache if provided
+            if cache is not None:
+                cache[key] = coords
+            return coords
+    
+    # Fallback to Nominatim (OpenStreetMap)
+    coords, nominatim_definitive = _lookup_outcome(geocode_nominatim, address, user_agent, session=session)
+    if coords:
+        # Store in cache if provided
+        if cache is not None:
+            cache[key] = coords
+        return coords
+    
+    # Only a "no result" from every provider tried is remembered, and only for a while
+    if definitive and nominatim_definitive:
+        _remember_miss(key)
+    return None
+
+
+def geocode_locationiq_batch(addresses, api_key, max_workers=2):
+    """Geocode a list of addresses with LocationIQ, returning results aligned with the input.
+    
+    LocationIQ has no bulk forward-geocoding endpoint, so this sends the
+    lookups over kept-alive per-thread sessions (one TLS handshake per
+    worker, not per address) under the shared 2 requests/second limiter.
+    Repeated addresses are only sent once.
+    
+    Args:
+        addresses (list): Addresses to geocode
+        api_key (str): LocationIQ API key
+        max_workers (int): Maximum concurrent lookups
+        
+    Returns:
+        list: {'lat': float, 'lon': float} or None for each address, in input order
+    """
+    return [coords for coords, _ in _locationiq_outcomes(addresses, api_key, max_workers)]
+
+
+def _locationiq_outcomes(addresses, api_key, max_workers=2):
+    """geocode_locationiq_batch returning _lookup_outcome() pairs instead of bare coordinates."""
+    def lookup(address):
+        return _lookup_outcome(geocode_locationiq, address, api_key)
+    
+    unique = list(dict.fromkeys(addresses))
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        found = dict(zip(unique, executor.map(lookup, unique)))
+    return [found[address] for address in addresses]
+
+
+def geocode_addresses(addresses, locationiq_api_key=None, user_agent='EventScrapingBot/1.0', cache=None, max_workers=2):
+    """Geocode many addresses concurrently with a bounded thread pool.
+    
+    Duplicates (after geocode_cache_key canonicalization) and addresses already in
+    `cache` are not looked up again. All remaining addresses go through
+    geocode_locationiq_batch first; only its misses are sent to Nominatim.
+    Each worker thread uses its own requests.Session, and the provider rate
+    limiters are shared, so `max_workers` only controls how many requests
+    may be in flight at once (2 suits the LocationIQ free tier).
+    
+    Args:
+        addresses (iterable): Addresses to geocode
+        locationiq_api_key (str, optional): LocationIQ API key. If None, skips LocationIQ.
+        user_agent (str): User agent for Nominatim requests
+        cache (dict, optional): Cache dictionary keyed by geocode_cache_key(address),
+            read before and updated after lookups
+        max_workers (int): Maximum concurrent lookups
+        
+    Returns:
+        dict: address -> {'lat': float, 'lon': float} or None
+    """
+    results = {}
+    # canonical key -> addresses sharing it; only the first spelling is sent to the API
+    pending = {}
+    for address in dict.fromkeys(a for a in addresses if a):
+        key = geocode_cache_key(address)
+        cached = cache.get(key) if cache is not None else None
+        if cached:
+            results[address] = cached
+        elif _recent_miss(key) or not is_geocodable_address(key):
+            # Recent definitive miss or guaranteed miss; not worth a rate-limit slot
+            results[address] = None
+        else:
+            pending.setdefault(key, []).append(address)
+    
+    if not pending:
+        return results
+    
+    keys = list(pending)
+    queries = [pending[key][0] for key in keys]
     
-    # Try LocationIQ first (if API key is provided)
+    # LocationIQ for the whole batch first
+    if locationiq_api_key:
+        outcomes = _locationiq_outcomes(queries, locationiq_api_key, max_workers)
+    else:
+        outcomes = [(None, True)] * len(queries)
+    found = [coords for coords, _ in outcomes]
+    definitive = [sure for _, sure in outcomes]
+    
+    # Nominatim only for what LocationIQ missed
+    def lookup_nominatim(index):
+        return _lookup_outcome(geocode_nominatim, queries[index], user_agent)
+    
+    misses = [index for index, coords in enumerate(found) if not coords]
+    if misses:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for index, (coords, sure) in zip(misses, executor.map(lookup_nominatim, misses)):
+                found[index] = coords
+                definitive[index] = definitive[index] and sure
+    
+    for key, coords, sure in zip(keys, found, definitive):
+        for address in pending[key]:
+            results[address] = coords
+        if coords:
+            if cache is not None:
+                cache[key] = coords
+        elif sure:
+            _remember_miss(key)
+    
+    return results
+
+
+class _AsyncRateLimiter:
+    """asyncio counterpart of _RateLimiter: minimum spacing between calls to one provider."""
+
+    def __init__(self, calls, period):
+        self._interval = period / calls
+        self._lock = asyncio.Lock()
+        self._next_allowed = 0.0
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.perf_counter()
+            wait = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+async def _get_with_backoff_async(session, limiter, url, max_retries=5, base_delay=0.5, **kwargs):
+    """aiohttp version of _get_with_backoff; returns (status, decoded JSON or None)."""
+    for attempt in range(max_retries + 1):
+        await limiter.acquire()
+        async with session.get(url, **kwargs) as response:
+            status = response.status
+            if status not in _RETRY_STATUSES or attempt == max_retries:
+                data = _decode_json(await response.read()) if status == 200 else None
+                return status, data
+            retry_after = response.headers.get('Retry-After')
+        
+        delay = min(base_delay * 2 ** attempt, _MAX_BACKOFF_SECS) + random.random() * 0.25
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), _MAX_RETRY_AFTER_SECS))
+            except ValueError:
+                pass  # HTTP-date form; keep the computed backoff
+        await asyncio.sleep(delay)
+
+
+async def geocode_locationiq_async(session, address, api_key, limiter):
+    """Geocode using LocationIQ over an aiohttp session (see geocode_locationiq).
+    
+    Raises:
+        Exception: If geocoding fails
+    """
+    params = {**_GEOCODE_BASE_PARAMS, 'key': api_key, 'q': address}
+    status, data = await _get_with_backoff_async(session, limiter, _LOCATIONIQ_URL, params=params)
+    _check_locationiq_status(status)
+    return _locationiq_coords(data)
+
+
+async def geocode_nominatim_async(session, address, user_agent, limiter):
+    """Geocode using Nominatim over an aiohttp session (see geocode_nominatim).
+    
+    Raises:
+        Exception: If the request fails
+    """
+    params = {**_GEOCODE_BASE_PARAMS, 'q': address}
+    headers = {'User-Agent': user_agent}
+    status, data = await _get_with_backoff_async(session, limiter, _NOMINATIM_URL, params=params, headers=headers)
+    if status != 200:
+        raise Exception(f"Nominatim returned status {status}")
+    return _nominatim_coords(data)
+
+
+async def geocode_address_async(session, address, locationiq_api_key=None, user_agent='EventScrapingBot/1.0',
+                                limiters=None):
+    """LocationIQ-then-Nominatim lookup over aiohttp, mirroring geocode_address (without the cache).
+    
+    Args:
+        session (aiohttp.ClientSession): Session to send requests on
+        limiters (tuple): (LocationIQ, Nominatim) _AsyncRateLimiter pair
+        
+    Returns:
+        dict: {'lat': float, 'lon': float} or None if all services fail
+    """
+    coords, _ = await _geocode_outcome_async(session, address, locationiq_api_key, user_agent, limiters)
+    return coords
+
+
+async def _geocode_outcome_async(session, address, locationiq_api_key, user_agent, limiters):
+    """geocode_address_async returning (coords or None, definitive) like _lookup_outcome."""
+    locationiq_limiter, nominatim_limiter = limiters
+    definitive = True
     if locationiq_api_key:
         try:
-            coords = geocode_locationiq(address, locationiq_api_key)
+            coords = await geocode_locationiq_async(session, address, locationiq_api_key, locationiq_limiter)
             if coords:
-                # Store in cache if provided
-                if cache is not None:
-                    cache[address] = coords
-                return coords
-        except Exception:
-            # Silently fail and try Nominatim
+                return coords, True
+        except GeocodeNoResult:
             pass
-    
-    # Fallback to Nominatim (OpenStreetMap)
+        except Exception:
+            # Transient failure; still try Nominatim
+            definitive = False
     try:
-        coords = geocode_nominatim(address, user_agent)
+        coords = await geocode_nominatim_async(session, address, user_agent, nominatim_limiter)
+    except Exception:
+        return None, False
+    return coords, definitive or bool(coords)
+
+
+async def geocode_addresses_async(addresses, locationiq_api_key=None, user_agent='EventScrapingBot/1.0',
+                                  cache=None, max_concurrency=2):
+    """Geocode many addresses on one event loop with aiohttp.
+    
+    Same contract as geocode_addresses (canonical-key dedup, cache read and
+    updated, definitive misses remembered in memory), but lookups run as coroutines on a
+    single aiohttp.ClientSession: an asyncio.Semaphore caps requests in flight
+    and async rate limiters keep the provider limits. Without aiohttp the
+    thread-pool geocode_addresses is run in a worker thread instead.
+    
+    Args:
+        addresses (iterable): Addresses to geocode
+        locationiq_api_key (str, optional): LocationIQ API key. If None, skips LocationIQ.
+        user_agent (str): User agent for Nominatim requests
+        cache (dict, optional): Cache dictionary keyed by geocode_cache_key(address)
+        max_concurrency (int): Maximum concurrent lookups
+        
+    Returns:
+        dict: address -> {'lat': float, 'lon': float} or None
+    """
+    if aiohttp is None:
+        return await asyncio.to_thread(
+            geocode_addresses, list(addresses), locationiq_api_key, user_agent, cache, max_concurrency
+        )
+    
+    results = {}
+    # canonical key -> addresses sharing it; only the first spelling is sent to the API
+    pending = {}
+    for address in dict.fromkeys(a for a in addresses if a):
+        key = geocode_cache_key(address)
+        cached = cache.get(key) if cache is not None else None
+        if cached:
+            results[address] = cached
+        elif _recent_miss(key) or not is_geocodable_address(key):
+            # Recent definitive miss or guaranteed miss; not worth a rate-limit slot
+            results[address] = None
+        else:
+            pending.setdefault(key, []).append(address)
+    
+    if not pending:
+        return results
+    
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    # Same limits as the threaded geocoders (LocationIQ 2/s, Nominatim 1 per 1.1 s)
+    limiters = (_AsyncRateLimiter(calls=2, period=1.0), _AsyncRateLimiter(calls=1, period=1.1))
+    
+    async def bounded(key, variants):
+        async with semaphore:
+            coords, definitive = await _geocode_outcome_async(
+                session, variants[0], locationiq_api_key, user_agent, limiters
+            )
+        for address in variants:
+            results[address] = coords
         if coords:
-            # Store in cache if provided
             if cache is not None:
-                cache[address] = coords
-            return coords
-    except Exception:
-        # Silently fail
-        pass
+                cache[key] = coords
+        elif definitive:
+            _remember_miss(key)
     
-    return None
+    # Same connect/read split as the threaded geocoders (_GEOCODE_TIMEOUT)
+    connect_timeout, read_timeout = _GEOCODE_TIMEOUT
+    timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        await asyncio.gather(*(bounded(key, variants) for key, variants in pending.items()))
+    
+    return results
+
+
+class GeocodeCache:
+    """Persistent geocoding cache backed by SQLite, usable as geocode_address's `cache`.
+    
+    Behaves like a dict keyed by geocode_cache_key(address): supports `in`, `[]`, `get`
+    and `len`. Every row is loaded into memory when the cache is opened, so reads
+    never touch the disk; writes go straight through to SQLite so later runs (and
+    other spiders) get them for free. Safe to share between worker threads.
+    
+    Only coordinates are stored. Misses are never persisted: the geocoders keep
+    definitive ones in memory for NEGATIVE_TTL seconds (_remember_miss), and
+    rows with NULL coordinates left by older versions are ignored.
+    
+    Use open_geocode_cache() to create one.
+    """
+
+    def __init__(self, path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self._lock = threading.Lock()
+        # Lookups run in worker threads; all access is serialized by the lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS geocodes '
+            '(norm_addr TEXT PRIMARY KEY, lat REAL, lon REAL, ts INTEGER)'
+        )
+        self._conn.commit()
+        rows = self._conn.execute(
+            'SELECT norm_addr, lat, lon FROM geocodes WHERE lat IS NOT NULL AND lon IS NOT NULL'
+        ).fetchall()
+        self._data = {key: {'lat': lat, 'lon': lon} for key, lat, lon in rows}
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __setitem__(self, key, coords):
+        if not coords:
+            # Misses are not persisted (see the class docstring)
+            return
+        self._data[key] = coords
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute(
+                'INSERT OR REPLACE INTO geocodes (norm_addr, lat, lon, ts) VALUES (?, ?, ?, ?)',
+                (key, coords['lat'], coords['lon'], int(time.time()))
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the SQLite connection; the in-memory entries stay readable."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def open_geocode_cache(path='.geocode_cache.sqlite'):
+    """Open (or create) a persistent geocoding cache at path.
+    
+    Pass the result as the `cache` argument of geocode_address / geocode_addresses
+    so any address the project has geocoded before costs no network call.
+    
+    Args:
+        path (str): SQLite database file; parent directories are created
+        
+    Returns:
+        GeocodeCache
+    """
+    return GeocodeCache(path)
+
+
+# "Location", "Location:" or "Location -" anywhere in an address (\b also matches at the start)
+_LOCATION_PREFIX_RE = re.compile(r'\blocation\s*:?\s*-?\s*', re.IGNORECASE)
+
+# Month name mappings
+_MONTH_NAMES = {
+    'january': '01', 'february': '02', 'march': '03', 'april': '04',
+    'may': '05', 'june': '06', 'july': '07', 'august': '08',
+    'september': '09', 'october': '10', 'november': '11', 'december': '12',
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'jun': '06', 'jul': '07', 'aug': '08',
+    'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+# Day-first dates in one pass: "30th October 2025" / "30 Oct, 2025" (named month)
+# or "30/10/2025" / "30-10-2025" (numeric, same separator both times)
+_DAY_FIRST_DATE_RE = re.compile(
+    r'(?P<nday>\d{1,2})(?:st|nd|rd|th)?\s+(?P<mname>[A-Za-z]{3,9}),?\s+(?P<nyear>\d{4})'
+    r'|(?P<dday>\d{1,2})(?P<sep>[-/])(?P<dmonth>\d{1,2})(?P=sep)(?P<dyear>\d{4})',
+    re.IGNORECASE
+)
+
+# Month-first formats the regexes above do not cover ("October 30, 2025")
+_DATE_FORMATS = ('%B %d, %Y', '%b %d, %Y')
 
 
 def remove_location_text(address):
@@ -195,18 +819,10 @@ def remove_location_text(address):
         return address
     
     # Remove common location prefixes (case insensitive)
-    patterns_to_remove = [
-        r'^location\s*:?\s*-?\s*',
-        r'^location\s+',
-        r'\blocation\s*:?\s*-?\s*',
-    ]
-    
-    cleaned_address = address
-    for pattern in patterns_to_remove:
-        cleaned_address = re.sub(pattern, '', cleaned_address, flags=re.IGNORECASE)
+    cleaned_address = _LOCATION_PREFIX_RE.sub('', address)
     
     # Clean up extra whitespace
-    cleaned_address = re.sub(r'\s+', ' ', cleaned_address).strip()
+    cleaned_address = ' '.join(cleaned_address.split())
     
     return cleaned_address if cleaned_address else address
 
@@ -233,58 +849,28 @@ def convert_date_format(date_str):
         # Clean the date string
         date_str = str(date_str).strip()
         
-        # Month name mappings
-        month_names = {
-            'january': '01', 'february': '02', 'march': '03', 'april': '04',
-            'may': '05', 'june': '06', 'july': '07', 'august': '08',
-            'september': '09', 'october': '10', 'november': '11', 'december': '12',
-            'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-            'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-            'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-        }
-        
         # Handle ISO datetime format (e.g., "2025-11-29T00:00:00Z")
-        iso_pattern = r'(\d{4})-(\d{1,2})-(\d{1,2})'
-        iso_match = re.search(iso_pattern, date_str)
+        iso_match = _ISO_DATE_RE.search(date_str)
         if iso_match:
             year, month, day = iso_match.groups()
             return f"{month.zfill(2)}/{day.zfill(2)}/{year}"
         
-        # Try various patterns
-        patterns = [
-            (r'(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]{3,9}),?\s+(\d{4})', month_names),
-            (r'(\d{1,2})\s+(\w+)\s+(\d{4})', month_names),
-            (r'(\d{1,2})/(\d{1,2})/(\d{4})', None),  # DD/MM/YYYY
-            (r'(\d{1,2})-(\d{1,2})-(\d{4})', None),  # DD-MM-YYYY
-            (r'(\d{4})-(\d{1,2})-(\d{1,2})', None),  # YYYY-MM-DD
-        ]
-        
-        for pattern, month_map in patterns:
-            match = re.search(pattern, date_str, re.IGNORECASE)
-            if match:
-                if month_map:
-                    day, month_name, year = match.groups()
-                    month_num = month_names.get(month_name.lower())
-                    if month_num:
-                        return f"{month_num}/{day.zfill(2)}/{year}"
-                else:
-                    parts = match.groups()
-                    if len(parts) == 3:
-                        if pattern.startswith(r'(\d{4})'):  # YYYY-MM-DD
-                            year, month, day = parts
-                            return f"{month.zfill(2)}/{day.zfill(2)}/{year}"
-                        else:  # DD/MM/YYYY or DD-MM-YYYY
-                            day, month, year = parts
-                            return f"{month.zfill(2)}/{day.zfill(2)}/{year}"
+        # Day-first dates: a real month name wins over a numeric date, as it did
+        # when the named patterns were tried before the numeric ones
+        numeric = None
+        for match in _DAY_FIRST_DATE_RE.finditer(date_str):
+            month_name = match.group('mname')
+            if month_name:
+                month_num = _MONTH_NAMES.get(month_name.lower())
+                if month_num:
+                    return f"{month_num}/{match.group('nday').zfill(2)}/{match.group('nyear')}"
+            elif numeric is None:
+                numeric = match
+        if numeric:  # DD/MM/YYYY or DD-MM-YYYY
+            return f"{numeric.group('dmonth').zfill(2)}/{numeric.group('dday').zfill(2)}/{numeric.group('dyear')}"
         
-        # Try datetime parsing
-        formats = [
-            '%d %B %Y', '%d %b %Y', '%d/%m/%Y', '%d-%m-%Y',
-            '%Y-%m-%d', '%m/%d/%Y', '%B %d, %Y', '%b %d, %Y',
-            '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S%z'
-        ]
-        
-        for fmt in formats:
+        # Try datetime parsing (month-first formats only; everything else is handled above)
+        for fmt in _DATE_FORMATS:
             try:
                 parsed_date = datetime.strptime(date_str, fmt)
                 return parsed_date.strftime('%m/%d/%Y')
@@ -298,6 +884,82 @@ def convert_date_format(date_str):
         return date_str
 
 
+# id(category_keywords) -> (category_keywords, index); the dict is kept so its id cannot be reused
+_KEYWORD_INDEXES = {}
+
+
+def _keyword_index(category_keywords):
+    """Lowercased keyword index for a category_keywords dict, built once per dict.
+    
+    Returns:
+        tuple: (groups, automaton) where groups is a tuple of (category,
+        subcategory, lowercased keywords) in dict order and automaton is a
+        pyahocorasick Automaton mapping each keyword to the index of its first
+        group (None if pyahocorasick is not installed or some keyword is empty)
+    """
+    cached = _KEYWORD_INDEXES.get(id(category_keywords))
+    if cached is not None and cached[0] is category_keywords:
+        return cached[1]
+    
+    groups = tuple(
+        (category_group, subcategory, tuple(keyword.lower() for keyword in keywords))
+        for category_group, subcategories in category_keywords.items()
+        for subcategory, keywords in subcategories.items()
+    )
+    
+    # keyword -> index of the first group that lists it
+    priorities = {}
+    for priority, (_, _, keywords) in enumerate(groups):
+        for keyword in keywords:
+            priorities.setdefault(keyword, priority)
+    
+    automaton = None
+    # An empty keyword matches everything in the plain loop but cannot go in an automaton
+    if ahocorasick is not None and priorities and '' not in priorities:
+        automaton = ahocorasick.Automaton()
+        for keyword, priority in priorities.items():
+            automaton.add_word(keyword, priority)
+        automaton.make_automaton()
+    
+    index = (groups, automaton)
+    _KEYWORD_INDEXES[id(category_keywords)] = (category_keywords, index)
+    return index
+
+
+def _match_category(full_text, index):
+    """Return (category, subcategory) for already-lowercased text using a _keyword_index."""
+    groups, automaton = index
+    
+    if automaton is not None:
+        # One scan over the text; the earliest (category, subcategory) in
+        # dict order among all keyword hits wins, as in the nested loops
+        best = min((priority for _, priority in automaton.iter(full_text)), default=None)
+    else:
+        # Without pyahocorasick: substring checks with the pre-lowered keywords
+        # (CPython's `in` is a fast C search, quicker than one big regex alternation).
+        # Check each category group and subcategory
+        for category_group, subcategory, keywords in groups:
+            for keyword in keywords:
+                if keyword in full_text:
+                    return category_group, subcategory
+        return "Other", "General"
+    
+    if best is not None:
+        return groups[best][0], groups[best][1]
+    return "Other", "General"
+
+
+def _category_text(title, description_parts):
+    """Lowercased title + description text that keywords are matched against."""
+    full_text = title.lower()
+    if description_parts:
+        if isinstance(description_parts, list):
+            full_text += " " + " ".join(str(p).lower() for p in description_parts)
+        else:
+            full_text += " " + str(description_parts).lower()
+    return full_text
+
+
 def get_event_category(title, description_parts, category_keywords=None):
     """Determine the specific category and subcategory for an event based on keywords.
     
@@ -323,25 +985,45 @@ def get_event_category(title, description_parts, category_keywords=None):
     
     try:
         # Combine title and description for analysis
-        full_text = title.lower()
-        if description_parts:
-            if isinstance(description_parts, list):
-                full_text += " " + " ".join(str(p).lower() for p in description_parts)
-            else:
-                full_text += " " + str(description_parts).lower()
-        
-        # Check each category group and subcategory
-        for category_group, subcategories in category_keywords.items():
-            for subcategory, keywords in subcategories.items():
-                for keyword in keywords:
-                    if keyword.lower() in full_text:
-                        return category_group, subcategory
-        
-        return "Other", "General"
+        return _match_category(_category_text(title, description_parts), _keyword_index(category_keywords))
     except Exception:
         return None, None
 
 
+def get_event_categories(rows, category_keywords=None):
+    """Categorize a batch of events against the same keywords.
+    
+    Builds the keyword index once for the whole batch; each row is then one
+    scan over its text. Results match calling get_event_category per row.
+    
+    Args:
+        rows (iterable): (title, description_parts) pairs
+        category_keywords (dict, optional): Same format as get_event_category
+        
+    Returns:
+        list: (category, subcategory) tuples, one per row
+    """
+    rows = list(rows)
+    if not category_keywords:
+        return [(None, None)] * len(rows)
+    
+    try:
+        index = _keyword_index(category_keywords)
+    except Exception:
+        return [(None, None)] * len(rows)
+    
+    results = []
+    for title, description_parts in rows:
+        if not title:
+            results.append((None, None))
+            continue
+        try:
+            results.append(_match_category(_category_text(title, description_parts), index))
+        except Exception:
+            results.append((None, None))
+    return results
+
+
 def validate_uk_coordinates(coords):
     """Validate that coordinates are valid UK coordinates.
     
@@ -405,12 +1087,126 @@ def validate_uk_coordinates(coords):
     return True, ""
 
 
+# Connection pools for the duplicate check, keyed by the frozen db_config they were built from.
+# Opening a MySQL connection (TCP + auth handshake) costs far more than the SELECT itself,
+# so connections are checked out of a pool per call and handed back afterwards
+_DB_POOLS = {}
+_DB_POOLS_LOCK = threading.Lock()
+_DEFAULT_DB_CONFIG = None
+_DB_POOL_SIZE = 8
+
+
+def _default_db_config():
+    """Return the db_config built from the Scrapy project settings (computed once)."""
+    global _DEFAULT_DB_CONFIG
+    if _DEFAULT_DB_CONFIG is None:
+        settings = None
+        try:
+            from scrapy.utils.project import get_project_settings
+            settings = get_project_settings()
+        except Exception:
+            pass
+        # Import here to avoid circular dependencies
+        from db_connection import get_db_config
+        _DEFAULT_DB_CONFIG = get_db_config(settings)
+    return _DEFAULT_DB_CONFIG
+
+
+def _get_db_pool(db_config):
+    """Return the connection pool for db_config, creating it on first use."""
+    key = tuple(sorted(db_config.items()))
+    pool = _DB_POOLS.get(key)
+    if pool is None:
+        with _DB_POOLS_LOCK:
+            # Double-checked: another thread may have built it while we waited for the lock
+            pool = _DB_POOLS.get(key)
+            if pool is None:
+                pool = mysql_pooling.MySQLConnectionPool(
+                    pool_name=f'event_dedup_{len(_DB_POOLS)}',
+                    pool_size=_DB_POOL_SIZE,
+                    **db_config
+                )
+                _DB_POOLS[key] = pool
+    return pool
+
+
+@lru_cache(maxsize=4096)
+def _check_event_exists(url, name, date_str, db_config_key):
+    """Run the duplicate check for one (url, name, date) against MySQL.
+    
+    Memoized, so retries and pagination overlap within a run skip the DB. Errors propagate
+    instead of returning None so that a failed lookup is never cached.
+    """
+    db_config = dict(db_config_key) if db_config_key is not None else _default_db_config()
+    
+    # Parse date to match format in database
+    post_date_str = None
+    if name and date_str:
+        try:
+            post_date_str = datetime.strptime(date_str, '%m/%d/%Y').strftime('%Y-%m-%d')
+        except (TypeError, ValueError):
+            post_date_str = None
+    
+    # All checks go to MySQL as one UNION ALL query (one round-trip instead of two).
+    # Only published posts count (trashed posts are excluded). `src` keeps the old
+    # precedence: _event_url postmeta, then title + date.
+    # The URL is matched only through _event_url (index seek on idx_event_url); the old
+    # post_content LIKE '%url%' scan is gone - run `python db_connection.py --migrate`
+    # once to index postmeta and backfill _event_url for legacy posts
+    branches = []
+    params = []
+    if url:
+        branches.append("""
+        (SELECT pm.post_id AS id, 1 AS src FROM wp_postmeta pm
+        JOIN wp_posts p ON pm.post_id = p.ID
+        WHERE pm.meta_key = '_event_url'
+        AND pm.meta_value = %s
+        AND p.post_type = 'oum-location'
+        AND p.post_status = 'publish'
+        LIMIT 1)
+        """)
+        params.append(url)
+    if post_date_str:
+        branches.append("""
+        (SELECT ID AS id, 2 AS src FROM wp_posts
+        WHERE post_title = %s
+        AND DATE(post_date) = %s
+        AND post_type = 'oum-location'
+        AND post_status = 'publish'
+        LIMIT 1)
+        """)
+        params.extend((name, post_date_str))
+    
+    if not branches:
+        return None
+    
+    # Borrow a pooled connection instead of opening a fresh one per call;
+    # close() on a pooled connection returns it to the pool
+    connection = _get_db_pool(db_config).get_connection()
+    try:
+        cursor = connection.cursor()
+        exists_sql = " UNION ALL ".join(branches) + " ORDER BY src LIMIT 1"
+        cursor.execute(exists_sql, tuple(params))
+        result = cursor.fetchone()
+        cursor.close()
+        return result[0] if result else None
+    finally:
+        connection.close()
+
+
+def clear_event_exists_cache():
+    """Forget memoized duplicate-check results (call after writing new posts)."""
+    _check_event_exists.cache_clear()
+
+
 def check_event_exists_in_db(event, db_config=None):
     """Check if an event already exists in the WordPress database.
     
     This function can be used before geocoding to avoid processing duplicate events.
     Checks by URL first (most reliable), then by name + date combination.
     Only checks published posts (excludes trashed posts).
+    Results are memoized per (url, name, date, db_config) for the life of the process,
+    like the `cache` argument of geocode_address; see clear_event_exists_cache().
     
     Args:
         event (dict): Event dictionary with 'url', 'name', and 'date' keys
@@ -419,109 +1215,55 @@ def check_event_exists_in_db(event, db_config=None):
     Returns:
         int or None: Post ID if event exists, None otherwise
     """
-    try:
-        if db_config is None:
-            # Try to get settings from Scrapy if available
-            settings = None
-            try:
-                from scrapy.utils.project import get_project_settings
-                settings = get_project_settings()
-            except Exception:
-                pass
-            
-            # Import here to avoid circular dependencies
-            import sys
-            from pathlib import Path
-            # Add parent directory to path to import db_connection
-            parent_dir = Path(__file__).parent.parent.parent
-            if str(parent_dir) not in sys.path:
-                sys.path.insert(0, str(parent_dir))
-            from db_connection import get_connection
-            connection = get_connection(settings)
-        else:
-            # Create a custom get_connection function using provided db_config
-            import mysql.connector
-            connection = mysql.connector.connect(**db_config)
-        
-        if not connection:
-            return None
-        
-        cursor = connection.cursor()
-        
-        url = event.get('url', '')
-        name = event.get('name', '')
-        date_str = event.get('date', '')
-        
-        # Only check for 'publish' status (exclude trashed posts)
-        # First, try to find by URL (stored in postmeta _event_url or in post_content)
-        if url:
-            # Check if URL is stored in postmeta (join with wp_posts to check status)
-            url_check_sql = """
-            SELECT pm.post_id FROM wp_postmeta pm
-            JOIN wp_posts p ON pm.post_id = p.ID
-            WHERE pm.meta_key = '_event_url' 
-            AND pm.meta_value = %s
-            AND p.post_type = 'oum-location'
-            AND p.post_status = 'publish'
-            LIMIT 1
-            """
-            cursor.execute(url_check_sql, (url,))
-            result = cursor.fetchone()
-            if result:
-                cursor.close()
-                connection.close()
-                return result[0]
-            
-            # Also check in post_content (some events might have URL in content)
-            content_check_sql = """
-            SELECT ID FROM wp_posts 
-            WHERE post_content LIKE %s 
-            AND post_type = 'oum-location'
-            AND post_status = 'publish'
-            LIMIT 1
-            """
-            cursor.execute(content_check_sql, (f'%{url}%',))
-            result = cursor.fetchone()
-            if result:
-                cursor.close()
-                connection.close()
-                return result[0]
-        
-        # If URL check fails, try name + date combination
-        if name and date_str:
-            try:
-                # Parse date to match format in database
-                post_date = datetime.strptime(date_str, '%m/%d/%Y')
-                post_date_str = post_date.strftime('%Y-%m-%d')
-            except:
-                post_date_str = None
-            
-            if post_date_str:
-                # Check by post_title and post_date (only published posts)
-                name_date_sql = """
-                SELECT ID FROM wp_posts 
-                WHERE post_title = %s 
-                AND DATE(post_date) = %s 
-                AND post_type = 'oum-location'
-                AND post_status = 'publish'
-                LIMIT 1
-                """
-                cursor.execute(name_date_sql, (name, post_date_str))
-                result = cursor.fetchone()
-                if result:
-                    cursor.close()
-                    connection.close()
-                    return result[0]
-        
-        cursor.close()
-        connection.close()
+    if mysql_pooling is None:
         return None
-        
+    
+    try:
+        db_config_key = tuple(sorted(db_config.items())) if db_config else None
+        return _check_event_exists(
+            event.get('url', ''),
+            event.get('name', ''),
+            event.get('date', ''),
+            db_config_key
+        )
     except Exception:
         # Silently fail - if database check fails, allow processing to continue
-        try:
-            if connection:
-                connection.close()
-        except:
-            pass
-        return None
\ No newline at end of file
+        return None
+
+
+class SeenEventFilter:
+    """Memory-light membership filter for URLs and event keys already seen.
+
+    Keys (strings or tuples such as (name, date)) are reduced to a 16-byte
+    BLAKE2b digest before storage. When pybloom-live is installed the digests
+    go into a ScalableBloomFilter (a couple of bytes per key, false positive
+    rate `error_rate`); otherwise they are kept in a plain set, which is
+    exact and still far smaller than storing the original strings.
+
+    Supports `in`, `add`, `update` and `len`, so it can replace a set.
+    """
+
+    def __init__(self, initial_capacity=10000, error_rate=1e-6):
+        if ScalableBloomFilter is not None:
+            self._digests = ScalableBloomFilter(initial_capacity=initial_capacity, error_rate=error_rate)
+        else:
+            self._digests = set()
+
+    @staticmethod
+    def _digest(key):
+        if isinstance(key, tuple):
+            key = '\x1f'.join(str(part) for part in key)
+        return hashlib.blake2b(str(key).encode('utf-8'), digest_size=16).digest()
+
+    def __contains__(self, key):
+        return self._digest(key) in self._digests
+
+    def add(self, key):
+        self._digests.add(self._digest(key))
+
+    def update(self, keys):
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return len(self._digests)
@@ -0,0 +1,144 @@
+"""Fallback event extraction for the Sharpham Trust spider.
+
+This extractor scrapes events straight from the "What's On" listing page
+instead of following "More Info" links. It only runs when Selenium link
+discovery fails, no links were found and SHARPHAM_PAGE_FALLBACK is on, so
+the spider imports this module lazily from that path rather than carrying
+the code on every run.
+"""
+import re
+
+from scrapy.utils.defer import maybe_deferred_to_future
+
+from ..items import EventScrapingItem
+
+
+async def extract_events_from_page(spider, response):
+    """Extract events directly from the listing page (fallback method).
+
+    An async generator so geocoding goes through geocode_address_async and
+    runs off the reactor thread, like the spider's detail page callback.
+    """
+    spider.logger.info("Extracting events directly from listing page (fallback)...")
+
+    events_found = 0
+
+    # Find all headings
+    headings = response.css('h2, h3, h4, h5, h6')
+    spider.logger.info(f"Found {len(headings)} headings on the page")
+
+    for idx, heading in enumerate(headings):
+        try:
+            title = heading.css('::text').get()
+            if not title:
+                title = ''.join(heading.css('::text').getall())
+
+            if not title or len(title.strip()) < 10:
+                continue
+
+            title = title.strip()
+
+            # Skip navigation headings
+            skip_keywords = ['Filter', 'Browse', 'Calendar', 'Events', 'Courses', 'Retreats', 'Month', 'Reset', 'Update', 'Whats on', 'Sign up', 'Donate', 'Menu']
+            if any(keyword.lower() in title.lower() for keyword in skip_keywords):
+                continue
+
+            # Get parent and following text
+            parent = heading.xpath('./parent::*[1]')
+            all_text = title
+            if parent:
+                all_text += ' ' + ' '.join(parent.css('::text').getall())
+
+            # Look for date
+            date_match = None
+            date_patterns = [
+                r'(\d{4})\s+(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)',
+                r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})',
+            ]
+
+            for pattern in date_patterns:
+                match = re.search(pattern, all_text, re.IGNORECASE)
+                if match:
+                    date_match = match.group(0).strip()
+                    break
+
+            if not date_match:
+                continue
+
+            # Extract venue
+            address = None
+            all_text_lower = all_text.lower()
+            for keyword_lower, keyword in spider.VENUE_KEYWORDS_LOWER:
+                if keyword_lower in all_text_lower:
+                    address = keyword
+                    break
+
+            if not address:
+                address = "Sharpham House, Ashprington, Totnes, Devon, UK TQ9 7UT"
+
+            # Extract description
+            description = None
+            if parent:
+                desc_parts = parent.css('p::text').getall()
+                if desc_parts:
+                    description = ' '.join([d.strip() for d in desc_parts if d.strip()])
+
+            # Extract URL
+            url = response.url
+            if parent:
+                link = parent.css('a::attr(href)').get()
+                if link:
+                    url = response.urljoin(link)
+
+            # Create item
+            if title and date_match:
+                item = EventScrapingItem()
+                item['category'] = spider.category
+                item['site'] = spider.site_name
+                item['url'] = url
+                item['name'] = spider.clean_text(title)
+                item['date'] = spider.convert_date_format(date_match)
+                item['raw_date'] = date_match
+
+                short_description = f"{description[:200]}..." if description and len(description) > 200 else description
+                item['short_description'] = spider.clean_text(short_description) if short_description else None
+
+                # Build event_data for database check before geocoding
+                geocode_event_data = {
+                    'name': item['name'],
+                    'date': item['date'],
+                    'url': item['url']
+                }
+
+                coords = None
+                # Pass event_data to enable database check before geocoding
+                if address and address not in ['Online']:
+                    coords = await maybe_deferred_to_future(spider.geocode_address_async(address, event_data=geocode_event_data))
+
+                item['coordinates'] = coords
+                # Ensure UK is present in address
+                address = spider.ensure_uk_in_address(address)
+                item['address'] = address
+                item['category'] = "Wellness & Mind"
+                item['subcategory'] = "Mindfulness"
+                item['raw'] = {
+                    'title': title,
+                    'date': date_match,
+                    'description': description,
+                    'address': address,
+                    'coordinates': coords,
+                }
+
+                item_key = (item['name'], item['date'])
+                if item_key not in spider.seen_events:
+                    spider.seen_events.add(item_key)
+                    spider.total_items_scraped += 1
+                    events_found += 1
+                    spider.logger.info(f"Extracted event #{events_found}: {item['name'][:50]}...")
+                    yield item
+
+        except Exception as e:
+            spider.logger.debug(f"Error extracting event from heading {idx + 1}: {e}")
+            continue
+
+    spider.logger.info(f"Finished listing page fallback. Events found: {events_found}")
@@ -3,11 +3,20 @@ Insert event data into WordPress database (zuzl_posts and zuzl_postmeta).
 Processes all JSON files from scraped_data folder and checks for duplicates.
 """
 import json
+import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
+import threading
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from db_connection import get_connection
+from db_connection import (
+    ensure_event_url_dedupe_table, ensure_event_url_index, ensure_post_title_index, get_connection,
+    prune_event_url_dedupe,
+)
 
 # Add event_scraping to path to import validation function and settings
 # insert_event.py is in event_scraping/, and we need to import from event_scraping/event_scraping/utils/common.py
@@ -16,9 +25,50 @@ if str(event_scraping_parent) not in sys.path:
     sys.path.insert(0, str(event_scraping_parent))
 from event_scraping.utils.common import validate_uk_coordinates
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parses one JSON Lines record (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Feed files written by the spiders: JSON Lines (current runners) or a JSON array (older feeds)
+FEED_SUFFIXES = ('.jsonl', '.json')
+
+# Errors raised while reading a scraped JSON file
+JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Ping the shared connection every N events so a long run survives wait_timeout
+DB_PING_EVERY = 100
+
+# Progress output goes through a buffer and is written to stdout in blocks of up to
+# 1000 lines instead of one write per line. An error flushes it straight away, and
+# main() flushes at the end of every file, so output stays in order and nothing waits long
+logger = logging.getLogger(__name__)
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+LOG_BUFFER = logging.handlers.MemoryHandler(1000, flushLevel=logging.ERROR, target=_stdout_handler)
+logger.addHandler(LOG_BUFFER)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Scraped event dates are MM/DD/YYYY
+_DATE_RE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+
 # Try to load settings for database configuration
+@lru_cache(maxsize=1)
 def get_db_settings():
-    """Get database settings from Scrapy settings file."""
+    """Get database settings from Scrapy settings file.
+    
+    Loaded once per run: get_project_settings() locates scrapy.cfg, imports the
+    settings module and builds a new Settings object on every call.
+    """
     try:
         from scrapy.utils.project import get_project_settings
         return get_project_settings()
@@ -27,23 +77,199 @@ def get_db_settings():
         return None
 
 
-def event_exists(event):
+@lru_cache(maxsize=4096)
+def parse_event_date(date_str):
+    """Parse an MM/DD/YYYY event date.
+    
+    Same result as datetime.strptime(date_str, '%m/%d/%Y') without strptime's
+    per-call format handling; many events share a date, so results are cached.
+    
+    Args:
+        date_str (str): Date string from the scraped event
+        
+    Returns:
+        datetime or None: Parsed date, or None if the string is not a valid date
+    """
+    match = _DATE_RE.match(date_str) if isinstance(date_str, str) else None
+    if not match:
+        return None
+    month, day, year = match.groups()
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _event_lookup_keys(event):
+    """Return (url key, (title, YYYY-MM-DD) key) used by the preloaded duplicate maps.
+    
+    Keys are lowercased because MySQL compares post_title / meta_value
+    case-insensitively under the default collation. Either key is None when
+    the event lacks the data for it.
+    """
+    url = event.get('url', '')
+    name = event.get('name', '')
+    date_str = event.get('date', '')
+    name_date = None
+    if name and date_str:
+        post_date = parse_event_date(date_str)
+        if post_date:
+            name_date = (name.lower(), post_date.strftime('%Y-%m-%d'))
+    return (url.lower() if url else None), name_date
+
+
+def preload_existing(connection):
+    """Load everything the duplicate check and category lookup need in three queries.
+    
+    Replaces per-event SELECTs with Python dict lookups for the rest of the run.
+    
+    Args:
+        connection: Open MySQL connection
+        
+    Returns:
+        tuple: (url_map, name_date_map, term_map) where url_map maps a lowercased
+        _event_url to its post ID, name_date_map maps (lowercased title,
+        'YYYY-MM-DD') to a post ID (published oum-location posts only), and
+        term_map maps a lowercased term name to (term_id, term_taxonomy_id)
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute("""
+            SELECT pm.meta_value, pm.post_id FROM zuzl_postmeta pm
+            JOIN zuzl_posts p ON pm.post_id = p.ID
+            WHERE pm.meta_key = '_event_url'
+            AND p.post_type = 'oum-location'
+            AND p.post_status = 'publish'
+        """)
+        url_map = {}
+        for url, post_id in cursor.fetchall():
+            if url:
+                url_map.setdefault(url.lower(), post_id)
+        
+        cursor.execute("""
+            SELECT post_title, DATE(post_date), ID FROM zuzl_posts
+            WHERE post_type = 'oum-location'
+            AND post_status = 'publish'
+        """)
+        name_date_map = {}
+        for title, post_date, post_id in cursor.fetchall():
+            if title and post_date:
+                name_date_map.setdefault((title.lower(), str(post_date)), post_id)
+        
+        cursor.execute("""
+            SELECT t.name, t.term_id, tt.term_taxonomy_id FROM zuzl_terms t
+            LEFT JOIN zuzl_term_taxonomy tt ON tt.term_id = t.term_id
+            ORDER BY t.term_id, tt.term_taxonomy_id
+        """)
+        term_map = {}
+        for name, term_id, term_taxonomy_id in cursor.fetchall():
+            if name:
+                term_map.setdefault(name.lower(), (term_id, term_taxonomy_id))
+    finally:
+        cursor.close()
+    
+    logger.info(f"Preloaded {len(url_map)} event URLs, {len(name_date_map)} title+date pairs, {len(term_map)} terms")
+    return url_map, name_date_map, term_map
+
+
+def lookup_existing_urls(connection, urls):
+    """Find which of many event URLs are already published, in one join.
+    
+    The URLs are bulk-loaded into a temporary table and joined against
+    _event_url postmeta, instead of one SELECT per URL.
+    
+    Args:
+        connection: Open MySQL connection
+        urls (iterable): Event URLs to look up
+        
+    Returns:
+        dict: Lowercased URL -> post ID for the URLs that already exist
+    """
+    rows = list({(url[:191],) for url in urls if url})
+    if not rows:
+        return {}
+    cursor = connection.cursor()
+    try:
+        cursor.execute("DROP TEMPORARY TABLE IF EXISTS scrape_urls")
+        cursor.execute("CREATE TEMPORARY TABLE scrape_urls (url VARCHAR(191) PRIMARY KEY) ENGINE=MEMORY")
+        cursor.executemany("INSERT IGNORE INTO scrape_urls (url) VALUES (%s)", rows)
+        cursor.execute("""
+            SELECT s.url, pm.post_id FROM scrape_urls s
+            JOIN zuzl_postmeta pm ON pm.meta_key = '_event_url' AND pm.meta_value = s.url
+            JOIN zuzl_posts p ON pm.post_id = p.ID
+            WHERE p.post_type = 'oum-location'
+            AND p.post_status = 'publish'
+        """)
+        found = {}
+        for url, post_id in cursor.fetchall():
+            found.setdefault(url.lower(), post_id)
+        cursor.execute("DROP TEMPORARY TABLE scrape_urls")
+        return found
+    finally:
+        cursor.close()
+
+
+def remember_event(existing, event, post_id):
+    """Add a newly inserted event to the preloaded duplicate maps."""
+    url_map, name_date_map, _ = existing
+    url_key, name_date_key = _event_lookup_keys(event)
+    if url_key:
+        url_map.setdefault(url_key, post_id)
+    if name_date_key:
+        name_date_map.setdefault(name_date_key, post_id)
+
+
+# Branches of the event_exists() lookup, combined with UNION ALL
+EXISTS_BY_URL_SQL = """
+(SELECT pm.post_id, 1 AS src FROM zuzl_postmeta pm
+JOIN zuzl_posts p ON pm.post_id = p.ID
+WHERE pm.meta_key = '_event_url'
+AND pm.meta_value = %s
+AND p.post_type = 'oum-location'
+AND p.post_status = 'publish'
+LIMIT 1)
+"""
+EXISTS_BY_NAME_DATE_SQL = """
+(SELECT ID, 2 AS src FROM zuzl_posts
+WHERE post_title = %s
+AND DATE(post_date) = %s
+AND post_type = 'oum-location'
+AND post_status = 'publish'
+LIMIT 1)
+"""
+
+
+def event_exists(event, connection=None, existing=None):
     """Check if an event already exists in the database.
     
-    Checks by URL first (most reliable), then by name + date combination.
-    Only checks published posts (excludes trashed posts).
+    Checks by URL first (most reliable), then by name + date combination,
+    both in a single query. Only checks published posts (excludes trashed posts).
     
     Args:
         event (dict): Event dictionary with 'url', 'name', and 'date' keys
+        connection (optional): Open MySQL connection to reuse. If None, a new
+            connection is opened and closed for this check.
+        existing (tuple, optional): Maps from preload_existing(). When given, the
+            check is two dict lookups and the database is not queried.
         
     Returns:
         int or None: Post ID if event exists, None otherwise
     """
-    settings = get_db_settings()
-    connection = get_connection(settings)
-    if not connection:
+    if existing is not None:
+        url_map, name_date_map, _ = existing
+        url_key, name_date_key = _event_lookup_keys(event)
+        if url_key and url_key in url_map:
+            return url_map[url_key]
+        if name_date_key and name_date_key in name_date_map:
+            return name_date_map[name_date_key]
         return None
     
+    owns_connection = connection is None
+    if owns_connection:
+        connection = get_connection(get_db_settings())
+        if not connection:
+            return None
+    
     try:
         cursor = connection.cursor()
         
@@ -51,88 +277,106 @@ def event_exists(event):
         name = event.get('name', '')
         date_str = event.get('date', '')
         
-        # Only check for 'publish' status (exclude trashed posts)
-        # First, try to find by URL (stored in postmeta _event_url or in post_content)
+        # Only check for 'publish' status (exclude trashed posts).
+        # The URL lookup (stored in postmeta _event_url, most reliable) and the name + date
+        # lookup go to MySQL as one UNION ALL statement; src orders a URL match first.
+        # There is no post_content LIKE '%url%' fallback: a leading wildcard scans every post.
+        # Legacy posts without _event_url are backfilled by `python db_connection.py --migrate zuzl_`
+        branches = []
+        params = []
         if url:
-            # Check if URL is stored in postmeta (join with zuzl_posts to check status)
-            url_check_sql = """
-            SELECT pm.post_id FROM zuzl_postmeta pm
-            JOIN zuzl_posts p ON pm.post_id = p.ID
-            WHERE pm.meta_key = '_event_url' 
-            AND pm.meta_value = %s
-            AND p.post_type = 'oum-location'
-            AND p.post_status = 'publish'
-            LIMIT 1
-            """
-            cursor.execute(url_check_sql, (url,))
-            result = cursor.fetchone()
-            if result:
-                cursor.close()
-                connection.close()
-                return result[0]
-            
-            # Also check in post_content (some events might have URL in content)
-            content_check_sql = """
-            SELECT ID FROM zuzl_posts 
-            WHERE post_content LIKE %s 
-            AND post_type = 'oum-location'
-            AND post_status = 'publish'
-            LIMIT 1
-            """
-            cursor.execute(content_check_sql, (f'%{url}%',))
+            branches.append(EXISTS_BY_URL_SQL)
+            params.append(url)
+        
+        if name and date_str:
+            # Parse date to match format in database
+            post_date = parse_event_date(date_str)
+            if post_date:
+                branches.append(EXISTS_BY_NAME_DATE_SQL)
+                params.extend((name, post_date.strftime('%Y-%m-%d')))
+        
+        if branches:
+            cursor.execute(
+                " UNION ALL ".join(branches) + " ORDER BY src LIMIT 1",
+                tuple(params)
+            )
             result = cursor.fetchone()
             if result:
                 cursor.close()
-                connection.close()
                 return result[0]
         
-        # If URL check fails, try name + date combination
-        if name and date_str:
-            try:
-                # Parse date to match format in database
-                post_date = datetime.strptime(date_str, '%m/%d/%Y')
-                post_date_str = post_date.strftime('%Y-%m-%d')
-            except:
-                post_date_str = None
-            
-            if post_date_str:
-                # Check by post_title and post_date (only published posts)
-                name_date_sql = """
-                SELECT ID FROM zuzl_posts 
-                WHERE post_title = %s 
-                AND DATE(post_date) = %s 
-                AND post_type = 'oum-location'
-                AND post_status = 'publish'
-                LIMIT 1
-                """
-                cursor.execute(name_date_sql, (name, post_date_str))
-                result = cursor.fetchone()
-                if result:
-                    cursor.close()
-                    connection.close()
-                    return result[0]
-        
         cursor.close()
-        connection.close()
         return None
         
     except Exception as e:
-        print(f"Error checking if event exists: {e}")
-        if connection:
-            connection.close()
+        logger.error(f"Error checking if event exists: {e}")
         return None
+    finally:
+        if owns_connection:
+            connection.close()
+
+
+# List of valid category names from zuzl_terms (order matters: earlier entries win)
+VALID_CATEGORIES = (
+    'Charity Events',
+    'Crossfit',
+    'Endurance events',
+    'Family Fitness',
+    'Local Club Events',
+    'Mindfulness',
+    'Running Events',
+    'Strength and Endurance',
+    "Women's Fitness",
+    'Yoga and Pilates',
+    'Cycling',
+    'Swimming'
+)
+VALID_CATEGORY_MAP = {valid_cat.lower(): valid_cat for valid_cat in VALID_CATEGORIES}
+
+# valid category name -> term_id (or None) already looked up in zuzl_terms during this run
+_TERM_ID_CACHE = {}
+# term_id -> term_taxonomy_id (or None) already looked up in zuzl_term_taxonomy during this run
+_TERM_TAXONOMY_CACHE = {}
+
+
+@lru_cache(maxsize=256)
+def match_valid_categories(name_lower):
+    """Valid categories a lowercased name matches, in VALID_CATEGORIES order.
+    
+    A name matches when it is contained in the valid category or vice versa.
+    Categories and subcategories repeat across events, so each distinct name
+    is only compared against the list once.
+    """
+    return tuple(
+        valid_cat for valid_cat_lower, valid_cat in VALID_CATEGORY_MAP.items()
+        if name_lower in valid_cat_lower or valid_cat_lower in name_lower
+    )
+
+
+def _category_candidates(category_name, subcategory_name=None):
+    """Yield the valid categories to try for an event, best first.
+    
+    Subcategory matches come before category matches; each in VALID_CATEGORIES order.
+    """
+    for name in (subcategory_name, category_name):
+        if name and name.strip():
+            yield from match_valid_categories(name.strip().lower())
 
 
-def get_term_id_by_name(cursor, category_name, subcategory_name=None):
+def get_term_id_by_name(cursor, category_name, subcategory_name=None, term_map=None):
     """Get term_id from zuzl_terms table based on category or subcategory name.
     
     Tries subcategory first, then falls back to category name.
-    Compares against a list of valid categories using LIKE operator, then queries database.
+    Compares against the list of valid categories (substring match either way),
+    then looks the matched category up in zuzl_terms. Database lookups are
+    cached for the rest of the run.
     
     Args:
         cursor: Database cursor
         category_name (str): Category name (e.g., "Running Events", "Yoga and Pilates")
         subcategory_name (str, optional): Subcategory name
+        term_map (dict, optional): Preloaded {lowercased name: (term_id, term_taxonomy_id)}
+            from preload_existing(); used instead of querying zuzl_terms
         
     Returns:
         int or None: term_id if found, None otherwise
@@ -140,29 +384,6 @@ def get_term_id_by_name(cursor, category_name, subcategory_name=None):
     if not cursor:
         return None
     
-    # List of valid category names from zuzl_terms
-    valid_categories = [
-        'Charity Events',
-        'Crossfit',
-        'Endurance events',
-        'Family Fitness',
-        'Local Club Events',
-        'Mindfulness',
-        'Running Events',
-        'Strength and Endurance',
-        "Women's Fitness",
-        'Yoga and Pilates',
-        'Cycling',
-        'Swimming'
-    ]
-    
-    # Build list of names to search (subcategory first, then category)
-    search_names = []
-    if subcategory_name and subcategory_name.strip():
-        search_names.append(subcategory_name.strip())
-    if category_name and category_name.strip():
-        search_names.append(category_name.strip())
-    
     # Query to get term_id from database
     query_exact = """
     SELECT term_id FROM zuzl_terms 
@@ -170,25 +391,21 @@ def get_term_id_by_name(cursor, category_name, subcategory_name=None):
     LIMIT 1
     """
     
-    # For each search name, compare with valid categories using LIKE operator
-    for name in search_names:
-        if not name:
+    # Search subcategory first, then category
+    for valid_cat in _category_candidates(category_name, subcategory_name):
+        if term_map is not None:
+            entry = term_map.get(valid_cat.lower())
+            if entry:
+                return entry[0]
             continue
         
-        name_lower = name.lower().strip()
-        
-        # Compare with each valid category using LIKE operator
-        for valid_cat in valid_categories:
-            valid_cat_lower = valid_cat.lower()
-            
-            # Use LIKE operator to check if name matches valid category
-            # Check if name is contained in valid category or vice versa
-            if name_lower in valid_cat_lower or valid_cat_lower in name_lower:
-                # Found a match in the list, query database with the matched valid category name
-                cursor.execute(query_exact, (valid_cat,))
-                result = cursor.fetchone()
-                if result:
-                    return result[0]
+        if valid_cat not in _TERM_ID_CACHE:
+            # Found a match in the list, query database with the matched valid category name
+            cursor.execute(query_exact, (valid_cat,))
+            result = cursor.fetchone()
+            _TERM_ID_CACHE[valid_cat] = result[0] if result else None
+        if _TERM_ID_CACHE[valid_cat]:
+            return _TERM_ID_CACHE[valid_cat]
     
     return None
 
@@ -233,147 +450,396 @@ def serialize_location_meta(event):
     text = '<br><br>'.join(text_parts)
     text = text.replace('\n', '<br>').replace('\r', '')
     
-    # PHP serialized array format - all on one line, newlines in text converted to <br> tags
-    serialized = f'a:8:{{s:7:"address";s:{len(address)}:"{address}";s:3:"lat";d:{lat};s:3:"lng";d:{lng};s:4:"zoom";i:{zoom};s:4:"text";s:{len(text)}:"{text}";s:11:"author_name";s:0:"";s:12:"author_email";s:0:"";s:5:"video";s:0:"";}}'
+    # PHP serialized array format - all on one line, newlines in text converted to <br> tags.
+    # PHP string lengths are UTF-8 byte counts, not character counts (they differ for
+    # any non-ASCII name, and unserialize() rejects the value when they are wrong)
+    address_len = len(address.encode('utf-8'))
+    text_len = len(text.encode('utf-8'))
+    serialized = f'a:8:{{s:7:"address";s:{address_len}:"{address}";s:3:"lat";d:{lat};s:3:"lng";d:{lng};s:4:"zoom";i:{zoom};s:4:"text";s:{text_len}:"{text}";s:11:"author_name";s:0:"";s:12:"author_email";s:0:"";s:5:"video";s:0:"";}}'
     return serialized
 
 
-def insert_event(event):
-    """Insert a single event into WordPress."""
-    settings = get_db_settings()
-    connection = get_connection(settings)
-    if not connection:
-        return None
+# Insert statement for zuzl_posts (one row; executemany() sends many rows as one statement)
+POST_SQL = """
+INSERT INTO zuzl_posts (
+    post_author, post_date, post_date_gmt, post_content, post_title,
+    post_excerpt, post_status, comment_status, ping_status, post_password,
+    post_name, to_ping, pinged, post_modified, post_modified_gmt,
+    post_content_filtered, post_parent, guid, menu_order, post_type, 
+    post_mime_type, comment_count
+) VALUES (
+    %s, %s, %s, %s, %s,
+    %s, %s, %s, %s, %s,
+    %s, %s, %s, %s, %s,
+    %s, %s, %s, %s, %s,
+    %s, %s
+)
+"""
+
+META_SQL = "INSERT INTO zuzl_postmeta (post_id, meta_key, meta_value) VALUES (%s, %s, %s)"
+
+RELATIONSHIP_SQL = """
+INSERT INTO zuzl_term_relationships (object_id, term_taxonomy_id, term_order)
+VALUES (%s, %s, %s)
+"""
+
+# Claims an event URL (SHA-1 of the full URL is the side table's primary key);
+# rowcount 0 means it is already taken
+DEDUPE_CLAIM_SQL = """
+INSERT IGNORE INTO zuzl_event_url_dedupe (url_hash, post_id)
+VALUES (UNHEX(SHA1(%s)), %s)
+"""
+
+# Returned by insert_event() instead of a post ID when the event's URL was already
+# claimed: the event is a duplicate, not a failed insert
+URL_ALREADY_CLAIMED = object()
+
+# post_name slug: spaces -> '-', ':' dropped, '&' -> 'and', all in one str.translate pass
+SLUG_TABLE = str.maketrans({' ': '-', ':': None, '&': 'and'})
+
+# Events staged by main() before they are written with insert_events_batch()
+INSERT_BATCH_SIZE = 1000
+
+# mysql.connector sends an executemany() INSERT as a single multi-row statement with no
+# size limit of its own, so batch rows are sent in chunks that stay well under the
+# server's max_allowed_packet (4MB on older MySQL defaults)
+INSERT_CHUNK_BYTES = 1024 * 1024
+INSERT_CHUNK_ROWS = 250
+
+
+def _row_chunks(rows, max_bytes=INSERT_CHUNK_BYTES, max_rows=INSERT_CHUNK_ROWS):
+    """Split parameter rows into chunks of at most max_rows rows / about max_bytes bytes.
+    
+    Args:
+        rows (list): Parameter tuples for one INSERT statement
+        max_bytes (int): Approximate size limit per chunk (UTF-8 bytes of the string values)
+        max_rows (int): Row limit per chunk
+        
+    Yields:
+        list: Consecutive rows, at least one per chunk
+    """
+    chunk = []
+    chunk_bytes = 0
+    for row in rows:
+        row_bytes = sum(len(value.encode('utf-8')) if isinstance(value, str) else 8 for value in row)
+        if chunk and (chunk_bytes + row_bytes > max_bytes or len(chunk) >= max_rows):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(row)
+        chunk_bytes += row_bytes
+    if chunk:
+        yield chunk
+
+
+def _executemany_chunked(cursor, sql, rows):
+    """executemany() in _row_chunks(); returns the total rowcount."""
+    rowcount = 0
+    for chunk in _row_chunks(rows):
+        cursor.executemany(sql, chunk)
+        rowcount += cursor.rowcount
+    return rowcount
+
+
+def build_post_values(event):
+    """Build the zuzl_posts column values (in POST_SQL order) for an event."""
+    # Prepare post data
+    name = event.get('name', '')
+    description = event.get('short_description', '')
+    full_description = event.get('raw', {}).get('full_description', description)
+    
+    # Parse date
+    date_str = event.get('date', '')
+    post_date = parse_event_date(date_str) or datetime.now()
+    
+    # post_date_gmt is the same string, so it is formatted once
+    post_date_str = post_date.strftime('%Y-%m-%d %H:%M:%S')
+    post_date_gmt = post_date_str
+    
+    # Create slug from name
+    slug = name.lower().translate(SLUG_TABLE)[:200]
+    
+    return (
+        1,  # post_author
+        post_date_str,  # post_date
+        post_date_gmt,  # post_date_gmt
+        full_description,  # post_content
+        name,  # post_title
+        description,  # post_excerpt
+        'publish',  # post_status
+        'closed',  # comment_status
+        'closed',  # ping_status
+        '',  # post_password
+        slug,  # post_name
+        '',  # to_ping
+        '',  # pinged
+        post_date_str,  # post_modified
+        post_date_gmt,  # post_modified_gmt
+        '',  # post_content_filtered
+        0,  # post_parent
+        '',  # guid (will update after)
+        0,  # menu_order
+        'oum-location',  # post_type - change if needed
+        '',  # post_mime_type
+        0  # comment_count
+    )
+
+
+def build_meta_entries(event):
+    """Build the (meta_key, meta_value) pairs stored in zuzl_postmeta for an event."""
+    return [
+        ('_oum_location_key', serialize_location_meta(event)),
+        ('_oum_location_image', ''),
+        ('_oum_location_audio', ''),
+        ('_edit_last', 1),
+        ('_event_category', event.get('category', '')),
+        ('_event_subcategory', event.get('subcategory', '')),
+        ('_event_url', event.get('url', ''))  # Store URL for duplicate checking
+    ]
+
+
+def get_term_taxonomy_id(cursor, category, subcategory, term_map=None):
+    """Resolve category/subcategory to (term_taxonomy_id, term_id).
+    
+    Args:
+        term_map (dict, optional): Preloaded term map from preload_existing(). It holds
+            both IDs per name, so the lookup needs no queries at all
+    
+    Returns:
+        tuple: (term_taxonomy_id or None, term_id or None)
+    """
+    if term_map is not None:
+        for valid_cat in _category_candidates(category, subcategory):
+            entry = term_map.get(valid_cat.lower())
+            if entry:
+                term_id, term_taxonomy_id = entry
+                return term_taxonomy_id, term_id
+        return None, None
+    
+    # Get category_term_id from zuzl_terms based on category/subcategory name
+    category_term_id = get_term_id_by_name(cursor, category, subcategory)
+    if not category_term_id:
+        return None, None
     
+    # Get term_taxonomy_id from zuzl_term_taxonomy (once per term per run)
+    if category_term_id not in _TERM_TAXONOMY_CACHE:
+        taxonomy_query = "SELECT term_taxonomy_id FROM zuzl_term_taxonomy WHERE term_id = %s"
+        cursor.execute(taxonomy_query, (category_term_id,))
+        taxonomy_result = cursor.fetchone()
+        _TERM_TAXONOMY_CACHE[category_term_id] = taxonomy_result[0] if taxonomy_result else None
+    return _TERM_TAXONOMY_CACHE[category_term_id], category_term_id
+
+
+def insert_event(event, connection=None, commit=True, term_map=None):
+    """Insert a single event into WordPress.
+    
+    Args:
+        event (dict): Event dictionary
+        connection (optional): Open MySQL connection to reuse. If None, a new
+            connection is opened and closed for this insert.
+        commit (bool): Commit after the insert. With False the event is left in
+            the caller's open transaction (guarded by a savepoint, so a failed
+            insert only undoes this event) and the caller commits.
+        term_map (dict, optional): Preloaded term map from preload_existing()
+        
+    Returns:
+        int or None: New post ID, URL_ALREADY_CLAIMED if the event's URL was
+            already inserted, or None if the insert failed
+    """
+    owns_connection = connection is None
+    if owns_connection:
+        connection = get_connection(get_db_settings())
+        if not connection:
+            return None
+    
+    commit = commit or owns_connection
+    cursor = None
     try:
         cursor = connection.cursor()
+        if not commit:
+            cursor.execute("SAVEPOINT insert_event")
         
-        # Prepare post data
-        name = event.get('name', '')
-        description = event.get('short_description', '')
-        full_description = event.get('raw', {}).get('full_description', description)
+        # Claim the URL first: the duplicate check and the reservation in one statement
         url = event.get('url', '')
-        
-        # Parse date
-        date_str = event.get('date', '')
-        try:
-            post_date = datetime.strptime(date_str, '%m/%d/%Y')
-        except:
-            post_date = datetime.now()
-        
-        post_date_str = post_date.strftime('%Y-%m-%d %H:%M:%S')
-        post_date_gmt = post_date_str
-        
-        # Create slug from name
-        slug = name.lower().replace(' ', '-').replace(':', '').replace('&', 'and')[:200]
+        if url:
+            cursor.execute(DEDUPE_CLAIM_SQL, (url, None))
+            if cursor.rowcount == 0:
+                logger.info(f"Skipping event, URL already inserted: {url}")
+                if not commit:
+                    cursor.execute("RELEASE SAVEPOINT insert_event")
+                cursor.close()
+                return URL_ALREADY_CLAIMED
         
         # Insert into zuzl_posts
-        post_sql = """
-        INSERT INTO zuzl_posts (
-            post_author, post_date, post_date_gmt, post_content, post_title,
-            post_excerpt, post_status, comment_status, ping_status, post_password,
-            post_name, to_ping, pinged, post_modified, post_modified_gmt,
-            post_content_filtered, post_parent, guid, menu_order, post_type, 
-            post_mime_type, comment_count
-        ) VALUES (
-            %s, %s, %s, %s, %s,
-            %s, %s, %s, %s, %s,
-            %s, %s, %s, %s, %s,
-            %s, %s, %s, %s, %s,
-            %s, %s
-        )
-        """
-        
-        post_values = (
-            1,  # post_author
-            post_date_str,  # post_date
-            post_date_gmt,  # post_date_gmt
-            full_description,  # post_content
-            name,  # post_title
-            description,  # post_excerpt
-            'publish',  # post_status
-            'closed',  # comment_status
-            'closed',  # ping_status
-            '',  # post_password
-            slug,  # post_name
-            '',  # to_ping
-            '',  # pinged
-            post_date_str,  # post_modified
-            post_date_gmt,  # post_modified_gmt
-            '',  # post_content_filtered
-            0,  # post_parent
-            '',  # guid (will update after)
-            0,  # menu_order
-            'oum-location',  # post_type - change if needed
-            '',  # post_mime_type
-            0  # comment_count
-        )
-        
-        cursor.execute(post_sql, post_values)
+        cursor.execute(POST_SQL, build_post_values(event))
         post_id = cursor.lastrowid
-        print(f"Inserted post with ID: {post_id}")
+        logger.info(f"Inserted post with ID: {post_id}")
+        if url:
+            cursor.execute("UPDATE zuzl_event_url_dedupe SET post_id = %s WHERE url_hash = UNHEX(SHA1(%s))", (post_id, url))
         
         # Update GUID
         guid = f"https://cveronline.com/?p={post_id}"
         cursor.execute("UPDATE zuzl_posts SET guid = %s WHERE ID = %s", (guid, post_id))
         
         # Insert postmeta
-        meta_entries = [
-            ('_oum_location_key', serialize_location_meta(event)),
-            ('_oum_location_image', ''),
-            ('_oum_location_audio', ''),
-            ('_edit_last', 1),
-            ('_event_category', event.get('category', '')),
-            ('_event_subcategory', event.get('subcategory', '')),
-            ('_event_url', url)  # Store URL for duplicate checking
-        ]
+        meta_entries = build_meta_entries(event)
         
-        meta_sql = "INSERT INTO zuzl_postmeta (post_id, meta_key, meta_value) VALUES (%s, %s, %s)"
+        # executemany() rewrites a simple INSERT into one multi-row VALUES statement,
+        # so all meta rows go to MySQL in a single round-trip
+        cursor.executemany(META_SQL, [(post_id, meta_key, meta_value) for meta_key, meta_value in meta_entries])
         
-        for meta_key, meta_value in meta_entries:
-            cursor.execute(meta_sql, (post_id, meta_key, meta_value))
-        
-        print(f"Inserted {len(meta_entries)} meta entries for post {post_id}")
+        logger.info(f"Inserted {len(meta_entries)} meta entries for post {post_id}")
         
         # Insert category relationship in zuzl_term_relationships
-        # Get category_term_id from zuzl_terms based on category/subcategory name
         category = event.get('category', '')
         subcategory = event.get('subcategory', '')
         
-        category_term_id = get_term_id_by_name(cursor, category, subcategory)
+        term_taxonomy_id, category_term_id = get_term_taxonomy_id(cursor, category, subcategory, term_map)
         
-        if category_term_id:
-            # Get term_taxonomy_id from zuzl_term_taxonomy
-            taxonomy_query = "SELECT term_taxonomy_id FROM zuzl_term_taxonomy WHERE term_id = %s"
-            cursor.execute(taxonomy_query, (category_term_id,))
-            taxonomy_result = cursor.fetchone()
-            
-            if taxonomy_result:
-                term_taxonomy_id = taxonomy_result[0]
-                
-                # Insert into zuzl_term_relationships
-                relationship_sql = """
-                INSERT INTO zuzl_term_relationships (object_id, term_taxonomy_id, term_order)
-                VALUES (%s, %s, %s)
-                """
-                cursor.execute(relationship_sql, (post_id, term_taxonomy_id, 0))
-                print(f"Inserted category relationship: post_id={post_id}, term_taxonomy_id={term_taxonomy_id} (term_id={category_term_id}, category={category}, subcategory={subcategory})")
-            else:
-                print(f"Warning: Could not find term_taxonomy_id for term_id {category_term_id} (category={category}, subcategory={subcategory})")
+        if term_taxonomy_id:
+            cursor.execute(RELATIONSHIP_SQL, (post_id, term_taxonomy_id, 0))
+            logger.info(f"Inserted category relationship: post_id={post_id}, term_taxonomy_id={term_taxonomy_id} (term_id={category_term_id}, category={category}, subcategory={subcategory})")
+        elif category_term_id:
+            logger.warning(f"Warning: Could not find term_taxonomy_id for term_id {category_term_id} (category={category}, subcategory={subcategory})")
         else:
-            print(f"Warning: Could not find term_id for category='{category}', subcategory='{subcategory}'. Event inserted without category relationship.")
+            logger.warning(f"Warning: Could not find term_id for category='{category}', subcategory='{subcategory}'. Event inserted without category relationship.")
         
-        connection.commit()
+        if commit:
+            connection.commit()
+        else:
+            cursor.execute("RELEASE SAVEPOINT insert_event")
         cursor.close()
-        connection.close()
         
         return post_id
         
     except Exception as e:
-        print(f"Error inserting event: {e}")
-        connection.rollback()
-        connection.close()
+        logger.error(f"Error inserting event: {e}")
+        if commit:
+            connection.rollback()
+        else:
+            try:
+                cursor.execute("ROLLBACK TO SAVEPOINT insert_event")
+            except Exception:
+                connection.rollback()
         return None
+    finally:
+        if owns_connection:
+            connection.close()
+
+
+def _insert_one_by_one(events, connection, term_map=None):
+    """Fallback for insert_events_batch(): insert_event() per event, still one commit."""
+    post_ids = [insert_event(event, connection, commit=False, term_map=term_map) for event in events]
+    connection.commit()
+    return post_ids
+
+
+def insert_events_batch(events, connection, term_map=None):
+    """Insert many events with a handful of statements and one commit.
+    
+    Rows go in multi-row INSERTs split into chunks by _row_chunks(), so no
+    statement outgrows max_allowed_packet. MySQL hands out consecutive IDs to a
+    single multi-row insert (reported through lastrowid as the first one); that
+    is verified per chunk before relying on it, and GUIDs are set with one
+    UPDATE over each chunk's ID range. The event URLs are then claimed in
+    zuzl_event_url_dedupe, followed by the postmeta and term relationship rows.
+    If IDs interleave with another writer, a URL is already claimed or any
+    statement fails, the batch is rolled back and inserted one event at a time,
+    so a bad row only loses its own event.
+    
+    Args:
+        events (list): Validated, de-duplicated event dictionaries
+        connection: Open MySQL connection
+        term_map (dict, optional): Preloaded term map from preload_existing()
+        
+    Returns:
+        list: Post ID (URL_ALREADY_CLAIMED for a duplicate URL, None if the insert
+            failed) for each event, in order
+    """
+    if not events:
+        return []
+    
+    try:
+        cursor = connection.cursor()
+        
+        # Posts go in size-limited chunks. Each chunk is one multi-row INSERT, so its
+        # IDs are consecutive; that is checked per chunk
+        post_ids = []
+        for chunk in _row_chunks([build_post_values(event) for event in events]):
+            cursor.executemany(POST_SQL, chunk)
+            first_id = cursor.lastrowid
+            last_id = first_id + len(chunk) - 1
+            cursor.execute(
+                "SELECT COUNT(*) FROM zuzl_posts WHERE ID BETWEEN %s AND %s AND guid = ''",
+                (first_id, last_id)
+            )
+            if cursor.fetchone()[0] != len(chunk):
+                logger.warning("  ⚠️  Post IDs were not consecutive; inserting this batch one event at a time")
+                connection.rollback()
+                cursor.close()
+                return _insert_one_by_one(events, connection, term_map)
+            # Update GUIDs for the chunk's ID range
+            cursor.execute(
+                "UPDATE zuzl_posts SET guid = CONCAT('https://cveronline.com/?p=', ID) WHERE ID BETWEEN %s AND %s",
+                (first_id, last_id)
+            )
+            post_ids.extend(range(first_id, last_id + 1))
+        
+        # Claim every URL with multi-row INSERT IGNOREs. If any was already taken
+        # (another run got there first), fall back so each event is claimed on its own
+        dedupe_rows = [
+            (event['url'], post_id)
+            for post_id, event in zip(post_ids, events)
+            if event.get('url')
+        ]
+        if dedupe_rows:
+            if _executemany_chunked(cursor, DEDUPE_CLAIM_SQL, dedupe_rows) != len(dedupe_rows):
+                logger.warning("  ⚠️  Some event URLs were already inserted; inserting this batch one event at a time")
+                connection.rollback()
+                cursor.close()
+                return _insert_one_by_one(events, connection, term_map)
+        
+        meta_rows = [
+            (post_id, meta_key, meta_value)
+            for post_id, event in zip(post_ids, events)
+            for meta_key, meta_value in build_meta_entries(event)
+        ]
+        _executemany_chunked(cursor, META_SQL, meta_rows)
+        
+        # Resolve each distinct (category, subcategory) once per batch
+        taxonomy_ids = {}
+        relationship_rows = []
+        for post_id, event in zip(post_ids, events):
+            key = (event.get('category', ''), event.get('subcategory', ''))
+            if key not in taxonomy_ids:
+                taxonomy_ids[key] = get_term_taxonomy_id(cursor, *key, term_map)[0]
+                if not taxonomy_ids[key]:
+                    logger.warning(f"Warning: Could not find term for category='{key[0]}', subcategory='{key[1]}'. Events inserted without category relationship.")
+            if taxonomy_ids[key]:
+                relationship_rows.append((post_id, taxonomy_ids[key], 0))
+        if relationship_rows:
+            _executemany_chunked(cursor, RELATIONSHIP_SQL, relationship_rows)
+        
+        connection.commit()
+        cursor.close()
+        logger.info(f"Inserted {len(post_ids)} posts (IDs {post_ids[0]}-{post_ids[-1]}), {len(meta_rows)} meta entries, {len(relationship_rows)} category relationships")
+        return post_ids
+        
+    except Exception as e:
+        # One bad row (an unstorable character, an oversized value) fails the whole
+        # multi-row statement; retry per event so only that event is lost
+        logger.error(f"Error inserting event batch: {e}; inserting this batch one event at a time")
+        connection.rollback()
+        return _insert_one_by_one(events, connection, term_map)
+
+
+def get_backup_retention_days(settings=None):
+    """Return (days, source) for BACKUP_RETENTION_DAYS, defaulting to 7 without settings."""
+    if settings is None:
+        settings = get_db_settings()
+    if settings is None:
+        return 7, 'default'
+    return settings.get('BACKUP_RETENTION_DAYS', 7), 'from settings'
 
 
 def cleanup_old_backups(backup_folder, days_to_keep=None):
@@ -389,12 +855,7 @@ def cleanup_old_backups(backup_folder, days_to_keep=None):
     """
     # Get days_to_keep from settings if not provided
     if days_to_keep is None:
-        try:
-            from scrapy.utils.project import get_project_settings
-            settings = get_project_settings()
-            days_to_keep = settings.get('BACKUP_RETENTION_DAYS', 7)
-        except Exception:
-            days_to_keep = 7  # Default fallback
+        days_to_keep, _ = get_backup_retention_days()
     if not backup_folder.exists():
         return 0
     
@@ -402,31 +863,198 @@ def cleanup_old_backups(backup_folder, days_to_keep=None):
     deleted_count = 0
     total_size_freed = 0
     
+    cutoff_ts = cutoff_date.timestamp()
+    
     try:
-        for file_path in backup_folder.glob('*.json'):
-            # Get file modification time
-            file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-            
-            # Delete if older than cutoff date
-            if file_mtime < cutoff_date:
-                file_size = file_path.stat().st_size
-                try:
-                    file_path.unlink()
-                    deleted_count += 1
-                    total_size_freed += file_size
-                except Exception as e:
-                    print(f"  ⚠️  Warning: Could not delete old backup file {file_path.name}: {e}")
+        # scandir() entries carry their own stat result, so each file costs one stat call
+        with os.scandir(backup_folder) as entries:
+            for entry in entries:
+                if not entry.name.endswith(FEED_SUFFIXES) or not entry.is_file():
+                    continue
+                st = entry.stat()
+                
+                # Delete if older than cutoff date
+                if st.st_mtime < cutoff_ts:
+                    try:
+                        os.unlink(entry.path)
+                        deleted_count += 1
+                        total_size_freed += st.st_size
+                    except Exception as e:
+                        logger.warning(f"  ⚠️  Warning: Could not delete old backup file {entry.name}: {e}")
         
         if deleted_count > 0:
             size_mb = total_size_freed / (1024 * 1024)
-            print(f"  🗑️  Cleaned up {deleted_count} old backup file(s) (freed {size_mb:.2f} MB)")
+            logger.info(f"  🗑️  Cleaned up {deleted_count} old backup file(s) (freed {size_mb:.2f} MB)")
         
     except Exception as e:
-        print(f"  ⚠️  Warning: Error during backup cleanup: {e}")
+        logger.warning(f"  ⚠️  Warning: Error during backup cleanup: {e}")
     
     return deleted_count
 
 
+def _stream_events(json_file):
+    """Yield events one at a time from a JSON array file with ijson (single objects are loaded whole)."""
+    with open(json_file, 'rb') as f:
+        # Peek at the first non-whitespace byte to tell an array from a single object
+        head = f.read(1)
+        while head and head.isspace():
+            head = f.read(1)
+        f.seek(0)
+        if head == b'[':
+            # use_float: numbers (coordinates) come back as float, as with json.load, not Decimal
+            yield from ijson.items(f, 'item', use_float=True)
+        elif head:
+            event = json.load(f)
+            if event:
+                yield event
+
+
+def _read_json_lines(json_file, bad_lines=None):
+    """Yield events one at a time from a JSON Lines file (one event object per line).
+    
+    A line that does not decode (e.g. the truncated last line of a killed crawl) is
+    logged and skipped, so the valid lines around it are still inserted.
+    
+    Args:
+        json_file (Path): JSON Lines file
+        bad_lines (list): Optional list that gets the line number of each undecodable line
+    """
+    with open(json_file, 'rb') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = _loads(line)
+            except ValueError as e:
+                # JSONDecodeError and UnicodeDecodeError are both ValueErrors
+                logger.error(f"  ❌ Invalid JSON on line {line_no} of {json_file.name}: {e}")
+                if bad_lines is not None:
+                    bad_lines.append(line_no)
+                continue
+            yield event
+
+
+def load_events(json_file, bad_lines=None):
+    """Open a scraped JSON file for processing.
+    
+    JSON Lines files (.jsonl) are always read line by line. For JSON array files,
+    with ijson installed the events are streamed, so memory stays flat however
+    large the file is and inserts start as soon as the first event is parsed;
+    the count is then unknown up front. Without ijson the file is loaded whole.
+    
+    Args:
+        json_file (Path): JSON Lines file, or JSON file holding a list of events or a
+            single event object
+        bad_lines (list): Optional list that gets the line numbers of undecodable lines
+            in a JSON Lines file (those lines are skipped)
+        
+    Returns:
+        tuple: (iterable of events, number of events or None when streaming)
+    """
+    if json_file.suffix == '.jsonl':
+        return _read_json_lines(json_file, bad_lines), None
+    if ijson is not None:
+        return _stream_events(json_file), None
+    
+    with open(json_file, 'r', encoding='utf-8') as f:
+        events = json.load(f)
+    if not events:
+        return [], 0
+    if not isinstance(events, list):
+        # If it's a single event object, wrap it in a list
+        events = [events]
+    return events, len(events)
+
+
+def flush_staged(staged, num_events, connection, existing=None):
+    """Insert queued (position, event) pairs and report each result.
+    
+    Uses one insert_events_batch() call when a shared connection is open,
+    otherwise inserts the events one by one. Inserted events are added to
+    the preloaded duplicate maps when `existing` is given.
+    
+    Returns:
+        tuple: (successful, duplicates, failed) counts
+    """
+    events = [event for _, event in staged]
+    if connection:
+        post_ids = insert_events_batch(events, connection, existing[2] if existing else None)
+    else:
+        post_ids = [insert_event(event) for event in events]
+    
+    successful = 0
+    duplicates = 0
+    failed = 0
+    for (i, event), post_id in zip(staged, post_ids):
+        event_name = event.get('name', 'Unknown')[:50]
+        if post_id is URL_ALREADY_CLAIMED:
+            logger.info(f"  [{i}/{num_events}] ⏭️  Skipping duplicate (URL already inserted): {event_name}")
+            duplicates += 1
+        elif post_id:
+            logger.info(f"  [{i}/{num_events}] ✅ Successfully inserted: {event_name} (post ID: {post_id})")
+            successful += 1
+            if existing is not None:
+                remember_event(existing, event, post_id)
+        else:
+            logger.error(f"  [{i}/{num_events}] ❌ Failed to insert: {event_name}")
+            failed += 1
+    return successful, duplicates, failed
+
+
+def _record_flush(staged, num_events, connection, existing, inserted):
+    """flush_staged() and add its counts to the `inserted` totals dict."""
+    successful, duplicates, failed = flush_staged(staged, num_events, connection, existing)
+    inserted['successful'] += successful
+    inserted['duplicates'] += duplicates
+    inserted['failed'] += failed
+
+
+def _flush_file(staged, num_events, batches, connection, existing, inserted):
+    """Insert a file's remaining staged events and wait until all its batches are written.
+    
+    Called before the file is moved to backup, including when reading it failed
+    part-way, so events already read are never dropped.
+    """
+    if staged:
+        if batches is not None:
+            batches.put((staged, num_events))
+        else:
+            _record_flush(staged, num_events, connection, existing, inserted)
+    if batches is not None:
+        batches.join()
+
+
+def _flush_after_error(staged, num_events, batches, connection, existing, inserted):
+    """_flush_file() for a file that failed part-way; a failure here is logged, not raised."""
+    try:
+        _flush_file(staged, num_events, batches, connection, existing, inserted)
+    except Exception as e:
+        logger.error(f"  ❌ Error inserting events read before the failure: {e}")
+        inserted['failed'] += len(staged)
+
+
+def _insert_worker(batches, connection, existing, inserted):
+    """Consumer thread for main(): insert queued batches until a None sentinel arrives.
+    
+    The worker is the only user of the shared connection while it runs, so it
+    also keeps that connection alive.
+    """
+    while True:
+        item = batches.get()
+        try:
+            if item is None:
+                return
+            staged, num_events = item
+            connection.ping(reconnect=True, attempts=3, delay=1)
+            _record_flush(staged, num_events, connection, existing, inserted)
+        except Exception as e:
+            logger.error(f"  ❌ Error inserting batch: {e}")
+            inserted['failed'] += len(staged)
+        finally:
+            batches.task_done()
+
+
 def main(json_folder=None):
     """Process all JSON files from scraped_data folder and insert new events.
     
@@ -434,6 +1062,9 @@ def main(json_folder=None):
         json_folder (str, optional): Path to folder containing JSON files.
             If None, uses default 'scraped_data' folder in event_scraping directory.
     """
+    # Scrapy settings (database config, backup retention) are loaded once for the whole run
+    settings = get_db_settings()
+    
     # Get the script directory and set default folder
     script_dir = Path(__file__).parent
     if json_folder is None:
@@ -442,10 +1073,11 @@ def main(json_folder=None):
         json_folder = Path(json_folder)
     
     if not json_folder.exists():
-        print(f"Error: Folder '{json_folder}' does not exist!")
-        print(f"Creating folder '{json_folder}'...")
+        logger.error(f"Error: Folder '{json_folder}' does not exist!")
+        logger.info(f"Creating folder '{json_folder}'...")
         json_folder.mkdir(parents=True, exist_ok=True)
-        print(f"Folder created. Please ensure JSON files exist in this folder.")
+        logger.info(f"Folder created. Please ensure JSON files exist in this folder.")
+        LOG_BUFFER.flush()
         return
     
     # Create backup folder for processed files
@@ -453,148 +1085,273 @@ def main(json_folder=None):
     backup_folder.mkdir(exist_ok=True)
     
     # Clean up old backup files (reads retention days from settings)
-    print("=" * 80)
-    print("🧹 CLEANING UP OLD BACKUP FILES")
-    print("=" * 80)
-    try:
-        from scrapy.utils.project import get_project_settings
-        settings = get_project_settings()
-        retention_days = settings.get('BACKUP_RETENTION_DAYS', 7)
-        print(f"Retention period: {retention_days} days (from settings)")
-    except Exception:
-        retention_days = 7
-        print(f"Retention period: {retention_days} days (default)")
+    logger.info("=" * 80)
+    logger.info("🧹 CLEANING UP OLD BACKUP FILES")
+    logger.info("=" * 80)
+    retention_days, source = get_backup_retention_days(settings)
+    logger.info(f"Retention period: {retention_days} days ({source})")
     cleanup_old_backups(backup_folder, days_to_keep=retention_days)
-    print("=" * 80)
+    logger.info("=" * 80)
     
     # Process all JSON files in the folder
-    json_files = list(json_folder.glob('*.json'))
+    json_files = [path for suffix in FEED_SUFFIXES for path in json_folder.glob(f'*{suffix}')]
     
     if not json_files:
-        print(f"Error: No JSON files found in '{json_folder}'")
-        print("Please ensure JSON files exist in the scraped_data folder.")
+        logger.error(f"Error: No JSON files found in '{json_folder}'")
+        logger.info("Please ensure JSON files exist in the scraped_data folder.")
+        LOG_BUFFER.flush()
         return
     
-    print("=" * 80)
-    print(f"Processing {len(json_files)} JSON file(s)")
-    print("=" * 80)
+    logger.info("=" * 80)
+    logger.info(f"Processing {len(json_files)} JSON file(s)")
+    logger.info("=" * 80)
     
     total_events = 0
     total_successful = 0
     total_failed = 0
     total_duplicates = 0
     total_invalid_coords = 0
-    for json_file in json_files:
-        print(f"\n📄 Processing file: {json_file.name}")
-        print("-" * 80)
-        
+    
+    # db_connection prints directly, so write out what is buffered first
+    LOG_BUFFER.flush()
+    
+    # One connection for the whole run instead of two connect/auth handshakes per event.
+    # If it cannot be opened, event_exists()/insert_event() fall back to their own connections
+    connection = get_connection(settings)
+    events_since_ping = 0
+    
+    # Writes are only made durable by the one commit per batch (see insert_events_batch()),
+    # so the binlog/redo log is flushed once per INSERT_BATCH_SIZE events, not once per event
+    if connection:
+        connection.autocommit = False
+    
+    # One-off: index the duplicate-check lookups and build the URL dedupe table (no-op once they exist)
+    if connection:
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                events = json.load(f)
-            
-            if not events:
-                print(f"  ⚠️  No events found in {json_file.name}")
-                continue
-            
-            if not isinstance(events, list):
-                # If it's a single event object, wrap it in a list
-                events = [events]
-            
-            num_events = len(events)
-            total_events += num_events
-            print(f"  Found {num_events} event(s) in {json_file.name}")
+            ensure_event_url_index(connection, 'zuzl_')
+            ensure_post_title_index(connection, 'zuzl_')
+            ensure_event_url_dedupe_table(connection, 'zuzl_')
+            released = prune_event_url_dedupe(connection, 'zuzl_')
+            if released:
+                logger.info(f"Released {released} URL claim(s) of posts that are no longer published")
+        except Exception as e:
+            logger.warning(f"  ⚠️  Warning: Could not create duplicate-check indexes: {e}")
+    
+    # Existing URLs, title+date pairs and terms in one pass, so duplicate checks and
+    # category lookups are dict hits instead of SELECTs per event
+    existing = None
+    if connection:
+        try:
+            existing = preload_existing(connection)
+        except Exception as e:
+            logger.warning(f"  ⚠️  Warning: Could not preload existing events, checking per event: {e}")
+    
+    # Inserted/failed counts, updated by whoever flushes batches
+    inserted = {'successful': 0, 'duplicates': 0, 'failed': 0}
+    
+    # With the duplicate maps preloaded, reading and checking events needs no database
+    # access, so batches are handed to a writer thread and the next batch is parsed while
+    # the previous one is inserted. The queue is small to keep memory bounded. Without the
+    # maps, event_exists() queries the shared connection, so everything stays on this thread
+    batches = None
+    writer = None
+    if connection and existing is not None:
+        batches = queue.Queue(maxsize=2)
+        writer = threading.Thread(
+            target=_insert_worker, args=(batches, connection, existing, inserted), daemon=True
+        )
+        writer.start()
+    try:
+        for json_file in json_files:
+            logger.info(f"\n📄 Processing file: {json_file.name}")
+            logger.info("-" * 80)
+        
+            # Defined before reading so the error handlers below can still insert
+            # whatever was staged before the file failed
+            staged = []
+            num_events = None
+            bad_lines = []
+            try:
+                events, num_events = load_events(json_file, bad_lines)
+                if num_events == 0:
+                    logger.warning(f"  ⚠️  No events found in {json_file.name}")
+                    continue
+                if num_events is None:
+                    # Streaming: the total is only known once the file has been read
+                    logger.info(f"  Streaming events from {json_file.name}")
+                    num_events = '?'
+                else:
+                    logger.info(f"  Found {num_events} event(s) in {json_file.name}")
             
-            file_successful = 0
-            file_failed = 0
-            file_duplicates = 0
-            file_invalid_coords = 0
+                # Counts before this file (a file that errored may have left batches queued)
+                if batches is not None:
+                    batches.join()
+                file_start_successful = inserted['successful']
+                file_start_failed = inserted['failed']
+                file_start_claimed = inserted['duplicates']
+                file_duplicates = 0
+                file_invalid_coords = 0
+                # (position, event) pairs waiting for the next batch insert, plus the
+                # URLs / (name, date) pairs already staged so in-file repeats are caught
+                staged = []
+                staged_urls = set()
+                staged_name_dates = set()
             
-            for i, event in enumerate(events, 1):
-                event_name = event.get('name', 'Unknown')[:50]
-                event_url = event.get('url', 'N/A')[:50]
+                # Without the preloaded maps, resolve the URLs of a whole-loaded file in one
+                # temp-table join, so only events with a new URL need event_exists()
+                known_urls = {}
+                if connection and existing is None and isinstance(events, list):
+                    try:
+                        known_urls = lookup_existing_urls(connection, (event.get('url', '') for event in events))
+                    except Exception as e:
+                        logger.warning(f"  ⚠️  Warning: Could not look up URLs in bulk, checking per event: {e}")
                 
-                # Check if event already exists
-                existing_post_id = event_exists(event)
-                if existing_post_id:
-                    print(f"  [{i}/{num_events}] ⏭️  Skipping duplicate: {event_name} (exists as post ID: {existing_post_id})")
-                    file_duplicates += 1
-                    total_duplicates += 1
-                    continue
+                i = 0
+                for i, event in enumerate(events, 1):
+                    event_name = event.get('name', 'Unknown')[:50]
+                    event_url = event.get('url', 'N/A')[:50]
                 
-                # Validate coordinates before insertion - skip if invalid or missing
-                coords = event.get('coordinates', {})
-                is_valid, reason = validate_uk_coordinates(coords)
-                if not is_valid:
-                    print(f"  [{i}/{num_events}] ⏭️  Skipping event with invalid/missing coordinates: {event_name} - {reason}")
-                    file_invalid_coords += 1
-                    total_invalid_coords += 1
-                    continue
+                    # Keep the shared connection alive across long runs (server idle timeouts).
+                    # When the writer thread owns the connection it pings before each batch
+                    events_since_ping += 1
+                    if connection and batches is None and events_since_ping >= DB_PING_EVERY:
+                        connection.ping(reconnect=True, attempts=3, delay=1)
+                        events_since_ping = 0
+                    
+                    # Check if event already exists
+                    existing_post_id = known_urls.get(event.get('url', '').lower()) if known_urls else None
+                    if not existing_post_id:
+                        existing_post_id = event_exists(event, connection, existing)
+                    if existing_post_id:
+                        logger.info(f"  [{i}/{num_events}] ⏭️  Skipping duplicate: {event_name} (exists as post ID: {existing_post_id})")
+                        file_duplicates += 1
+                        total_duplicates += 1
+                        continue
+                    
+                    # Not in the database yet, but maybe staged earlier in this file
+                    url = event.get('url', '')
+                    name_date = (event.get('name', ''), event.get('date', ''))
+                    if (url and url in staged_urls) or (all(name_date) and name_date in staged_name_dates):
+                        logger.info(f"  [{i}/{num_events}] ⏭️  Skipping duplicate: {event_name} (already queued in this file)")
+                        file_duplicates += 1
+                        total_duplicates += 1
+                        continue
                 
-                # Insert new event
-                print(f"  [{i}/{num_events}] ➕ Inserting: {event_name}")
-                post_id = insert_event(event)
+                    # Validate coordinates before insertion - skip if invalid or missing
+                    coords = event.get('coordinates', {})
+                    is_valid, reason = validate_uk_coordinates(coords)
+                    if not is_valid:
+                        logger.info(f"  [{i}/{num_events}] ⏭️  Skipping event with invalid/missing coordinates: {event_name} - {reason}")
+                        file_invalid_coords += 1
+                        total_invalid_coords += 1
+                        continue
                 
-                if post_id:
-                    print(f"      ✅ Successfully inserted (post ID: {post_id})")
-                    file_successful += 1
-                    total_successful += 1
-                else:
-                    print(f"      ❌ Failed to insert")
-                    file_failed += 1
-                    total_failed += 1
+                    # Queue new event; it is written with the rest of its batch
+                    logger.info(f"  [{i}/{num_events}] ➕ Queued for insert: {event_name}")
+                    staged.append((i, event))
+                    if url:
+                        staged_urls.add(url)
+                    if all(name_date):
+                        staged_name_dates.add(name_date)
+                    
+                    # Flush full batches as they fill up
+                    if len(staged) >= INSERT_BATCH_SIZE:
+                        # Cleared first so an error handler below never inserts it twice
+                        batch, staged = staged, []
+                        if batches is not None:
+                            batches.put((batch, num_events))
+                        else:
+                            _record_flush(batch, num_events, connection, existing, inserted)
+                
+                # Insert whatever is left once the file is done, and wait for this file's
+                # batches: the summary needs their counts, and the next file's duplicate
+                # check needs them in the preloaded maps
+                batch, staged = staged, []
+                _flush_file(batch, num_events, batches, connection, existing, inserted)
+                file_successful = inserted['successful'] - file_start_successful
+                # Lines that could not be decoded count as failed events
+                file_failed = inserted['failed'] - file_start_failed + len(bad_lines)
+                total_failed += len(bad_lines)
+                # Events whose URL claim was lost at insert time are duplicates too
+                file_claimed = inserted['duplicates'] - file_start_claimed
+                file_duplicates += file_claimed
+                total_duplicates += file_claimed
+                
+                total_events += i + len(bad_lines)
+                if i == 0 and not bad_lines:
+                    logger.warning(f"  ⚠️  No events found in {json_file.name}")
+                    continue
+                if num_events == '?':
+                    logger.info(f"  Read {i} event(s) from {json_file.name}")
             
-            print(f"\n  📊 File Summary for {json_file.name}:")
-            print(f"     ✅ Successful: {file_successful}")
-            print(f"     ⏭️  Duplicates: {file_duplicates}")
-            print(f"     ⚠️  Invalid coordinates: {file_invalid_coords}")
-            print(f"     ❌ Failed: {file_failed}")
+                logger.info(f"\n  📊 File Summary for {json_file.name}:")
+                logger.info(f"     ✅ Successful: {file_successful}")
+                logger.info(f"     ⏭️  Duplicates: {file_duplicates}")
+                logger.info(f"     ⚠️  Invalid coordinates: {file_invalid_coords}")
+                logger.info(f"     ❌ Failed: {file_failed}")
+                LOG_BUFFER.flush()
             
-            # Move processed file to backup folder
-            try:
-                backup_path = backup_folder / json_file.name
-                # If file already exists in backup, add timestamp to avoid overwriting
-                if backup_path.exists():
-                    from datetime import datetime
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    backup_path = backup_folder / f"{json_file.stem}_{timestamp}{json_file.suffix}"
+                # Move processed file to backup folder
+                try:
+                    backup_path = backup_folder / json_file.name
+                    # If file already exists in backup, add timestamp to avoid overwriting
+                    if backup_path.exists():
+                        from datetime import datetime
+                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                        backup_path = backup_folder / f"{json_file.stem}_{timestamp}{json_file.suffix}"
                 
-                json_file.rename(backup_path)
-                print(f"  📦 Moved processed file to backup: {backup_path.name}")
-            except Exception as e:
-                print(f"  ⚠️  Warning: Could not move file to backup: {e}")
+                    json_file.rename(backup_path)
+                    logger.info(f"  📦 Moved processed file to backup: {backup_path.name}")
+                except Exception as e:
+                    logger.warning(f"  ⚠️  Warning: Could not move file to backup: {e}")
             
-        except json.JSONDecodeError as e:
-            print(f"  ❌ Error: Invalid JSON in {json_file.name}: {e}")
-            total_failed += 1
-            # Move invalid JSON file to backup as well
-            try:
-                backup_path = backup_folder / f"{json_file.stem}_invalid{json_file.suffix}"
-                json_file.rename(backup_path)
-                print(f"  📦 Moved invalid file to backup: {backup_path.name}")
-            except Exception:
-                pass
-        except Exception as e:
-            print(f"  ❌ Error processing {json_file.name}: {e}")
-            total_failed += 1
-            # Try to move file to backup even on error
-            try:
-                backup_path = backup_folder / f"{json_file.stem}_error{json_file.suffix}"
-                json_file.rename(backup_path)
-                print(f"  📦 Moved error file to backup: {backup_path.name}")
-            except Exception:
-                pass
+            except JSON_ERRORS as e:
+                logger.error(f"  ❌ Error: Invalid JSON in {json_file.name}: {e}")
+                total_failed += 1
+                _flush_after_error(staged, num_events, batches, connection, existing, inserted)
+                # Move invalid JSON file to backup as well
+                try:
+                    backup_path = backup_folder / f"{json_file.stem}_invalid{json_file.suffix}"
+                    json_file.rename(backup_path)
+                    logger.info(f"  📦 Moved invalid file to backup: {backup_path.name}")
+                except Exception:
+                    pass
+            except Exception as e:
+                logger.error(f"  ❌ Error processing {json_file.name}: {e}")
+                total_failed += 1
+                _flush_after_error(staged, num_events, batches, connection, existing, inserted)
+                # Try to move file to backup even on error
+                try:
+                    backup_path = backup_folder / f"{json_file.stem}_error{json_file.suffix}"
+                    json_file.rename(backup_path)
+                    logger.info(f"  📦 Moved error file to backup: {backup_path.name}")
+                except Exception:
+                    pass
+    
+    finally:
+        if writer is not None:
+            # Let the writer finish anything still queued, then stop it
+            batches.put(None)
+            writer.join()
+        LOG_BUFFER.flush()
+        if connection:
+            connection.close()
+    
+    total_successful += inserted['successful']
+    total_failed += inserted['failed']
     
     # Final summary
-    print("\n" + "=" * 80)
-    print("📊 FINAL SUMMARY")
-    print("=" * 80)
-    print(f"JSON files processed: {len(json_files)}")
-    print(f"Total events found: {total_events}")
-    print(f"✅ Successfully inserted: {total_successful}")
-    print(f"⏭️  Duplicates skipped: {total_duplicates}")
-    print(f"⚠️  Invalid coordinates skipped: {total_invalid_coords}")
-    print(f"❌ Failed: {total_failed}")
-    print("=" * 80)
+    logger.info("\n" + "=" * 80)
+    logger.info("📊 FINAL SUMMARY")
+    logger.info("=" * 80)
+    logger.info(f"JSON files processed: {len(json_files)}")
+    logger.info(f"Total events found: {total_events}")
+    logger.info(f"✅ Successfully inserted: {total_successful}")
+    logger.info(f"⏭️  Duplicates skipped: {total_duplicates}")
+    logger.info(f"⚠️  Invalid coordinates skipped: {total_invalid_coords}")
+    logger.info(f"❌ Failed: {total_failed}")
+    logger.info("=" * 80)
+    LOG_BUFFER.flush()
 
 
 if __name__ == "__main__":
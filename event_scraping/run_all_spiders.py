@@ -1,8 +1,8 @@
 """
-Master script to run ALL spiders sequentially, then process and insert events.
+Master script to run ALL spiders in parallel, then process and insert events.
 
 This script:
-1. Runs all spiders from all categories one by one:
+1. Runs all spiders from all categories, up to MAX_PARALLEL_SPIDERS at a time:
    - Community & Social: bhf, eventbrite, gosh, macmillan
    - Fitness & Training: findarace, letsdothis, runguides, runthrough, timeoutdoors, ukrunningevents
    - Wellness & Mind: mindfulnessassociation, mindfulnessuk, mindspace, pilatesflow, sharphamtrust, yogawithmanon
@@ -10,21 +10,25 @@ This script:
 
 Uses subprocess to run each spider in a separate process to avoid Twisted reactor conflicts.
 """
+import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 # Import insert_event module
 from insert_event import main as insert_events
+from runner_settings import RUN_DATE, get_output_file, get_output_shards
+
+# Spiders are network-bound and share nothing but the output folder, so several can run at once.
+# Kept modest: some spiders drive a headless Chrome, and every process has its own geocoding limiter
+MAX_PARALLEL_SPIDERS = int(os.environ.get('MAX_PARALLEL_SPIDERS', 4))
 
 
 def get_spider_config(spider_class, spider_name):
     """Get configuration for a spider including output file path."""
-    scraped_data_dir = Path(__file__).parent / "scraped_data"
-    scraped_data_dir.mkdir(exist_ok=True)
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    output_file = str(scraped_data_dir / f"{spider_name}_{date_str}.json")
+    output_file = get_output_file(spider_name)
     
     return {
         "spider_class": spider_class,
@@ -33,8 +37,52 @@ def get_spider_config(spider_class, spider_name):
     }
 
 
+def _run_one(spider_name, script_dir):
+    """Run one spider script in a subprocess and check its output file.
+    
+    Returns:
+        tuple: (ok, status message, captured stdout+stderr)
+    """
+    # Find the individual spider script
+    spider_script = script_dir / f"run_{spider_name}_spider.py"
+    
+    if not spider_script.exists():
+        return False, f"❌ Spider script not found: {spider_script}", ""
+    
+    # Run the spider script in a subprocess, with this run's date so its feed name
+    # matches the one checked below even if it starts after midnight, and under
+    # PYTHONOPTIMIZE=1 (unless set otherwise) so asserts in the crawl stack are stripped
+    env = {**os.environ, "RUN_DATE": RUN_DATE}
+    env.setdefault("PYTHONOPTIMIZE", "1")
+    result = subprocess.run(
+        [sys.executable, str(spider_script)],
+        cwd=str(script_dir),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True
+    )
+    output = f"Running script: {spider_script.name}\n{result.stdout or ''}"
+    
+    # Check if spider completed successfully
+    if result.returncode != 0:
+        return False, f"❌ {spider_name} failed with return code: {result.returncode}", output
+    
+    # Check if output files were created (the feed is split into numbered shards)
+    output_files = get_output_shards(spider_name)
+    
+    if not output_files:
+        return False, f"⚠️  {spider_name} completed but no output file was created", output
+    
+    file_size = sum(path.stat().st_size for path in output_files)
+    if file_size == 0:
+        return False, f"⚠️  {spider_name} completed but output file is empty", output
+    names = ", ".join(path.name for path in output_files)
+    return True, f"✅ {spider_name} completed successfully - Output file(s): {names} ({file_size} bytes)", output
+
+
 def run_all_spiders():
-    """Run all spiders sequentially, each in a separate subprocess to avoid Twisted reactor conflicts."""
+    """Run all spiders in parallel, each in a separate subprocess to avoid Twisted reactor conflicts."""
     # Define all spiders from all categories
     spiders = [
         # Community & Social
@@ -68,66 +116,43 @@ def run_all_spiders():
     # Get script directory to find individual spider scripts
     script_dir = Path(__file__).parent
     
-    # Run each spider in a separate subprocess
-    # This prevents Twisted reactor conflicts
+    # Run each spider in a separate subprocess (this prevents Twisted reactor conflicts).
+    # The worker threads only wait on their subprocess, so a thread pool is enough
     successful = 0
     failed = 0
+    workers = max(1, min(MAX_PARALLEL_SPIDERS, len(spiders)))
+    print(f"Running up to {workers} spider(s) in parallel")
     
-    for i, spider_name in enumerate(spiders, 1):
-        try:
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(_run_one, spider_name, script_dir): spider_name for spider_name in spiders}
+        for done, future in enumerate(as_completed(futures), 1):
+            spider_name = futures[future]
             print(f"\n{'=' * 80}")
-            print(f"[{i}/{len(spiders)}] Running: {spider_name}")
+            print(f"[{done}/{len(spiders)}] Finished: {spider_name}")
             print(f"{'=' * 80}")
-            
-            # Find the individual spider script
-            spider_script = script_dir / f"run_{spider_name}_spider.py"
-            
-            if not spider_script.exists():
-                print(f"❌ Spider script not found: {spider_script}")
+            try:
+                ok, message, output = future.result()
+            except Exception as e:
+                print(f"❌ {spider_name} failed with exception: {e}")
+                import traceback
+                traceback.print_exc()
                 failed += 1
                 continue
             
-            print(f"Running script: {spider_script.name}")
-            
-            # Run the spider script in a subprocess
-            result = subprocess.run(
-                [sys.executable, str(spider_script)],
-                cwd=str(script_dir),
-                capture_output=False,  # Show output in real-time
-                text=True
-            )
-            
-            # Check if spider completed successfully
-            if result.returncode == 0:
-                # Check if output file was created
-                scraped_data_dir = script_dir / "scraped_data"
-                date_str = datetime.now().strftime("%Y-%m-%d")
-                output_file = scraped_data_dir / f"{spider_name}_{date_str}.json"
-                
-                if output_file.exists():
-                    file_size = output_file.stat().st_size
-                    if file_size > 0:
-                        print(f"✅ {spider_name} completed successfully - Output file: {output_file.name} ({file_size} bytes)")
-                        successful += 1
-                    else:
-                        print(f"⚠️  {spider_name} completed but output file is empty")
-                        failed += 1
-                else:
-                    print(f"⚠️  {spider_name} completed but no output file was created")
-                    failed += 1
+            # Output is captured so parallel spiders don't interleave; show it now
+            if output:
+                print(output.rstrip())
+            print(message)
+            if ok:
+                successful += 1
             else:
-                print(f"❌ {spider_name} failed with return code: {result.returncode}")
                 failed += 1
-            
-        except KeyboardInterrupt:
-            print(f"\n⚠️  Process interrupted by user during {spider_name}")
-            return False
-        except Exception as e:
-            print(f"❌ {spider_name} failed with exception: {e}")
-            import traceback
-            traceback.print_exc()
-            failed += 1
-            continue
+    except KeyboardInterrupt:
+        print("\n⚠️  Process interrupted by user")
+        executor.shutdown(wait=False, cancel_futures=True)
+        return False
+    executor.shutdown(wait=True)
     
     print(f"\n{'=' * 80}")
     print("✅ ALL SPIDERS COMPLETED")
@@ -0,0 +1,142 @@
+"""
+Run one or more spiders in a single Scrapy process.
+
+Usage:
+    python run_spiders.py --spiders eventbrite,findarace,mindspace
+
+All spiders given share one Twisted reactor, so they also share the DNS cache,
+the reactor thread pool and the HTTP connection pool, and the reactor/settings
+start-up cost is paid once. Each spider still writes its own feed file
+(scraped_data/spidername_YYYY-MM-DD.jsonl).
+
+The run_<name>_spider.py scripts are thin wrappers around main() for a single spider.
+
+Run with python -O (or PYTHONOPTIMIZE=1) to strip the asserts and __debug__ branches in
+Scrapy, parsel and lxml's Python code; run_all_spiders.py starts its spider
+subprocesses that way.
+"""
+import argparse
+import importlib
+import logging
+import sys
+import threading
+
+from scrapy.crawler import CrawlerProcess
+
+from runner_settings import build_feed, build_process_settings, get_output_file
+
+logger = logging.getLogger(__name__)
+
+# Spider name -> (module, class). Imported only when the spider is run, since some
+# spider modules pull in Selenium
+SPIDER_REGISTRY = {
+    # Community & Social
+    "bhf": ("event_scraping.spiders.community_social.bhf_spider", "BHFSpider"),
+    "eventbrite": ("event_scraping.spiders.community_social.eventbrite_spider", "EventbriteSpider"),
+    "gosh": ("event_scraping.spiders.community_social.gosh_spider", "GOSHSpider"),
+    "macmillan": ("event_scraping.spiders.community_social.macmillan_spider", "MacmillanSpider"),
+    # Fitness & Training
+    "findarace": ("event_scraping.spiders.fitness_training.findarace_spider", "FindARaceSpider"),
+    "letsdothis": ("event_scraping.spiders.fitness_training.letsdothis_spider", "LetsDoThisSpider"),
+    "runguides": ("event_scraping.spiders.fitness_training.runguides_spider", "RunGuidesSpider"),
+    "runningcalendar": ("event_scraping.spiders.fitness_training.runningcalendar_spider", "RunningCalendarSpider"),
+    "runthrough": ("event_scraping.spiders.fitness_training.runthrough_spider", "RunThroughSpider"),
+    "timeoutdoors": ("event_scraping.spiders.fitness_training.timeoutdoors_spider", "TimeOutdoorsSpider"),
+    "ukrunningevents": ("event_scraping.spiders.fitness_training.ukrunningevents_spider", "UKRunningEventsSpider"),
+    # Wellness & Mind
+    "mindfulnessassociation": ("event_scraping.spiders.wellness_mind.mindfulnessassociation_spider", "MindfulnessAssociationSpider"),
+    "mindfulnessuk": ("event_scraping.spiders.wellness_mind.mindfulnessuk_spider", "MindfulnessUKSpider"),
+    "mindspace": ("event_scraping.spiders.wellness_mind.mindspace_spider", "MindspaceSpider"),
+    "pilatesflow": ("event_scraping.spiders.wellness_mind.pilatesflow_spider", "PilatesFlowSpider"),
+    "sharphamtrust": ("event_scraping.spiders.wellness_mind.sharphamtrust_spider", "SharphamTrustSpider"),
+    "yogawithmanon": ("event_scraping.spiders.wellness_mind.yogawithmanon_spider", "YogaWithManonSpider"),
+}
+
+# Per-spider settings on top of runner_settings.build_process_settings()
+SPIDER_OVERRIDES = {
+    "mindspace": {
+        "DOWNLOAD_DELAY": 2,  # Mindspace answers 403 when hit too quickly
+        "HTTPERROR_ALLOWED_CODES": [403, 404],  # Allow 403 and 404 responses
+    },
+    "runguides": {
+        "HTTPERROR_ALLOWED_CODES": [404, 403, 500, 503],  # Allow these status codes to be processed
+    },
+    "ukrunningevents": {
+        "HTTPERROR_ALLOWED_CODES": [404, 403, 500, 503],  # Allow these status codes to be processed
+        "DUPEFILTER_CLASS": "scrapy.dupefilters.BaseDupeFilter",  # Ensure duplicate filter works
+    },
+}
+
+
+def load_spider(spider_name):
+    """Import and return the spider class registered under spider_name."""
+    module_name, class_name = SPIDER_REGISTRY[spider_name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def preload_spiders(spider_names):
+    """Start importing the spiders' modules on a background thread.
+
+    The spider packages import every spider in their category, Selenium included, which
+    takes most of a second. Started before CrawlerProcess is built, the imports overlap
+    with reactor and settings set-up, and load_spider() then finds the modules in
+    sys.modules (or waits on the import lock for one still loading). Import errors are
+    left for load_spider() to raise on the main thread.
+    """
+    def _import_all():
+        for spider_name in spider_names:
+            try:
+                importlib.import_module(SPIDER_REGISTRY[spider_name][0])
+            except Exception:
+                pass
+
+    threading.Thread(target=_import_all, name="spider-preload", daemon=True).start()
+
+
+def main(argv=None):
+    """Run the spiders named on the command line in one CrawlerProcess.
+
+    Args:
+        argv (list, optional): Command line arguments, e.g. ["--spiders", "bhf,gosh"].
+            Defaults to sys.argv[1:]
+    """
+    parser = argparse.ArgumentParser(description="Run one or more spiders in a single Scrapy process.")
+    parser.add_argument(
+        "--spiders",
+        required=True,
+        help=f"Comma-separated spider names: {', '.join(SPIDER_REGISTRY)}"
+    )
+    args = parser.parse_args(argv)
+
+    spider_names = [name.strip() for name in args.spiders.split(",") if name.strip()]
+    unknown = [name for name in spider_names if name not in SPIDER_REGISTRY]
+    if unknown or not spider_names:
+        parser.error(f"unknown spider(s): {', '.join(unknown) or '(none given)'}")
+
+    preload_spiders(spider_names)
+    process = CrawlerProcess(build_process_settings())
+    for spider_name in spider_names:
+        spider_class = load_spider(spider_name)
+        output_file = get_output_file(spider_name)
+
+        # CrawlerProcess has installed Scrapy's root log handler by now, so this goes out
+        # with the crawl log in the same format instead of as separate prints. Logged at
+        # WARNING because that handler filters at LOG_LEVEL (WARNING by default), and every
+        # run should still say which spider is running and where its feed goes
+        logger.warning("Running %s spider (%s) -> %s", spider_class.__name__, spider_class.name, output_file)
+
+        # The process settings are shared, so each spider's feed and overrides ride on a
+        # subclass's custom_settings. The spider's own custom_settings still win, as they
+        # did when every runner built its own process
+        custom_settings = {
+            "FEEDS": {output_file: build_feed()},
+            **SPIDER_OVERRIDES.get(spider_name, {}),
+            **(spider_class.custom_settings or {}),
+        }
+        process.crawl(type(spider_class.__name__, (spider_class,), {"custom_settings": custom_settings}))
+
+    process.start()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,222 @@
+"""
+Shared Scrapy settings for run_spiders.py and the run_*_spider.py scripts.
+
+Every runner used to carry its own copy of the same settings dict; crawl tuning now
+lives here so it is changed in one place. run_spiders.py builds one process from
+build_process_settings() and gives each spider its feed (build_feed()) and site-specific
+overrides; build_settings() returns the same thing merged for a single-spider process.
+"""
+import importlib.util
+import os
+import time
+from pathlib import Path
+
+from scrapy.utils.project import get_project_settings
+
+from event_scraping.http_profile import BROWSER_HEADERS, BROWSER_UA
+
+# Scraping is network-bound: the downloader spends most of its time waiting on responses,
+# so several requests in flight per site overlap that wait. AutoThrottle still backs off
+# when a site's latency grows, so these are upper bounds rather than a fixed rate
+CONCURRENT_REQUESTS = 16
+CONCURRENT_REQUESTS_PER_DOMAIN = 8
+DOWNLOAD_DELAY = 0.25
+AUTOTHROTTLE_TARGET_CONCURRENCY = 4.0
+
+# With several requests in flight: resolve each host once (the default-sized DNS cache is
+# far larger than the handful of sites crawled), give DNS lookups a thread pool that does
+# not queue behind other blocking calls, and let the scheduler hand out requests for
+# domains whose download slots are idle instead of queueing behind a busy one
+DNS_SETTINGS = {
+    "DNSCACHE_ENABLED": True,
+    "DNS_TIMEOUT": 10,
+    "REACTOR_THREADPOOL_MAXSIZE": 40,
+}
+SCHEDULER_PRIORITY_QUEUE = "scrapy.pqueues.DownloaderAwarePriorityQueue"
+DOWNLOAD_TIMEOUT = 30
+
+# The asyncio reactor waits on sockets through epoll/kqueue rather than select(), which
+# caps out around 1024 (512 on Windows) open descriptors. It is Scrapy's default since
+# 2.13 and settings.py does not change it; pinned here so the raised concurrency above
+# never ends up on the select reactor. CrawlerProcess installs it from this setting
+TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
+
+# Ask for compressed responses: event listing HTML shrinks several times over the wire.
+# HttpCompressionMiddleware sets Accept-Encoding to what it can decode (gzip, deflate,
+# plus br when the brotli package is installed), so the header is not hard-coded here
+# where it could advertise an encoding that cannot be decoded. Connections are already
+# kept alive by Scrapy's HTTP/1.1 connection pool
+COMPRESSION_ENABLED = True
+
+# Set HTTP2=1 to fetch https URLs over HTTP/2, multiplexing a site's requests over one
+# TLS connection. Needs the h2 package, and only works against sites that negotiate
+# HTTP/2, so it is opt-in
+# (find_spec only checks that h2 is installed; Scrapy imports it when the handler loads)
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+USE_HTTP2 = bool(os.getenv("HTTP2")) and H2_AVAILABLE
+HTTP2_SETTINGS = {
+    "DOWNLOAD_HANDLERS": {"https": "scrapy.core.downloader.handlers.http2.H2DownloadHandler"},
+}
+
+# Scrapy logs a line per request and item at INFO, which is formatting work the crawl
+# does not need in scheduled runs, so only warnings and errors show by default. Set
+# SCRAPY_LOG_LEVEL=INFO (or DEBUG) to see the full log; the periodic crawl stats
+# (also INFO) then come once a minute
+LOG_LEVEL = os.getenv("SCRAPY_LOG_LEVEL", "WARNING")
+LOGSTATS_INTERVAL = 60.0
+
+# Set ROTATE_USER_AGENT=1 to send each request with a user agent picked from
+# http_profile.BROWSER_USER_AGENTS instead of BROWSER_UA every time. Off by default:
+# sites that tie a session to its user agent can treat the switching as a bot
+ROTATE_USER_AGENT = bool(os.getenv("ROTATE_USER_AGENT"))
+
+# Set DEBUG=1 while developing a spider to replay responses from a local cache instead
+# of downloading the same pages on every run. Cached pages are kept for a day and the
+# RFC2616 policy still honours the sites' own Cache-Control headers. Off for real runs,
+# which must see the current listings
+HTTPCACHE_SETTINGS = {
+    "HTTPCACHE_ENABLED": True,
+    "HTTPCACHE_DIR": ".scrapy_httpcache",
+    "HTTPCACHE_EXPIRATION_SECS": 86400,
+    "HTTPCACHE_STORAGE": "scrapy.extensions.httpcache.FilesystemCacheStorage",
+    "HTTPCACHE_POLICY": "scrapy.extensions.httpcache.RFC2616Policy",
+}
+USE_HTTPCACHE = bool(os.getenv("DEBUG"))
+
+# Set PRETTY_JSON=1 to get an indented JSON array (.json) for reading by hand instead of
+# JSON Lines. Indented output goes through the slower stock exporter and is ~30% larger,
+# so it is for debugging only; insert_event.py reads either format
+PRETTY_JSON = bool(os.getenv("PRETTY_JSON"))
+
+# Project settings, read once per process: get_project_settings() looks up scrapy.cfg,
+# imports settings.py and builds a Settings object each call, and they do not change
+# between the spiders run by one process
+_BASE_SETTINGS = get_project_settings()
+
+
+# Feeds are written under event_scraping/scraped_data
+SCRAPED_DATA_DIR = Path(__file__).parent / "scraped_data"
+
+# Date in the feed file names, fixed once per run so spiders that finish either side of
+# midnight still write (and are checked for) the same date. UTC, so a DST change cannot
+# repeat or skip a date. run_all_spiders.py passes its RUN_DATE on to the spider
+# subprocesses it starts
+RUN_DATE = os.getenv("RUN_DATE") or time.strftime("%Y-%m-%d", time.gmtime())
+
+# Each feed is split into shards of this many items (spidername_YYYY-MM-DD_1.jsonl,
+# _2.jsonl, ...), so a large crawl does not end up as one file that has to be read in
+# one go, and shards can be processed or retried independently
+FEED_BATCH_ITEM_COUNT = 10000
+BATCH_ID_PLACEHOLDER = "%(batch_id)d"
+
+
+def get_output_file(spider_name):
+    """Return the feed path template for a spider: scraped_data/spidername_YYYY-MM-DD_%(batch_id)d.jsonl.
+
+    Scrapy fills in the batch number (from 1) for every FEED_BATCH_ITEM_COUNT items;
+    use get_output_shards() for the files actually written. The suffix is .json with
+    PRETTY_JSON. Returns a Path, which FEEDS accepts as a key directly. parents=True
+    lets the name include subdirectories (e.g. per-year folders) without further changes.
+    """
+    suffix = ".json" if PRETTY_JSON else ".jsonl"
+    output_file = SCRAPED_DATA_DIR / f"{spider_name}_{RUN_DATE}_{BATCH_ID_PLACEHOLDER}{suffix}"
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    return output_file
+
+
+def get_output_shards(spider_name):
+    """Return the feed shards written for a spider on RUN_DATE, in batch order.
+
+    Args:
+        spider_name (str): Spider name
+
+    Returns:
+        list: Paths of the existing spidername_YYYY-MM-DD_N files
+    """
+    output_file = get_output_file(spider_name)
+    prefix, suffix = output_file.name.split(BATCH_ID_PLACEHOLDER)
+    shards = []
+    for path in output_file.parent.glob(f"{prefix}*{suffix}"):
+        batch_id = path.name[len(prefix):-len(suffix)]
+        if batch_id.isdigit():
+            shards.append((int(batch_id), path))
+    return [path for _, path in sorted(shards)]
+
+
+# Crawl settings shared by every runner, on top of the project's settings.py
+RUNNER_SETTINGS = {
+    # Full browser identity for every spider, not only the sites known to block bots
+    "USER_AGENT": BROWSER_UA,
+    "DEFAULT_REQUEST_HEADERS": BROWSER_HEADERS,
+    "ROTATE_USER_AGENT": ROTATE_USER_AGENT,
+    "DOWNLOADER_MIDDLEWARES": {
+        "event_scraping.middlewares.RotateUserAgentMiddleware": 400,
+    },
+    "ROBOTSTXT_OBEY": False,
+    "DOWNLOAD_DELAY": DOWNLOAD_DELAY,
+    "RANDOMIZE_DOWNLOAD_DELAY": 0.5,
+    "CONCURRENT_REQUESTS": CONCURRENT_REQUESTS,
+    "CONCURRENT_REQUESTS_PER_DOMAIN": CONCURRENT_REQUESTS_PER_DOMAIN,
+    "AUTOTHROTTLE_ENABLED": True,
+    "AUTOTHROTTLE_START_DELAY": 1,
+    "AUTOTHROTTLE_MAX_DELAY": 10,
+    "AUTOTHROTTLE_TARGET_CONCURRENCY": AUTOTHROTTLE_TARGET_CONCURRENCY,
+    "LOG_LEVEL": LOG_LEVEL,
+    "LOGSTATS_INTERVAL": LOGSTATS_INTERVAL,
+    **DNS_SETTINGS,
+    "SCHEDULER_PRIORITY_QUEUE": SCHEDULER_PRIORITY_QUEUE,
+    "DOWNLOAD_TIMEOUT": DOWNLOAD_TIMEOUT,
+    "TWISTED_REACTOR": TWISTED_REACTOR,
+    "COMPRESSION_ENABLED": COMPRESSION_ENABLED,
+    **(HTTP2_SETTINGS if USE_HTTP2 else {}),
+    **(HTTPCACHE_SETTINGS if USE_HTTPCACHE else {}),
+}
+
+
+def build_process_settings():
+    """Settings shared by every spider, without a feed.
+
+    Used on their own for a CrawlerProcess that runs several spiders (DNS cache,
+    thread pool, logging), where each spider's crawler adds its own feed.
+
+    Returns:
+        Settings: A copy of the project settings with the runner values set at
+            'project' priority, so a spider's custom_settings still override them
+    """
+    settings = _BASE_SETTINGS.copy()
+    settings.setdict(RUNNER_SETTINGS, priority="project")
+    return settings
+
+
+def build_feed():
+    """Feed options for a spider's output file."""
+    # JSON Lines, one item per line: written by the orjson exporter registered in
+    # FEED_EXPORTERS (settings.py) and read back line by line by insert_event.py
+    feed = {
+        "format": "jsonlines",
+        "encoding": "utf8",
+        "overwrite": True,
+        "batch_item_count": FEED_BATCH_ITEM_COUNT,
+    }
+    if PRETTY_JSON:
+        feed.update(format="json", indent=2)
+    return feed
+
+
+def build_settings(spider_name, output_file=None, **overrides):
+    """Build the crawl settings for one spider.
+
+    Args:
+        spider_name (str): Spider name, used for the default output file
+        output_file (Path, optional): Feed path. Defaults to get_output_file(spider_name)
+        **overrides: Settings that replace the shared values for this spider
+
+    Returns:
+        Settings: Project settings plus the shared runner settings, the feed and overrides
+    """
+    if output_file is None:
+        output_file = get_output_file(spider_name)
+
+    settings = build_process_settings()
+    settings.setdict({"FEEDS": {output_file: build_feed()}, **overrides}, priority="project")
+    return settings
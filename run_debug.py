@@ -13,6 +13,21 @@ from scrapy.crawler import CrawlerProcess
 # Add the project directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'event_scraping'))
 
+from runner_settings import HTTPCACHE_SETTINGS
+from event_scraping.spiders.fitness_training.runningcalendar_spider import RunningCalendarSpider
+
+HELP_TEXT = """Debugging Commands:
+  'c' - continue execution
+  'n' - next line
+  's' - step into function
+  'p variable_name' - print variable
+  'pp variable_name' - pretty print variable
+  'l' - show current code
+  'h' - help
+  'q' - quit debugging
+
+"""
+
 def run_spider_with_debug():
     """Run the spider with debugging enabled."""
     print("🚀 Starting Spider with Line-by-Line Debugging")
@@ -41,29 +56,21 @@ def run_spider_with_debug():
             }
         },
         'LOG_LEVEL': 'DEBUG',
+        # Replay responses from the local HTTP cache, so only the first debugging
+        # session waits on the network
+        **HTTPCACHE_SETTINGS,
     }
     
     # Create crawler process
     process = CrawlerProcess(settings)
     
-    # Import and run the spider
-    from event_scraping.spiders.fitness_training.runningcalendar_spider import RunningCalendarSpider
-    
+    # Run the spider
     print("Starting crawler...")
     process.crawl(RunningCalendarSpider)
     process.start()
 
 if __name__ == "__main__":
-    print("Debugging Commands:")
-    print("  'c' - continue execution")
-    print("  'n' - next line")
-    print("  's' - step into function")
-    print("  'p variable_name' - print variable")
-    print("  'pp variable_name' - pretty print variable")
-    print("  'l' - show current code")
-    print("  'h' - help")
-    print("  'q' - quit debugging")
-    print()
+    sys.stdout.write(HELP_TEXT)
     
     try:
         run_spider_with_debug()